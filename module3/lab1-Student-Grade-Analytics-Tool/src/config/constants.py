@@ -5,6 +5,9 @@ GRADE_THRESHOLDS = {
     'D': 60
 }
 
+# Read buffer for CSV ingestion
+CSV_BUFFER_SIZE = 1024 * 1024
+
 # Analytics settings
 DEFAULT_TOP_N = 5
 DEFAULT_WINDOW_SIZE = 3
@@ -0,0 +1,122 @@
+import heapq
+from collections import Counter, defaultdict, deque
+from typing import Any, Dict, Iterable, List, Protocol
+from src.models.entities import Student, TopPerformer
+from src.config.constants import DEFAULT_WINDOW_SIZE
+
+
+class ReportAccumulator(Protocol):
+    """One report metric, built up a student at a time."""
+
+    def add(self, student: Student, scores: List[float], categories: List[str]) -> None:
+        """Takes one student with their course scores and category letters in course order."""
+        ...
+
+    def result(self) -> Any:
+        ...
+
+
+class CategoryCounter:
+    """Counts category letters in first-appearance order; subclasses define ``result``."""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+
+    def add(self, student: Student, scores: List[float], categories: List[str]) -> None:
+        self.counts.update(categories)
+
+
+class GradeDistributionAccumulator(CategoryCounter):
+    def result(self) -> Dict[str, int]:
+        return dict(self.counts)
+
+
+class ModeAccumulator(CategoryCounter):
+    """Most common category; not in the standard report, available to ``ReportService.register``."""
+
+    def result(self) -> str:
+        if not self.counts:
+            return "N/A"
+        return self.counts.most_common(1)[0][0]
+
+
+class MajorGroupingAccumulator:
+    def __init__(self):
+        self.major_map: Dict[str, List[str]] = defaultdict(list)
+
+    def add(self, student: Student, scores: List[float], categories: List[str]) -> None:
+        self.major_map[student.major].append(student.name)
+
+    def result(self) -> Dict[str, List[str]]:
+        return dict(self.major_map)
+
+
+class TopPerformersAccumulator:
+    """Keeps only the best ``n`` averages in a heap; ties keep the earlier student."""
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.heap: List[tuple] = []
+        self.seen = 0
+
+    def add(self, student: Student, scores: List[float], categories: List[str]) -> None:
+        average = round(sum(scores) / len(scores), 2) if scores else 0.0
+        entry = (average, -self.seen, student.name)
+        self.seen += 1
+        if len(self.heap) < self.n:
+            heapq.heappush(self.heap, entry)
+        elif self.n:
+            heapq.heappushpop(self.heap, entry)
+
+    def result(self) -> List[Dict[str, Any]]:
+        return [
+            TopPerformer(name=name, average_score=average)._asdict()
+            for average, _, name in sorted(self.heap, reverse=True)
+        ]
+
+
+class OverallAverageAccumulator:
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, student: Student, scores: List[float], categories: List[str]) -> None:
+        self.total += sum(scores)
+        self.count += len(scores)
+
+    def result(self) -> float:
+        return round(self.total / self.count, 2) if self.count else 0.0
+
+
+class RollingAverageAccumulator:
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE):
+        self.window_size = window_size
+        self.rolling_avgs: Dict[str, List[float]] = {}
+
+    def add(self, student: Student, scores: List[float], categories: List[str]) -> None:
+        if not scores:
+            return
+        dq: deque[float] = deque(maxlen=self.window_size)
+        student_rolling = []
+        for score in scores:
+            dq.append(score)
+            student_rolling.append(round(sum(dq) / len(dq), 2))
+        self.rolling_avgs[student.name] = student_rolling
+
+    def result(self) -> Dict[str, List[float]]:
+        return self.rolling_avgs
+
+
+def aggregate(students: Iterable[Student], accumulators: Dict[str, ReportAccumulator]) -> Dict[str, Any]:
+    """Feeds every accumulator in a single pass over students and their courses."""
+    targets = list(accumulators.values())
+    for student in students:
+        scores = []
+        categories = []
+        for course in student.courses:
+            grade = course.grade
+            scores.append(grade.score)
+            categories.append(grade.category.value)
+        for accumulator in targets:
+            accumulator.add(student, scores, categories)
+    return {key: accumulator.result() for key, accumulator in accumulators.items()}
@@ -0,0 +1,194 @@
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+from src.models.entities import Student, Course, Grade, TopPerformer
+from src.models.enums import GradeCategory
+from src.models.schemas import GradeAnalyticsReport
+from src.config.constants import DEFAULT_WINDOW_SIZE
+
+# Category codes stored in GradeTable.category_codes index into this tuple
+CATEGORIES = tuple(GradeCategory)
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+
+
+class GradeTable:
+    """
+    Column-oriented store of students and their grades.
+
+    Each grade is one row across four packed arrays (student row, course
+    code, score, category code) instead of a Course and a Grade object.
+    Course names are stored once and referenced by code.
+    """
+
+    def __init__(self) -> None:
+        # Per-student columns, indexed by student row
+        self.student_ids: List[str] = []
+        self.names: List[str] = []
+        self.majors: List[str] = []
+        self.years = array('H')
+        self.active = array('b')
+        # Per-grade columns, indexed by grade row
+        self.student_rows = array('I')
+        self.course_codes = array('I')
+        self.scores = array('d')
+        self.category_codes = array('B')
+        self.course_names: List[str] = []
+        self._course_lookup: Dict[str, int] = {}
+        self._student_lookup: Dict[str, int] = {}
+
+    def add_student(self, student_id: str, name: str, major: str, year: int, is_active: bool = True) -> int:
+        """Adds a student if new and returns their row."""
+        row = self._student_lookup.get(student_id)
+        if row is None:
+            row = self._student_lookup[student_id] = self._append_student(student_id, name, major, year, is_active)
+        return row
+
+    def _append_student(self, student_id: str, name: str, major: str, year: int, is_active: bool) -> int:
+        row = len(self.student_ids)
+        self.student_ids.append(student_id)
+        self.names.append(name)
+        self.majors.append(major)
+        self.years.append(year)
+        self.active.append(is_active)
+        return row
+
+    def course_code(self, course_name: str) -> int:
+        """Returns the code for a course name, assigning one if new."""
+        code = self._course_lookup.get(course_name)
+        if code is None:
+            code = self._course_lookup[course_name] = len(self.course_names)
+            self.course_names.append(course_name)
+        return code
+
+    def add_grade(self, student_row: int, course_name: str, score: float, category: GradeCategory):
+        self.student_rows.append(student_row)
+        self.course_codes.append(self.course_code(course_name))
+        self.scores.append(score)
+        self.category_codes.append(CATEGORY_CODES[category])
+
+    @classmethod
+    def from_students(cls, students: Iterable[Student]) -> "GradeTable":
+        """One student row per Student, even if a student_id repeats, as ReportService counts them."""
+        table = cls()
+        for student in students:
+            row = table._append_student(student.student_id, student.name, student.major, student.year, student.is_active)
+            table._student_lookup.setdefault(student.student_id, row)
+            for course in student.courses:
+                table.add_grade(row, course.course_name, course.grade.score, course.grade.category)
+        return table
+
+    def to_students(self) -> List[Student]:
+        """Rebuilds the Student/Course/Grade object graph."""
+        students = [
+            Student(student_id=s_id, name=name, major=major, year=year, is_active=bool(active))
+            for s_id, name, major, year, active in zip(
+                self.student_ids, self.names, self.majors, self.years, self.active
+            )
+        ]
+        for row, code, score, category in zip(self.student_rows, self.course_codes, self.scores, self.category_codes):
+            students[row].courses.append(Course(self.course_names[code], Grade(score, CATEGORIES[category])))
+        return students
+
+    @property
+    def student_count(self) -> int:
+        return len(self.student_ids)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+
+class ColumnarReportService:
+    """
+    Computes the analytics report from a GradeTable.
+
+    Per-student sums, counts and rolling averages and per-category counts
+    are all grouped in a single pass over the grade rows. Results match ReportService on the table's students in
+    row order, each with their grades in table order; for a CSV, that is
+    read_grade_table against read_students_csv.
+    """
+
+    def __init__(self, table: GradeTable, window_size: int = DEFAULT_WINDOW_SIZE):
+        self.table = table
+        self.window_size = window_size
+        self._grouped = False
+        self._sums: List[float] = []
+        self._counts: List[int] = []
+        self._rolling: Dict[int, List[float]] = {}
+        self._category_counts: List[int] = []
+        # Category code -> (student row, grade row) of its first appearance
+        self._first_seen: Dict[int, Tuple[int, int]] = {}
+
+    def _group_by_student(self) -> None:
+        """One pass over the grade rows: per-student totals and rolling averages, per-category counts."""
+        if self._grouped:
+            return
+        n = self.table.student_count
+        sums = [0.0] * n
+        counts = [0] * n
+        windows: Dict[int, deque] = {}
+        rolling: Dict[int, List[float]] = {}
+        category_counts = [0] * len(CATEGORIES)
+        first_seen: Dict[int, Tuple[int, int]] = {}
+        rows = zip(self.table.student_rows, self.table.scores, self.table.category_codes)
+        for index, (row, score, code) in enumerate(rows):
+            sums[row] += score
+            counts[row] += 1
+            window = windows.get(row)
+            if window is None:
+                window = windows[row] = deque(maxlen=self.window_size)
+                rolling[row] = []
+            window.append(score)
+            rolling[row].append(round(sum(window) / len(window), 2))
+            category_counts[code] += 1
+            # Student by student, as ReportService sees them, even if rows are not contiguous
+            seen = first_seen.get(code)
+            if seen is None or row < seen[0]:
+                first_seen[code] = (row, index)
+        self._sums, self._counts, self._rolling = sums, counts, rolling
+        self._category_counts, self._first_seen = category_counts, first_seen
+        self._grouped = True
+
+    def calculate_grade_distribution(self) -> Dict[str, int]:
+        self._group_by_student()
+        # Same key order as Counter over the students: first appearance
+        present = sorted(self._first_seen, key=self._first_seen.__getitem__)
+        return {CATEGORIES[code].value: self._category_counts[code] for code in present}
+
+    def calculate_mode(self) -> str:
+        distribution = self.calculate_grade_distribution()
+        if not distribution:
+            return "N/A"
+        return max(distribution, key=distribution.__getitem__)
+
+    def group_by_major(self) -> Dict[str, List[str]]:
+        major_map: Dict[str, List[str]] = {}
+        for major, name in zip(self.table.majors, self.table.names):
+            major_map.setdefault(major, []).append(name)
+        return major_map
+
+    def get_top_performers(self, n: int = 3) -> List[TopPerformer]:
+        self._group_by_student()
+        averages = [
+            TopPerformer(name=name, average_score=round(total / count, 2) if count else 0.0)
+            for name, total, count in zip(self.table.names, self._sums, self._counts)
+        ]
+        return sorted(averages, key=lambda x: x.average_score, reverse=True)[:n]
+
+    def calculate_overall_average(self) -> float:
+        self._group_by_student()
+        count = sum(self._counts)
+        return round(sum(self._sums) / count, 2) if count else 0.0
+
+    def calculate_rolling_averages(self) -> Dict[str, List[float]]:
+        self._group_by_student()
+        return {self.table.names[row]: averages for row, averages in sorted(self._rolling.items())}
+
+    def generate_full_report(self) -> GradeAnalyticsReport:
+        return GradeAnalyticsReport(
+            total_students=self.table.student_count,
+            grade_distribution=self.calculate_grade_distribution(),
+            major_grouping=self.group_by_major(),
+            top_performers=[tp._asdict() for tp in self.get_top_performers()],
+            overall_average=self.calculate_overall_average(),
+            rolling_averages=self.calculate_rolling_averages()
+        )
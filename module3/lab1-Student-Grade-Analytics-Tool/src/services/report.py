@@ -1,24 +1,58 @@
-from typing import List
+from typing import Any, Callable, Dict, List
 from src.models.entities import Student
 from src.models.schemas import GradeAnalyticsReport
-from src.services.distribution import DistributionService
-from src.services.ranking import RankingService
-from src.services.trend import TrendService
+from src.services.aggregators import (
+    GradeDistributionAccumulator,
+    MajorGroupingAccumulator,
+    OverallAverageAccumulator,
+    ReportAccumulator,
+    RollingAverageAccumulator,
+    TopPerformersAccumulator,
+    aggregate,
+)
+from src.services.columnar import ColumnarReportService, GradeTable
+
+# Report key -> factory for the accumulator that computes it, in report order
+DEFAULT_ACCUMULATORS: Dict[str, Callable[[], ReportAccumulator]] = {
+    "grade_distribution": GradeDistributionAccumulator,
+    "major_grouping": MajorGroupingAccumulator,
+    "top_performers": TopPerformersAccumulator,
+    "overall_average": OverallAverageAccumulator,
+    "rolling_averages": RollingAverageAccumulator,
+}
 
 class ReportService:
     def __init__(self, students: List[Student]):
         self.students = students
+        self.accumulators: Dict[str, Callable[[], ReportAccumulator]] = dict(DEFAULT_ACCUMULATORS)
+
+    def register(self, key: str, factory: Callable[[], ReportAccumulator]):
+        """
+        Adds (or replaces) a metric computed during the shared pass.
+
+        New keys are returned by compute_metrics(); generate_full_report()
+        only ever holds the GradeAnalyticsReport keys.
+        """
+        self.accumulators[key] = factory
+
+    def compute_metrics(self) -> Dict[str, Any]:
+        """Computes every registered metric in one pass over the students."""
+        accumulators = {key: factory() for key, factory in self.accumulators.items()}
+        return aggregate(self.students, accumulators)
 
     def generate_full_report(self) -> GradeAnalyticsReport:
-        """Assembles all data using GradeAnalyticsReport TypedDict."""
-        ranking_service = RankingService(self.students)
-        
-        # Use the TypedDict constructor for clear type safety and Mypy compliance
+        """Assembles the standard metrics, all from one pass, into GradeAnalyticsReport."""
+        metrics = self.compute_metrics()
         return GradeAnalyticsReport(
             total_students=len(self.students),
-            grade_distribution=DistributionService.calculate_grade_distribution(self.students),
-            major_grouping=DistributionService.group_by_major(self.students),
-            top_performers=[tp._asdict() for tp in ranking_service.get_top_performers()],
-            overall_average=RankingService.calculate_overall_average(self.students),
-            rolling_averages=TrendService.calculate_rolling_averages(self.students)
+            grade_distribution=metrics["grade_distribution"],
+            major_grouping=metrics["major_grouping"],
+            top_performers=metrics["top_performers"],
+            overall_average=metrics["overall_average"],
+            rolling_averages=metrics["rolling_averages"]
         )
+
+    @staticmethod
+    def generate_columnar_report(table: GradeTable) -> GradeAnalyticsReport:
+        """Same report computed from columnar arrays, for large grade exports."""
+        return ColumnarReportService(table).generate_full_report()
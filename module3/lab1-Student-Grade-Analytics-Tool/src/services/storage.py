@@ -1,53 +1,119 @@
 import csv
 import json
+import sys
+from bisect import bisect_right
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Union
+from typing import Iterator, List, Dict, Tuple, Union
 from src.models.entities import Student, Course, Grade
 from src.models.enums import GradeCategory
-from src.config.constants import GRADE_THRESHOLDS
+from src.config.constants import CSV_BUFFER_SIZE, GRADE_THRESHOLDS
+from src.services.columnar import GradeTable
+
+CSV_COLUMNS = ('student_id', 'name', 'major', 'year', 'course_name', 'grade')
+
+# Ascending score bounds and the category at or above each one, for bisect
+_THRESHOLD_BOUNDS = sorted((score, GradeCategory(letter)) for letter, score in GRADE_THRESHOLDS.items())
+_BOUNDS = [score for score, _ in _THRESHOLD_BOUNDS]
+_CATEGORIES = [GradeCategory.FAIL] + [category for _, category in _THRESHOLD_BOUNDS]
+
+
+def classify_score(score: float) -> GradeCategory:
+    """Maps a score to its category with one bisect over GRADE_THRESHOLDS."""
+    return _CATEGORIES[bisect_right(_BOUNDS, score)]
+
 
 class StorageService:
     @staticmethod
-    def read_students_csv(file_path: Union[str, Path]) -> List[Student]:
-        students = {}
-        path = Path(file_path)
-        
+    @contextmanager
+    def _open_rows(path: Path) -> Iterator[Tuple[Iterator[List[str]], Tuple[int, ...]]]:
+        """Opens the CSV with a large read buffer and maps CSV_COLUMNS to indices."""
         if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+            raise FileNotFoundError(f"File not found: {path}")
+        with open(path, mode='r', encoding='utf-8', newline='', buffering=CSV_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            missing = [column for column in CSV_COLUMNS if column not in header]
+            if missing:
+                raise ValueError(f"Missing columns in {path}: {', '.join(missing)}")
+            yield reader, tuple(header.index(column) for column in CSV_COLUMNS)
+
+    @staticmethod
+    def iter_students_csv(file_path: Union[str, Path]) -> Iterator[Student]:
+        """
+        Yields students one at a time as their rows are read.
 
-        with open(path, mode='r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        A student is yielded when the next row belongs to someone else, so rows
+        are expected to be grouped by student (a student whose rows are split
+        up is yielded once per group). Repeated strings are interned and
+        identical Grade/Course values share one object.
+        """
+        grades: Dict[float, Grade] = {}
+        courses: Dict[Tuple[str, float], Course] = {}
+        intern = sys.intern
+        student = None
+        with StorageService._open_rows(Path(file_path)) as (reader, indices):
+            id_col, name_col, major_col, year_col, course_col, grade_col = indices
             for row in reader:
-                s_id = row['student_id']
-                if s_id not in students:
-                    students[s_id] = Student(
+                if not row:
+                    continue
+                s_id = row[id_col]
+                if student is None or s_id != student.student_id:
+                    if student is not None:
+                        yield student
+                    student = Student(
                         student_id=s_id,
-                        name=row['name'],
-                        major=row['major'],
-                        year=int(row['year'])
+                        name=row[name_col],
+                        major=intern(row[major_col]),
+                        year=int(row[year_col])
                     )
-                
-                # 5. Create Grade object and add to course
-                score = float(row['grade'])
-                
-                # Inline grading logic to keep GradeCategory simple
-                if score >= GRADE_THRESHOLDS.get("A", 90):
-                    cat = GradeCategory.EXCELLENT
-                elif score >= GRADE_THRESHOLDS.get("B", 80):
-                    cat = GradeCategory.GOOD
-                elif score >= GRADE_THRESHOLDS.get("C", 70):
-                    cat = GradeCategory.AVERAGE
-                elif score >= GRADE_THRESHOLDS.get("D", 60):
-                    cat = GradeCategory.PASS
-                else:
-                    cat = GradeCategory.FAIL
-
-                grade_obj = Grade(score=score, category=cat)
-                course = Course(course_name=row['course_name'], grade=grade_obj)
-                students[s_id].courses.append(course)
-        
+
+                score = float(row[grade_col])
+                course_name = row[course_col]
+                course = courses.get((course_name, score))
+                if course is None:
+                    grade = grades.get(score)
+                    if grade is None:
+                        grade = grades[score] = Grade(score=score, category=classify_score(score))
+                    course = courses[(course_name, score)] = Course(course_name=intern(course_name), grade=grade)
+                student.courses.append(course)
+        if student is not None:
+            yield student
+
+    @staticmethod
+    def read_students_csv(file_path: Union[str, Path]) -> List[Student]:
+        students: Dict[str, Student] = {}
+        for student in StorageService.iter_students_csv(file_path):
+            existing = students.get(student.student_id)
+            if existing is None:
+                students[student.student_id] = student
+            else:
+                existing.courses.extend(student.courses)
         return list(students.values())
 
+    @staticmethod
+    def read_grade_table(file_path: Union[str, Path]) -> GradeTable:
+        """Loads the CSV straight into columnar form, without per-grade objects."""
+        table = GradeTable()
+        categories: Dict[float, GradeCategory] = {}
+        intern = sys.intern
+        last_id, last_row = None, 0
+        with StorageService._open_rows(Path(file_path)) as (reader, indices):
+            id_col, name_col, major_col, year_col, course_col, grade_col = indices
+            for row in reader:
+                if not row:
+                    continue
+                s_id = row[id_col]
+                if s_id != last_id:
+                    last_id = s_id
+                    last_row = table.add_student(s_id, row[name_col], intern(row[major_col]), int(row[year_col]))
+                score = float(row[grade_col])
+                category = categories.get(score)
+                if category is None:
+                    category = categories[score] = classify_score(score)
+                table.add_grade(last_row, row[course_col], score, category)
+        return table
+
     @staticmethod
     def write_json_report(report_data: Dict, file_path: Union[str, Path]):
         path = Path(file_path)
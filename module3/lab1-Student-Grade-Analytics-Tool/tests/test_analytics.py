@@ -3,6 +3,11 @@ from src.models.enums import GradeCategory
 from src.services.distribution import DistributionService
 from src.services.ranking import RankingService
 from src.services.trend import TrendService
+from src.services.columnar import ColumnarReportService, GradeTable
+from src.services.report import ReportService
+from src.services.aggregators import ModeAccumulator, TopPerformersAccumulator, aggregate
+from src.services.storage import StorageService, classify_score
+from pathlib import Path
 import pytest
 
 @pytest.fixture
@@ -46,3 +51,112 @@ def test_rolling_average(sample_students):
     rolling = TrendService.calculate_rolling_averages(sample_students, window_size=2)
     # Alice: [95, 85] -> [95, 90]
     assert rolling['Alice'] == [95.0, 90.0]
+
+def test_grade_table_round_trip(sample_students):
+    table = GradeTable.from_students(sample_students)
+    assert len(table) == 3
+    assert table.student_count == 2
+    assert table.course_names == ["Python", "Algorithms", "Calc"]
+    assert table.to_students() == sample_students
+
+def test_columnar_report_matches_object_report(sample_students):
+    csv_students = StorageService.read_students_csv(Path(__file__).parent.parent / "data" / "students.csv")
+    for students in (sample_students, csv_students):
+        expected = ReportService(students).generate_full_report()
+        table = GradeTable.from_students(students)
+        assert ReportService.generate_columnar_report(table) == expected
+        assert ColumnarReportService(table).calculate_mode() == DistributionService.calculate_mode(students)
+
+def test_columnar_report_non_contiguous_csv(tmp_path):
+    path = tmp_path / "students.csv"
+    path.write_text(
+        "student_id,name,major,year,course_name,grade\n"
+        "1,Alice,CS,2,Python,95\n"
+        "2,Bob,Math,1,Calc,50\n"
+        "1,Alice,CS,2,Algorithms,85\n"
+        "2,Bob,Math,1,Stats,40\n"
+        "1,Alice,CS,2,Networks,82\n",
+        encoding="utf-8"
+    )
+    students = StorageService.read_students_csv(path)
+    expected = ReportService(students).generate_full_report()
+    table = StorageService.read_grade_table(path)
+    report = ReportService.generate_columnar_report(table)
+    assert report == expected
+    assert list(report["grade_distribution"]) == list(expected["grade_distribution"]) == ["A", "B", "F"]
+    assert ColumnarReportService(table).calculate_mode() == DistributionService.calculate_mode(students) == "B"
+
+def test_grade_table_keeps_repeated_student_ids(sample_students):
+    students = sample_students + [Student(student_id="1", name="Alice", major="CS", year=2)]
+    table = GradeTable.from_students(students)
+    assert table.student_count == 3
+    assert ReportService.generate_columnar_report(table) == ReportService(students).generate_full_report()
+
+def test_columnar_report_empty():
+    report = ColumnarReportService(GradeTable()).generate_full_report()
+    assert report["overall_average"] == 0.0
+    assert report["grade_distribution"] == {}
+
+def test_classify_score_thresholds():
+    assert classify_score(90) == GradeCategory.EXCELLENT
+    assert classify_score(89.99) == GradeCategory.GOOD
+    assert classify_score(70) == GradeCategory.AVERAGE
+    assert classify_score(60) == GradeCategory.PASS
+    assert classify_score(59.5) == GradeCategory.FAIL
+
+def test_streaming_csv_ingestion(tmp_path):
+    path = tmp_path / "students.csv"
+    path.write_text(
+        "grade,student_id,name,major,year,course_name\n"
+        "95,1,Alice,CS,2,Python\n"
+        "75,2,Bob,Math,1,Calc\n"
+        "85,1,Alice,CS,2,Algorithms\n",
+        encoding="utf-8"
+    )
+    streamed = list(StorageService.iter_students_csv(path))
+    assert [s.name for s in streamed] == ["Alice", "Bob", "Alice"]
+
+    students = StorageService.read_students_csv(path)
+    assert [s.name for s in students] == ["Alice", "Bob"]
+    assert [c.grade.category for c in students[0].courses] == [GradeCategory.EXCELLENT, GradeCategory.GOOD]
+    assert StorageService.read_grade_table(path).to_students() == students
+
+def test_csv_missing_columns(tmp_path):
+    path = tmp_path / "students.csv"
+    path.write_text("student_id,name\n1,Alice\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        StorageService.read_students_csv(path)
+
+def test_fused_report_matches_services(sample_students):
+    report = ReportService(sample_students).generate_full_report()
+    assert report["grade_distribution"] == DistributionService.calculate_grade_distribution(sample_students)
+    assert report["major_grouping"] == DistributionService.group_by_major(sample_students)
+    assert report["top_performers"] == [tp._asdict() for tp in RankingService(sample_students).get_top_performers()]
+    assert report["overall_average"] == RankingService.calculate_overall_average(sample_students)
+    assert report["rolling_averages"] == TrendService.calculate_rolling_averages(sample_students)
+
+def test_top_performers_accumulator_ties():
+    students = [
+        Student(student_id=str(i), name=f"S{i}", major="CS", year=1, courses=[Course("X", Grade(score, GradeCategory.GOOD))])
+        for i, score in enumerate([80, 90, 80, 90, 70])
+    ]
+    expected = [tp._asdict() for tp in RankingService(students).get_top_performers(n=3)]
+    assert aggregate(students, {"top": TopPerformersAccumulator(n=3)})["top"] == expected
+
+def test_register_custom_accumulator(sample_students):
+    class CourseCount:
+        def __init__(self):
+            self.total = 0
+        def add(self, student, scores, categories):
+            self.total += len(scores)
+        def result(self):
+            return self.total
+
+    service = ReportService(sample_students)
+    service.register("course_count", CourseCount)
+    service.register("grade_mode", ModeAccumulator)
+    assert service.compute_metrics()["course_count"] == 3
+    metrics = service.compute_metrics()
+    assert metrics["course_count"] == 3
+    assert metrics["grade_mode"] == DistributionService.calculate_mode(sample_students)
+    assert "course_count" not in service.generate_full_report()
@@ -0,0 +1,12 @@
+"""Offline, reproducible benchmarks against a local synthetic site."""
+
+from .server import SiteConfig, SyntheticServer
+from .harness import BenchmarkResult, run_suite, write_report
+
+__all__ = [
+    'SiteConfig',
+    'SyntheticServer',
+    'BenchmarkResult',
+    'run_suite',
+    'write_report',
+]
@@ -0,0 +1,273 @@
+"""
+Run every scraper engine against the synthetic site and report results.
+
+Usage:
+    python -m src.bench --urls 100 1000 --concurrency 10 50 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import multiprocessing
+import os
+import time
+from dataclasses import asdict, dataclass
+from itertools import product
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, Sequence
+from ..metrics import LatencyHistogram
+from ..models import PageMetadata
+from ..scrapers import scrape_async, scrape_multiprocess, scrape_sequential, scrape_threaded
+from ..utils import RetryPolicy
+from .server import SiteConfig, SyntheticServer, default_host_count
+
+resource: Optional[ModuleType]
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+ENGINES = ("sequential", "threaded", "async", "multiprocess")
+DEFAULT_URL_COUNTS = (100, 1000)
+DEFAULT_CONCURRENCY = (10, 50)
+# The sequential and threaded engines make one attempt per URL; the async
+# engines would otherwise retry error pages and do extra work
+SINGLE_ATTEMPT = RetryPolicy(max_attempts=1)
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements from one engine run."""
+    engine: str
+    url_count: int
+    concurrency: int
+    elapsed: float
+    throughput: float
+    successes: int
+    errors: int
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    peak_rss_kb: Optional[int]
+
+
+def _peak_rss_kb() -> Optional[int]:
+    """Peak RSS of this process or its largest child, in KiB (Linux units)."""
+    if resource is None:
+        return None
+    return max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+
+
+def _run_engine(engine: str, urls: list[str], concurrency: int) -> list[PageMetadata]:
+    if engine == "sequential":
+        return scrape_sequential(urls)
+    if engine == "threaded":
+        return scrape_threaded(urls, max_workers=concurrency)
+    if engine == "async":
+        return asyncio.run(
+            scrape_async(
+                urls, max_concurrent=concurrency, per_host_limit=concurrency,
+                retry_policy=SINGLE_ATTEMPT
+            )
+        )
+    if engine == "multiprocess":
+        processes = min(os.cpu_count() or 1, concurrency)
+        per_process = max(1, concurrency // processes)
+        return scrape_multiprocess(
+            urls, processes=processes, max_concurrent=per_process, per_host_limit=per_process,
+            retry_policy=SINGLE_ATTEMPT
+        )
+    raise ValueError(f"Unknown engine {engine!r}; choose from {', '.join(ENGINES)}")
+
+
+def run_case(engine: str, urls: list[str], concurrency: int) -> BenchmarkResult:
+    """
+    Run one engine over ``urls`` in the current process and measure it.
+
+    Latency percentiles come from each result's ``fetch_time`` so every
+    engine is measured the same way, and no engine retries failed pages.
+
+    Args:
+        engine: One of ``ENGINES``
+        urls: URLs to scrape
+        concurrency: Workers/concurrent requests (ignored by ``sequential``)
+
+    Returns:
+        BenchmarkResult for the run
+    """
+    start = time.perf_counter()
+    results = _run_engine(engine, urls, concurrency)
+    elapsed = time.perf_counter() - start
+
+    latency = LatencyHistogram()
+    successes = 0
+    for result in results:
+        latency.record(result.fetch_time)
+        if result.status_code == 200:
+            successes += 1
+
+    return BenchmarkResult(
+        engine=engine,
+        url_count=len(urls),
+        concurrency=1 if engine == "sequential" else concurrency,
+        elapsed=elapsed,
+        throughput=len(urls) / elapsed if elapsed else 0.0,
+        successes=successes,
+        errors=len(results) - successes,
+        latency_p50=latency.percentile(0.50),
+        latency_p95=latency.percentile(0.95),
+        latency_p99=latency.percentile(0.99),
+        peak_rss_kb=_peak_rss_kb(),
+    )
+
+
+def _child_main(connection, engine: str, urls: list[str], concurrency: int) -> None:
+    try:
+        connection.send(("ok", run_case(engine, urls, concurrency)))
+    except Exception as e:
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def run_case_isolated(engine: str, urls: list[str], concurrency: int) -> BenchmarkResult:
+    """
+    Run ``run_case`` in a fresh spawned process.
+
+    Each run starts from a clean interpreter, so peak RSS and warm-up
+    effects are not carried over from earlier runs.
+
+    Raises:
+        RuntimeError: If the run fails or the process dies
+    """
+    context = multiprocessing.get_context("spawn")
+    parent, child = context.Pipe(duplex=False)
+    process = context.Process(target=_child_main, args=(child, engine, urls, concurrency))
+    process.start()
+    child.close()
+    try:
+        status, payload = parent.recv()
+    except EOFError:
+        status, payload = "error", f"process exited with code {process.exitcode}"
+    finally:
+        process.join()
+    if status != "ok":
+        raise RuntimeError(f"Benchmark {engine} ({len(urls)} URLs) failed: {payload}")
+    return payload
+
+
+def run_suite(
+    engines: Sequence[str] = ENGINES,
+    url_counts: Sequence[int] = DEFAULT_URL_COUNTS,
+    concurrency_levels: Sequence[int] = DEFAULT_CONCURRENCY,
+    config: Optional[SiteConfig] = None,
+    isolate: bool = True
+) -> list[BenchmarkResult]:
+    """
+    Benchmark each engine at each URL count and concurrency level.
+
+    The sequential engine runs once per URL count since it has no
+    concurrency setting.
+
+    Args:
+        engines: Engine names to run
+        url_counts: Numbers of URLs per run
+        concurrency_levels: Concurrency settings to try
+        config: Synthetic site configuration
+        isolate: Run each case in its own process (recommended)
+
+    Returns:
+        List of BenchmarkResult objects in run order
+    """
+    runner = run_case_isolated if isolate else run_case
+    results = []
+    with SyntheticServer(config) as server:
+        for engine, url_count in product(engines, url_counts):
+            levels = concurrency_levels[:1] if engine == "sequential" else concurrency_levels
+            for concurrency in levels:
+                results.append(runner(engine, server.urls(url_count), concurrency))
+    return results
+
+
+def write_report(
+    results: list[BenchmarkResult],
+    path: str | Path,
+    config: Optional[SiteConfig] = None
+) -> Path:
+    """
+    Write results as JSON or CSV, chosen by the file extension.
+
+    The JSON report also records the site configuration so runs can be
+    reproduced and compared.
+
+    Returns:
+        Path of the written report
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = [asdict(result) for result in results]
+
+    if path.suffix == ".csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(BenchmarkResult.__dataclass_fields__))
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        report = {
+            "site": asdict(config) if config else None,
+            "cpu_count": os.cpu_count(),
+            "results": rows,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return path
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    """Print results as a table."""
+    print(
+        f"{'Engine':<13}{'URLs':>7}{'Conc':>6}{'Time (s)':>10}{'URL/s':>9}"
+        f"{'Errors':>8}{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}{'RSS MiB':>9}"
+    )
+    for r in results:
+        rss = f"{r.peak_rss_kb / 1024:.0f}" if r.peak_rss_kb is not None else "-"
+        print(
+            f"{r.engine:<13}{r.url_count:>7}{r.concurrency:>6}{r.elapsed:>10.2f}"
+            f"{r.throughput:>9.1f}{r.errors:>8}{r.latency_p50 * 1000:>8.1f}"
+            f"{r.latency_p95 * 1000:>8.1f}{r.latency_p99 * 1000:>8.1f}{rss:>9}"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Offline scraper benchmark")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--urls", nargs="+", type=int, default=list(DEFAULT_URL_COUNTS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--page-size", type=int, default=SiteConfig.page_size)
+    parser.add_argument("--latency", type=float, default=SiteConfig.latency)
+    parser.add_argument("--error-rate", type=float, default=SiteConfig.error_rate)
+    parser.add_argument("--head-offset", type=int, default=SiteConfig.head_offset)
+    parser.add_argument("--hosts", type=int, default=default_host_count())
+    parser.add_argument("--compress", action="store_true", help="Serve gzip-compressed pages")
+    parser.add_argument("--seed", type=int, default=SiteConfig.seed)
+    parser.add_argument("--output", default="data/benchmark.json",
+                        help="Report path; .csv for CSV, anything else for JSON")
+    args = parser.parse_args(argv)
+
+    config = SiteConfig(
+        page_size=args.page_size,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        head_offset=args.head_offset,
+        hosts=args.hosts,
+        compress=args.compress,
+        seed=args.seed,
+    )
+    results = run_suite(args.engines, args.urls, args.concurrency, config)
+    print_results(results)
+    print(f"\nReport written to {write_report(results, args.output, config)}")
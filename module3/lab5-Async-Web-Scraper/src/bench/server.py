@@ -0,0 +1,165 @@
+"""Local HTTP server serving synthetic pages for benchmarks."""
+
+import asyncio
+import sys
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+from aiohttp import web
+
+
+def default_host_count() -> int:
+    """Loopback aliases (127.0.0.x) only work out of the box on Linux."""
+    return 4 if sys.platform.startswith("linux") else 1
+
+
+@dataclass
+class SiteConfig:
+    """
+    Shape of the synthetic site.
+
+    Args:
+        page_size: Approximate size of each page in bytes
+        latency: Delay before each response in seconds
+        error_rate: Fraction of pages (0-1) that return ``error_status``
+        error_status: Status code returned for failing pages
+        head_offset: Bytes of inline script inside ``<head>``, i.e. how far
+            into the page ``</head>`` appears
+        hosts: Number of loopback addresses (127.0.0.1, 127.0.0.2, ...)
+            to serve on, so host-aware engines see several hosts
+        compress: Compress pages for clients that send Accept-Encoding
+        charset: Charset declared in Content-Type, or None to declare none
+        seed: Seed that decides which pages fail
+    """
+    page_size: int = 50_000
+    latency: float = 0.05
+    error_rate: float = 0.0
+    error_status: int = 500
+    head_offset: int = 0
+    hosts: int = 1
+    compress: bool = False
+    charset: Optional[str] = "utf-8"
+    seed: int = 0
+
+    def is_error(self, page: int) -> bool:
+        """Deterministically decide whether ``page`` fails."""
+        if self.error_rate <= 0:
+            return False
+        return zlib.crc32(f"{self.seed}:{page}".encode()) % 10_000 < self.error_rate * 10_000
+
+
+def _build_body(config: SiteConfig) -> bytes:
+    """Shared page body; only the head differs per page."""
+    paragraph = (
+        "<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do "
+        "eiusmod tempor incididunt ut labore et dolore magna aliqua.</p>\n"
+    )
+    repeats = max(0, config.page_size - config.head_offset) // len(paragraph) + 1
+    return f"<body>\n{paragraph * repeats}</body></html>".encode()
+
+
+class SyntheticServer:
+    """
+    aiohttp server running in a background thread.
+
+    Page ``/page/<n>`` has title ``Page <n>`` and a meta description, an
+    optional padded head and a body of ``page_size`` bytes.
+
+    Usage:
+        with SyntheticServer(SiteConfig(latency=0.01)) as server:
+            urls = server.urls(1000)
+            results = scrape_threaded(urls)
+    """
+
+    def __init__(self, config: Optional[SiteConfig] = None, port: int = 0):
+        self.config = config or SiteConfig()
+        self.port = port
+        self._body = _build_body(self.config)
+        self._head_padding = (
+            f"<script>/*{'x' * self.config.head_offset}*/</script>"
+            if self.config.head_offset else ""
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def hosts(self) -> list[str]:
+        return [f"127.0.0.{i + 1}" for i in range(max(1, self.config.hosts))]
+
+    def urls(self, count: int) -> list[str]:
+        """Return ``count`` page URLs spread round-robin over the hosts."""
+        hosts = self.hosts
+        return [
+            f"http://{hosts[i % len(hosts)]}:{self.port}/page/{i}"
+            for i in range(count)
+        ]
+
+    async def _handle_page(self, request: web.Request) -> web.Response:
+        page = int(request.match_info["page"])
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        if self.config.is_error(page):
+            return web.Response(status=self.config.error_status)
+        head = (
+            f"<!DOCTYPE html><html><head><title>Page {page}</title>"
+            f'<meta name="description" content="Synthetic page {page}">'
+            f"{self._head_padding}</head>\n"
+        ).encode()
+        response = web.Response(body=head + self._body, content_type="text/html", charset=self.config.charset)
+        if self.config.compress:
+            response.enable_compression()
+        return response
+
+    async def _serve(self) -> None:
+        app = web.Application()
+        app.router.add_get("/page/{page:\\d+}", self._handle_page)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            for host in self.hosts:
+                site = web.TCPSite(runner, host, self.port)
+                await site.start()
+                if not self.port:
+                    self.port = runner.addresses[0][1]
+            self._stop = asyncio.Event()
+            self._ready.set()
+            await self._stop.wait()
+        finally:
+            await runner.cleanup()
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._serve())
+        except BaseException as e:
+            self._error = e
+            self._ready.set()
+        finally:
+            self._loop.close()
+
+    def start(self) -> "SyntheticServer":
+        """Start serving; returns once the server is accepting connections."""
+        self._thread = threading.Thread(target=self._run, name="synthetic-site", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise RuntimeError(f"Synthetic server failed to start: {self._error}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread to exit."""
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SyntheticServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
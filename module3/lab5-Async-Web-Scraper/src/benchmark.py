@@ -1,53 +1,148 @@
 import asyncio
+import os
 import time
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+from .checkpoint import CrawlCheckpoint
+from .metrics import MetricsCollector
 from .models import PageMetadata
-from .scraper import scrape_sequential, scrape_threaded, scrape_async
+from .progress import DEFAULT_PROGRESS_INTERVAL, CrawlProgress
+from .scraper import scrape_sequential, scrape_threaded, scrape_async, scrape_multiprocess
+from .scrapers import DnsCache
 from .output import print_summary
 
 
-def run_sequential_scraper(urls: List[str]) -> tuple[List[PageMetadata], float]:
+@contextmanager
+def track_progress(
+    metrics: MetricsCollector,
+    interval: Optional[float] = None,
+    metrics_port: Optional[int] = None
+) -> Iterator[Optional[CrawlProgress]]:
+    """
+    Report live progress for one scraper run, if requested.
+    
+    Args:
+        metrics: The run's request metrics, exposed on the endpoint
+        interval: Seconds between progress log lines
+        metrics_port: Serve Prometheus metrics on this local port
+    
+    Yields:
+        CrawlProgress to pass to the scraper, or None if neither option is set
+    """
+    if interval is None and metrics_port is None:
+        yield None
+        return
+    progress = CrawlProgress(interval=interval or DEFAULT_PROGRESS_INTERVAL, metrics=metrics)
+    try:
+        if interval is not None:
+            progress.start()
+        if metrics_port is not None:
+            progress.serve_metrics(metrics_port)
+        yield progress
+    finally:
+        progress.close()
+
+
+def run_sequential_scraper(
+    urls: List[str],
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    dns_cache: Optional[DnsCache] = None,
+    progress_interval: Optional[float] = None,
+    metrics_port: Optional[int] = None
+) -> tuple[List[PageMetadata], float]:
     """Run sequential scraper and return results with timing."""
     print("\n[*] Running Sequential Scraper...")
+    metrics = MetricsCollector()
     start = time.perf_counter()
-    results = scrape_sequential(urls)
+    with track_progress(metrics, progress_interval, metrics_port) as progress:
+        results = scrape_sequential(
+            urls, metrics=metrics, checkpoint=checkpoint, dns_cache=dns_cache,
+            progress=progress
+        )
     elapsed = time.perf_counter() - start
     print_summary(results, "Sequential", elapsed)
+    print(f"Metrics: {metrics.report()}")
     return results, elapsed
 
 
-def run_threaded_scraper(urls: List[str]) -> tuple[List[PageMetadata], float]:
+def run_threaded_scraper(
+    urls: List[str],
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    dns_cache: Optional[DnsCache] = None,
+    progress_interval: Optional[float] = None,
+    metrics_port: Optional[int] = None
+) -> tuple[List[PageMetadata], float]:
     """Run threaded scraper and return results with timing."""
     print("\n[*] Running Threaded Scraper...")
+    metrics = MetricsCollector()
     start = time.perf_counter()
-    results = scrape_threaded(urls, max_workers=10)
+    with track_progress(metrics, progress_interval, metrics_port) as progress:
+        results = scrape_threaded(
+            urls, max_workers=10, metrics=metrics, checkpoint=checkpoint, dns_cache=dns_cache,
+            progress=progress
+        )
     elapsed = time.perf_counter() - start
     print_summary(results, "Threaded", elapsed)
+    print(f"Metrics: {metrics.report()}")
     return results, elapsed
 
 
-def run_async_scraper(urls: List[str]) -> tuple[List[PageMetadata], float]:
+def run_async_scraper(
+    urls: List[str],
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    dns_cache: Optional[DnsCache] = None,
+    progress_interval: Optional[float] = None,
+    metrics_port: Optional[int] = None
+) -> tuple[List[PageMetadata], float]:
     """Run async scraper and return results with timing."""
     print("\n[*] Running Async Scraper...")
+    metrics = MetricsCollector()
     start = time.perf_counter()
-    results = asyncio.run(scrape_async(urls, max_concurrent=10))
+    with track_progress(metrics, progress_interval, metrics_port) as progress:
+        results = asyncio.run(scrape_async(
+            urls, max_concurrent=10, metrics=metrics, checkpoint=checkpoint, dns_cache=dns_cache,
+            progress=progress
+        ))
     elapsed = time.perf_counter() - start
     print_summary(results, "Async", elapsed)
+    print(f"Metrics: {metrics.report()}")
+    return results, elapsed
+
+
+def run_multiprocess_scraper(
+    urls: List[str],
+    processes: Optional[int] = None,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    dns_cache: Optional[DnsCache] = None
+) -> tuple[List[PageMetadata], float]:
+    """Run multi-process async scraper and return results with timing."""
+    processes = processes or os.cpu_count() or 1
+    print(f"\n[*] Running Multi-process Scraper ({processes} processes)...")
+    start = time.perf_counter()
+    results = scrape_multiprocess(
+        urls, processes=processes, max_concurrent=10, checkpoint=checkpoint, dns_cache=dns_cache
+    )
+    elapsed = time.perf_counter() - start
+    print_summary(results, "Multi-process", elapsed)
     return results, elapsed
 
 
 def print_performance_comparison(
     seq_time: float,
     thread_time: float,
-    async_time: float
+    async_time: float,
+    multiprocess_time: Optional[float] = None,
+    processes: Optional[int] = None
 ) -> None:
     """
-    Print performance comparison between all three methods.
+    Print performance comparison between all scraping methods.
     
     Args:
         seq_time: Sequential scraping time
         thread_time: Threaded scraping time
         async_time: Async scraping time
+        multiprocess_time: Multi-process async scraping time, if it was run
+        processes: Number of processes used by the multi-process scraper
     """
     print("\n" + "="*60)
     print("PERFORMANCE COMPARISON")
@@ -55,16 +150,20 @@ def print_performance_comparison(
     print(f"Sequential: {seq_time:.2f}s (baseline)")
     print(f"Threaded:   {thread_time:.2f}s ({seq_time/thread_time:.2f}x faster)")
     print(f"Async:      {async_time:.2f}s ({seq_time/async_time:.2f}x faster)")
+    if multiprocess_time is not None:
+        label = f"Multi-process ({processes} procs)" if processes else "Multi-process"
+        print(f"{label}: {multiprocess_time:.2f}s ({seq_time/multiprocess_time:.2f}x faster)")
     print("="*60)
     
     # Determine winner
-    fastest = min(seq_time, thread_time, async_time)
-    if fastest == async_time:
-        winner = "Async"
-    elif fastest == thread_time:
-        winner = "Threaded"
-    else:
-        winner = "Sequential"
+    timings = {
+        "Sequential": seq_time,
+        "Threaded": thread_time,
+        "Async": async_time,
+    }
+    if multiprocess_time is not None:
+        timings["Multi-process"] = multiprocess_time
+    winner = min(timings, key=timings.__getitem__)
     
     print(f"\n🏆 Winner: {winner} approach")
     print()
@@ -0,0 +1,184 @@
+"""On-disk HTTP conditional-request cache for repeated crawls."""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping, Optional, Union
+from .models import PageMetadata
+
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_TTL = 7 * 24 * 3600
+# Check the size bound every this many writes rather than on each one
+_EVICT_EVERY = 100
+
+
+@dataclass
+class CacheEntry:
+    """Validators and extracted metadata stored for one URL."""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    title: Optional[str]
+    description: Optional[str]
+    stored_at: float
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of ETag/Last-Modified validators and page metadata.
+
+    Before fetching a URL, ``conditional_headers()`` supplies
+    ``If-None-Match``/``If-Modified-Since``; on a ``304 Not Modified`` the
+    cached metadata is reused and the page is neither downloaded nor parsed.
+
+    Entries expire ``ttl`` seconds after they were stored or last
+    revalidated, and the least recently used entries are evicted once
+    ``max_entries`` is exceeded. The cache is safe to share between threads.
+
+    Usage:
+        with ResponseCache("data/http_cache.sqlite") as cache:
+            results = scrape_threaded(urls, cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                title TEXT,
+                description TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+        )
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Look up a URL, dropping the entry if it has expired.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            CacheEntry or None if not cached
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, etag, last_modified, title, description, stored_at "
+                "FROM responses WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            entry = CacheEntry(*row)
+            if self.ttl is not None and now - entry.stored_at > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url)
+            )
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> dict[str, str]:
+        """Build revalidation headers for a cached entry."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, url: str, headers: Mapping[str, str], metadata: PageMetadata) -> None:
+        """
+        Cache a 200 response's validators and extracted metadata.
+
+        Responses without an ETag or Last-Modified header cannot be
+        revalidated and are not stored.
+
+        Args:
+            url: Requested URL
+            headers: Response headers
+            metadata: Metadata extracted from the response
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, metadata.title, metadata.description, now, now)
+            )
+            self._writes += 1
+            if self._writes % _EVICT_EVERY == 0:
+                self._evict()
+
+    def revalidated(self, url: str, entry: CacheEntry, metadata: PageMetadata) -> None:
+        """
+        Apply a ``304 Not Modified`` response: reuse the cached metadata.
+
+        Args:
+            url: Requested URL
+            entry: Entry the conditional request was built from
+            metadata: Result object to fill in
+        """
+        metadata.title = entry.title
+        metadata.description = entry.description
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ? WHERE url = ?", (time.time(), url)
+            )
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries beyond ``max_entries``."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE url IN "
+                "(SELECT url FROM responses ORDER BY accessed_at LIMIT ?)",
+                (excess,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        """Enforce the size bound and close the database."""
+        with self._lock:
+            self._evict()
+            self._conn.close()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,126 @@
+"""Resumable crawl checkpoints backed by an append-only JSON Lines log."""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Union
+from .models import PageMetadata
+from .output import JsonLinesWriter, read_results_jsonl
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_FSYNC_EVERY = 100
+
+
+class CrawlCheckpoint:
+    """
+    Record completed URLs so an interrupted crawl can skip them on restart.
+
+    Every result is appended to a JSON Lines log as soon as it completes.
+    Opening an existing log loads it back, and URLs whose latest result
+    succeeded count as done; failed URLs are fetched again on resume. A
+    partial record left by a crash is dropped when the log is reopened;
+    a corrupt line elsewhere is skipped without losing the records after it.
+
+    Usage:
+        with CrawlCheckpoint("data/checkpoints/async.jsonl") as checkpoint:
+            results = await scrape_async(urls, checkpoint=checkpoint)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        fsync_every: Optional[int] = DEFAULT_CHECKPOINT_FSYNC_EVERY
+    ):
+        """
+        Args:
+            path: Log file path (``.gz``/``.zst`` compress it)
+            fsync_every: Flush and fsync the log after this many records
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._done: dict[str, PageMetadata] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            self._load()
+        self._writer = JsonLinesWriter(self.path, append=True, fsync_every=fsync_every)
+
+    def _load(self) -> None:
+        """Load completed results, rewriting the log if its tail is truncated."""
+        records = []
+        try:
+            # Only a torn final record raises; corrupt lines are skipped
+            for result in read_results_jsonl(self.path, strict=True, skip_invalid=True):
+                records.append(result)
+        except ValueError:
+            logger.warning(f"Dropping truncated record at end of {self.path}")
+            with JsonLinesWriter(self.path, fsync_every=None) as writer:
+                writer.write_many(records)
+
+        for result in records:
+            if result.error is None:
+                self._done[result.url] = result
+            else:
+                self._done.pop(result.url, None)
+        logger.info(f"Loaded {len(self._done)} completed URLs from {self.path}")
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def get(self, url: str) -> Optional[PageMetadata]:
+        """Return the recorded result for a completed URL, or None."""
+        return self._done.get(url)
+
+    def split(
+        self,
+        urls: Iterable[str]
+    ) -> tuple[list[Optional[PageMetadata]], list[tuple[int, str]]]:
+        """
+        Separate already-completed URLs from the remaining work.
+
+        Args:
+            urls: URLs of the crawl, in order
+
+        Returns:
+            ``(results, pending)``: a list with the recorded result for each
+            completed URL (None elsewhere), and ``(index, url)`` pairs still
+            to be fetched
+        """
+        results: list[Optional[PageMetadata]] = []
+        pending: list[tuple[int, str]] = []
+        for index, url in enumerate(urls):
+            result = self._done.get(url)
+            results.append(result)
+            if result is None:
+                pending.append((index, url))
+        return results, pending
+
+    def record(self, result: PageMetadata) -> None:
+        """Append a finished result to the log. Safe to call from any thread."""
+        with self._lock:
+            self._writer.write(result)
+            if result.error is None:
+                self._done[result.url] = result
+
+    def clear(self) -> None:
+        """Forget every recorded result and truncate the log."""
+        with self._lock:
+            self._writer.close()
+            self._done.clear()
+            self._writer = JsonLinesWriter(
+                self.path, fsync_every=self._writer.fsync_every
+            )
+
+    def close(self) -> None:
+        """Sync and close the log."""
+        with self._lock:
+            self._writer.close()
+
+    def __enter__(self) -> "CrawlCheckpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,307 @@
+"""Content fingerprints and near-duplicate detection for crawl results."""
+
+import codecs
+import hashlib
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+from .models import PageMetadata
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+# Maximum differing SimHash bits for two pages to count as near-duplicates
+DEFAULT_MAX_DISTANCE = 3
+
+_TOKEN_RE = re.compile(r"\w+")
+_SPACE_RE = re.compile(r"\s+")
+# Elements whose text is not page content; the title is part of the head
+# fingerprint, and a per-page title would pull mirrored bodies apart
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template", "title"})
+
+
+def _hash64(data: str) -> int:
+    return int.from_bytes(hashlib.blake2b(data.encode(), digest_size=8).digest(), "little")
+
+
+def _normalize(text: Optional[str]) -> str:
+    """Casefold and collapse whitespace so trivial differences hash the same."""
+    return _SPACE_RE.sub(" ", text or "").strip().casefold()
+
+
+class SimHash:
+    """
+    Streaming 64-bit SimHash over the words and word pairs of a text.
+
+    Text can be fed in arbitrary chunks; a word split across two chunks
+    is joined before it is hashed. Texts that share most of their words
+    get hashes a few bits apart, so near-duplicates can be found by
+    Hamming distance.
+
+    Usage:
+        hasher = SimHash()
+        for chunk in chunks:
+            hasher.update(chunk)
+        fingerprint = hasher.digest()
+    """
+
+    __slots__ = ("_weights", "_tail", "_previous", "features")
+
+    def __init__(self, text: str = ""):
+        self._weights = [0] * SIMHASH_BITS
+        self._tail = ""
+        self._previous: Optional[str] = None
+        self.features = 0
+        if text:
+            self.update(text)
+
+    def update(self, text: str) -> None:
+        """Add a chunk of text."""
+        text = self._tail + text.casefold()
+        tokens = _TOKEN_RE.findall(text)
+        # The last word may continue in the next chunk
+        self._tail = tokens.pop() if tokens and _TOKEN_RE.match(text[-1]) else ""
+        for token in tokens:
+            self._add_token(token)
+
+    def _add_token(self, token: str) -> None:
+        self._add_feature(token)
+        if self._previous is not None:
+            self._add_feature(f"{self._previous} {token}")
+        self._previous = token
+
+    def _add_feature(self, feature: str) -> None:
+        value = _hash64(feature)
+        weights = self._weights
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+        self.features += 1
+
+    def digest(self) -> int:
+        """Return the SimHash of everything fed so far."""
+        if self._tail:
+            self._add_token(self._tail)
+            self._tail = ""
+        return sum(1 << bit for bit, weight in enumerate(self._weights) if weight > 0)
+
+
+class BodyTextHasher(HTMLParser):
+    """
+    Feed raw HTML chunks and SimHash the visible text as it streams past.
+
+    Script, style, the title and other non-content elements are skipped;
+    no tree or text copy of the document is kept. The fetchers use ``feed_bytes`` to
+    hash a response body chunk by chunk as it is downloaded.
+    """
+
+    def __init__(self, encoding: Optional[str] = None):
+        super().__init__(convert_charrefs=True)
+        self.simhash = SimHash()
+        self._skip_depth = 0
+        try:
+            decoder_cls = codecs.getincrementaldecoder(encoding or "utf-8")
+        except LookupError:
+            decoder_cls = codecs.getincrementaldecoder("utf-8")
+        self._decoder = decoder_cls(errors="replace")
+
+    def feed_bytes(self, chunk: bytes) -> None:
+        """Feed a chunk of the (already content-decoded) response body."""
+        self.feed(self._decoder.decode(chunk))
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        # Keep words in adjacent text nodes apart; a text node may arrive in
+        # several handle_data calls, so separate at tags only
+        self.simhash.update(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        self.simhash.update(" ")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.simhash.update(data)
+
+    def digest(self) -> Optional[int]:
+        """Return the SimHash of the visible text, or None if there was none."""
+        self.feed(self._decoder.decode(b"", final=True))
+        self.close()
+        simhash = self.simhash.digest()
+        return simhash if self.simhash.features else None
+
+
+@dataclass(frozen=True, slots=True)
+class ContentFingerprint:
+    """Exact hash of the normalized head and, if the body was read, its SimHash."""
+    head: int
+    simhash: Optional[int] = None
+
+    @property
+    def has_body(self) -> bool:
+        return self.simhash is not None
+
+
+def fingerprint_page(
+    result: PageMetadata,
+    html: Optional[str] = None
+) -> Optional[ContentFingerprint]:
+    """
+    Fingerprint a crawled page.
+
+    The head hash covers the normalized title and description. The body
+    SimHash comes from ``html`` when it is given, otherwise from
+    ``result.body_simhash`` when the fetcher hashed the body as it
+    streamed in (``fingerprint_body=True``). Head-only results have no
+    body SimHash: a title and description are too little text for
+    near-duplicate matching, so they are only compared exactly.
+
+    Args:
+        result: Extracted page metadata
+        html: Full page HTML, if it was downloaded
+
+    Returns:
+        ContentFingerprint, or None for failed pages and pages with no
+        text to compare
+    """
+    if result.error is not None:
+        return None
+    title = _normalize(result.title)
+    description = _normalize(result.description)
+    if html is not None:
+        hasher = BodyTextHasher()
+        hasher.feed(html)
+        simhash = hasher.digest()
+    else:
+        simhash = result.body_simhash
+    if not (title or description or simhash is not None):
+        return None
+    return ContentFingerprint(_hash64(f"{title}\x00{description}"), simhash)
+
+
+class DuplicateIndex:
+    """
+    Index of page fingerprints that spots exact and near-duplicate pages.
+
+    Pages with a body fingerprint are duplicates when their SimHashes
+    differ in at most ``max_distance`` bits; many different pages share a
+    generic title, so their heads are not compared. Head-only pages are
+    duplicates only when their normalized title and description match
+    exactly. Near-duplicate lookups split each SimHash into
+    ``max_distance + 1`` bands; two hashes within the distance must agree
+    on at least one band, so only pages sharing a band are compared.
+    Memory is a few small tuples per unique page. The index is safe to
+    share between threads.
+
+    Usage:
+        index = DuplicateIndex(max_distance=3)
+        async for result in dedupe_results_async(scrape_async_iter(urls), index):
+            ...
+        print(f"{len(index.duplicates)} duplicates dropped")
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        if not 0 <= max_distance < SIMHASH_BITS:
+            raise ValueError(f"max_distance must be between 0 and {SIMHASH_BITS - 1}")
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        # (shift, mask) of each band, covering all 64 bits
+        edges = [SIMHASH_BITS * i // bands for i in range(bands + 1)]
+        self._bands = [(lo, (1 << (hi - lo)) - 1) for lo, hi in zip(edges, edges[1:])]
+        self._heads: dict[int, str] = {}
+        self._buckets: dict[tuple[int, int], list[tuple[int, str]]] = {}
+        # duplicate URL -> URL of the page it duplicates
+        self.duplicates: dict[str, str] = {}
+        self.unique = 0
+        self._lock = threading.Lock()
+
+    def check(self, url: str, fingerprint: ContentFingerprint) -> Optional[str]:
+        """
+        Look up a page and add it to the index if it is new.
+
+        Returns:
+            The URL of the page it duplicates, or None if it is unique
+        """
+        simhash = fingerprint.simhash
+        with self._lock:
+            if simhash is None:
+                original = self._heads.get(fingerprint.head)
+            else:
+                original = self._near_duplicate(simhash)
+            if original is not None:
+                self.duplicates[url] = original
+                return original
+
+            if simhash is None:
+                self._heads[fingerprint.head] = url
+            else:
+                for band, (shift, mask) in enumerate(self._bands):
+                    key = (band, simhash >> shift & mask)
+                    self._buckets.setdefault(key, []).append((simhash, url))
+            self.unique += 1
+            return None
+
+    def _near_duplicate(self, simhash: int) -> Optional[str]:
+        for band, (shift, mask) in enumerate(self._bands):
+            for other, url in self._buckets.get((band, simhash >> shift & mask), ()):
+                if (simhash ^ other).bit_count() <= self.max_distance:
+                    return url
+        return None
+
+    def check_result(self, result: PageMetadata, html: Optional[str] = None) -> Optional[str]:
+        """Fingerprint ``result`` and ``check`` it; failed and empty pages are never duplicates."""
+        fingerprint = fingerprint_page(result, html)
+        if fingerprint is None:
+            return None
+        return self.check(result.url, fingerprint)
+
+    def __len__(self) -> int:
+        return self.unique
+
+
+def dedupe_results(
+    results: Iterable[PageMetadata],
+    index: Optional[DuplicateIndex] = None,
+    drop: bool = True
+) -> Iterator[PageMetadata]:
+    """
+    Drop (or just flag) near-duplicate pages from a stream of results.
+
+    Args:
+        results: Results in crawl order; the first page of each group is kept
+        index: Index to use, e.g. to share it across crawls or read
+            ``index.duplicates`` afterwards
+        drop: Drop duplicates; when False every result is yielded and
+            duplicates are only recorded in ``index.duplicates``
+
+    Yields:
+        PageMetadata objects
+    """
+    index = index if index is not None else DuplicateIndex()
+    for result in results:
+        original = index.check_result(result)
+        if original is not None:
+            logger.debug(f"{result.url} duplicates {original}")
+            if drop:
+                continue
+        yield result
+
+
+async def dedupe_results_async(
+    results: AsyncIterable[PageMetadata],
+    index: Optional[DuplicateIndex] = None,
+    drop: bool = True
+) -> AsyncIterator[PageMetadata]:
+    """Async version of ``dedupe_results`` for ``scrape_async_iter`` streams."""
+    index = index if index is not None else DuplicateIndex()
+    async for result in results:
+        original = index.check_result(result)
+        if original is not None:
+            logger.debug(f"{result.url} duplicates {original}")
+            if drop:
+                continue
+        yield result
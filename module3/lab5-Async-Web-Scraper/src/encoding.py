@@ -0,0 +1,58 @@
+"""Content-Encoding negotiation and decoded-size limits for the fetchers."""
+
+from .exceptions import ResponseTooLargeError
+
+try:
+    import brotlicffi as brotli
+except ImportError:
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+# Cap on decoded bytes read from one response body
+DEFAULT_MAX_DECODED_BYTES = 10 * 1024 * 1024
+
+# Both aiohttp and urllib3 decode Brotli only when one of the brotli
+# packages is installed, so only advertise it then
+ACCEPT_ENCODING = "gzip, br" if brotli is not None else "gzip"
+
+
+def request_headers(extra: dict[str, str]) -> dict[str, str]:
+    """Return the headers every fetch sends, plus ``extra``."""
+    return {"Accept-Encoding": ACCEPT_ENCODING, **extra}
+
+
+class DecodedBody:
+    """
+    Accumulate decoded body chunks, failing as soon as ``max_bytes`` is passed.
+
+    The HTTP clients decompress incrementally and the size is checked as
+    each decoded chunk arrives, so a compression bomb is abandoned early
+    instead of being inflated in full. This is not a hard memory cap: a
+    client may inflate a whole compressed read before the check runs, and
+    gzip or Brotli data can expand about 1000-fold, so peak memory can pass
+    ``max_bytes`` by roughly a thousand times one network read.
+    """
+
+    __slots__ = ("max_bytes", "_chunks", "size")
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_DECODED_BYTES):
+        self.max_bytes = max_bytes
+        self._chunks: list[bytes] = []
+        self.size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Add a decoded chunk.
+
+        Raises:
+            ResponseTooLargeError: If the body is now larger than ``max_bytes``
+        """
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise ResponseTooLargeError(self.max_bytes)
+        self._chunks.append(chunk)
+
+    def getvalue(self) -> bytes:
+        return b"".join(self._chunks)
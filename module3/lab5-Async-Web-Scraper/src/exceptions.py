@@ -0,0 +1,24 @@
+"""Exceptions raised by the scraper."""
+
+from typing import Optional
+
+
+class ScraperError(Exception):
+    """Base class for scraper errors."""
+
+
+class RetryableHTTPError(ScraperError):
+    """A response status that is worth retrying (e.g. 429 or 503)."""
+
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(f"HTTP {status}")
+
+
+class ResponseTooLargeError(ScraperError):
+    """A decoded response body exceeded the configured size limit."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        super().__init__(f"Response exceeds {limit} decoded bytes")
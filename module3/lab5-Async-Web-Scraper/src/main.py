@@ -1,41 +1,114 @@
 """Main entry point for the Async Web Scraper."""
 
+import argparse
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
 from .benchmark import (
     run_sequential_scraper,
     run_threaded_scraper,
     run_async_scraper,
+    run_multiprocess_scraper,
     print_performance_comparison
 )
+from .checkpoint import CrawlCheckpoint
 from .output import save_results_to_json
+from .scrapers import DnsCache, UrlFrontier
 from .urls import SAMPLE_URLS
 
+CHECKPOINT_DIR = Path(__file__).parent.parent / "data" / "checkpoints"
+
+
+def open_checkpoint(name: str, resume: bool) -> CrawlCheckpoint:
+    """
+    Open the checkpoint log for one scraper run.
+    
+    Args:
+        name: Scraper name, used as the log file name
+        resume: Keep results from a previous interrupted run; otherwise
+            the log is started afresh
+    
+    Returns:
+        CrawlCheckpoint for the run
+    """
+    path = CHECKPOINT_DIR / f"{name}.jsonl"
+    if not resume:
+        path.unlink(missing_ok=True)
+    return CrawlCheckpoint(path)
+
 
-def main():
+def main(argv: Optional[list[str]] = None):
     """Main function to run all scrapers and compare performance."""
+    parser = argparse.ArgumentParser(description="Async Web Scraper performance comparison")
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Skip URLs completed by a previous interrupted run (see data/checkpoints/)"
+    )
+    parser.add_argument(
+        "--progress-interval", type=float, metavar="SECONDS",
+        help="Log crawl progress (URLs/s, in flight, queue depth, ETA) at this interval"
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, metavar="PORT",
+        help="Serve live Prometheus metrics at http://127.0.0.1:PORT/metrics"
+    )
+    args = parser.parse_args(argv)
+    progress_options = {
+        "progress_interval": args.progress_interval,
+        "metrics_port": args.metrics_port,
+    }
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     print("\n" + "="*60)
     print("ASYNC WEB SCRAPER - Performance Comparison")
     print("="*60)
     
     # Use a subset of URLs for faster testing (or all for full benchmark)
-    urls = SAMPLE_URLS[:20]  # Using first 20 URLs
+    # Drop duplicate spellings, interleaving hosts
+    urls = UrlFrontier(SAMPLE_URLS[:20]).drain()  # Using first 20 URLs
     
-    print(f"\nScraping {len(urls)} URLs using 3 different approaches:\n")
+    processes = os.cpu_count() or 1
+    
+    print(f"\nScraping {len(urls)} URLs using 4 different approaches:\n")
     print("1. Sequential (one at a time)")
     print("2. Threaded (concurrent threads)")
     print("3. Async (asyncio + aiohttp)")
+    print(f"4. Multi-process async ({processes} event loops)")
+    
+    # Resolve every host once up front; all four scrapers share the answers
+    dns_cache = DnsCache()
+    dns_cache.pre_resolve_sync(urls)
     
-    # Run all three scrapers
-    seq_results, seq_time = run_sequential_scraper(urls)
-    thread_results, thread_time = run_threaded_scraper(urls)
-    async_results, async_time = run_async_scraper(urls)
+    # Run all four scrapers
+    with open_checkpoint("sequential", args.resume) as checkpoint:
+        seq_results, seq_time = run_sequential_scraper(
+            urls, checkpoint, dns_cache, **progress_options
+        )
+    with open_checkpoint("threaded", args.resume) as checkpoint:
+        thread_results, thread_time = run_threaded_scraper(
+            urls, checkpoint, dns_cache, **progress_options
+        )
+    with open_checkpoint("async", args.resume) as checkpoint:
+        async_results, async_time = run_async_scraper(
+            urls, checkpoint, dns_cache, **progress_options
+        )
+    with open_checkpoint("multiprocess", args.resume) as checkpoint:
+        mp_results, mp_time = run_multiprocess_scraper(urls, processes, checkpoint, dns_cache)
     
     # Save results
     save_results_to_json(seq_results, "sequential_results.json")
     save_results_to_json(thread_results, "threaded_results.json")
     save_results_to_json(async_results, "async_results.json")
+    save_results_to_json(mp_results, "multiprocess_results.json")
     
     # Print comparison
-    print_performance_comparison(seq_time, thread_time, async_time)
+    print_performance_comparison(seq_time, thread_time, async_time, mp_time, processes)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+"""Low-overhead crawl metrics: counters and latency histograms."""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Log-spaced histogram bucket upper bounds from 1ms to ~5min, 10% apart,
+# so any reported percentile is within 10% of the true value
+LATENCY_BUCKETS = tuple(0.001 * 1.1 ** i for i in range(133))
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with O(log buckets) recording.
+
+    Memory is constant regardless of how many values are recorded.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate the ``q`` quantile (0-1) as the upper bound of its bucket.
+
+        Returns:
+            Latency in seconds, or 0.0 if nothing was recorded
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsCollector:
+    """
+    Collect per-request counters and latency for a crawl.
+
+    Recording is a lock, a few integer updates and one bisect, so it can
+    be left on for every request. Call ``report()`` at the end of a crawl,
+    or pass ``report_interval`` to have a summary logged periodically.
+    The collector is safe to share between threads.
+
+    Usage:
+        metrics = MetricsCollector()
+        results = scrape_threaded(urls, metrics=metrics)
+        print(metrics.report())
+    """
+
+    def __init__(self, report_interval: Optional[float] = None):
+        self.report_interval = report_interval
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_read = 0
+        self.status_codes: Counter = Counter()
+        self.started_at = time.perf_counter()
+        self._last_report = self.started_at
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        latency: float,
+        status: Optional[int] = None,
+        nbytes: int = 0,
+        error: bool = False
+    ) -> None:
+        """
+        Record one request attempt.
+
+        Args:
+            latency: Total request time in seconds
+            status: HTTP status code, if a response was received
+            nbytes: Body bytes read
+            error: Whether the attempt failed
+        """
+        with self._lock:
+            self.requests += 1
+            self.latency.record(latency)
+            self.bytes_read += nbytes
+            if status is not None:
+                self.status_codes[status] += 1
+            if error:
+                self.errors += 1
+
+        if self.report_interval is not None:
+            now = time.perf_counter()
+            if now - self._last_report >= self.report_interval:
+                self._last_report = now
+                logger.info(self.report())
+
+    def snapshot(self) -> dict:
+        """Return the current metrics as a plain dictionary."""
+        with self._lock:
+            elapsed = time.perf_counter() - self.started_at
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "bytes_read": self.bytes_read,
+                "status_codes": dict(self.status_codes),
+                "elapsed": elapsed,
+                "requests_per_second": self.requests / elapsed if elapsed else 0.0,
+                "latency_mean": self.latency.mean,
+                "latency_p50": self.latency.percentile(0.50),
+                "latency_p95": self.latency.percentile(0.95),
+                "latency_p99": self.latency.percentile(0.99),
+                "latency_max": self.latency.max,
+            }
+
+    def report(self) -> str:
+        """Format the current metrics as a one-line summary."""
+        s = self.snapshot()
+        statuses = ", ".join(f"{code}: {n}" for code, n in sorted(s["status_codes"].items()))
+        return (
+            f"{s['requests']} requests ({s['requests_per_second']:.1f}/s), "
+            f"{s['errors']} errors, {s['bytes_read'] / 1024:.0f} KiB | "
+            f"latency p50 {s['latency_p50'] * 1000:.0f}ms "
+            f"p95 {s['latency_p95'] * 1000:.0f}ms "
+            f"p99 {s['latency_p99'] * 1000:.0f}ms | "
+            f"status {{{statuses}}}"
+        )
@@ -1,8 +1,12 @@
+from array import array
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+# Stored in place of a missing status code in PageMetadataBatch
+_NO_STATUS = 0
 
-@dataclass
+
+@dataclass(slots=True)
 class PageMetadata:
     """Data class to store extracted page metadata."""
     url: str
@@ -11,3 +15,105 @@ class PageMetadata:
     status_code: Optional[int] = None
     fetch_time: float = 0.0
     error: Optional[str] = None
+    # SimHash of the body text when fetched with fingerprint_body; not written to output files
+    body_simhash: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        """Convert to the JSON-serialisable dictionary used for output files."""
+        return {
+            "url": self.url,
+            "title": self.title,
+            "description": self.description,
+            "status_code": self.status_code,
+            "fetch_time": round(self.fetch_time, 3),
+            "error": self.error
+        }
+
+
+class PageMetadataBatch:
+    """
+    Column-oriented store for many PageMetadata results.
+
+    Status codes and fetch times live in packed ``array`` columns (2 and
+    8 bytes per result) and the string fields in one list per column, so
+    a million results cost a few lists and arrays rather than a million
+    objects. Summary counts run over whole columns with C-level
+    ``count``/``sum`` instead of touching each result.
+
+    Usage:
+        batch = PageMetadataBatch.from_results(scrape_threaded_iter(urls))
+        print(batch.success_count(), batch.mean_fetch_time())
+    """
+
+    def __init__(self):
+        self.urls: list[str] = []
+        self.titles: list[Optional[str]] = []
+        self.descriptions: list[Optional[str]] = []
+        self.status_codes = array("H")
+        self.fetch_times = array("d")
+        self.errors: list[Optional[str]] = []
+
+    @classmethod
+    def from_results(cls, results: Iterable[PageMetadata]) -> "PageMetadataBatch":
+        """Build a batch from an iterable of results (consumed once)."""
+        batch = cls()
+        batch.extend(results)
+        return batch
+
+    def append(self, result: PageMetadata) -> None:
+        """Add one result."""
+        self.urls.append(result.url)
+        self.titles.append(result.title)
+        self.descriptions.append(result.description)
+        self.status_codes.append(
+            _NO_STATUS if result.status_code is None else result.status_code
+        )
+        self.fetch_times.append(result.fetch_time)
+        self.errors.append(result.error)
+
+    def extend(self, results: Iterable[PageMetadata]) -> None:
+        """Add every result from an iterable."""
+        for result in results:
+            self.append(result)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __getitem__(self, index: int) -> PageMetadata:
+        status_code = self.status_codes[index]
+        return PageMetadata(
+            url=self.urls[index],
+            title=self.titles[index],
+            description=self.descriptions[index],
+            status_code=None if status_code == _NO_STATUS else status_code,
+            fetch_time=self.fetch_times[index],
+            error=self.errors[index]
+        )
+
+    def __iter__(self) -> Iterator[PageMetadata]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_dicts(self) -> list[dict]:
+        """Convert every result with ``PageMetadata.to_dict``."""
+        return [result.to_dict() for result in self]
+
+    def status_count(self, *status_codes: int) -> int:
+        """Number of results with any of the given status codes."""
+        return sum(self.status_codes.count(code) for code in status_codes)
+
+    def success_count(self) -> int:
+        """Number of successful results; 304 means revalidated from the response cache."""
+        return self.status_count(200, 304)
+
+    def error_count(self) -> int:
+        """Number of results that recorded an error."""
+        return len(self.errors) - self.errors.count(None)
+
+    def total_fetch_time(self) -> float:
+        """Sum of all per-result fetch times in seconds."""
+        return sum(self.fetch_times)
+
+    def mean_fetch_time(self) -> float:
+        """Mean per-result fetch time in seconds (0.0 when empty)."""
+        return self.total_fetch_time() / len(self) if len(self) else 0.0
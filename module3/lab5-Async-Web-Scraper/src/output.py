@@ -1,61 +1,326 @@
 """Output formatting and file I/O for scraping results."""
 
+import gzip
+import io
 import json
+import logging
+import os
+import zlib
 from pathlib import Path
-from typing import List
-from .models import PageMetadata
+from typing import IO, AsyncIterable, Iterable, Iterator, Optional, Union
+from .models import PageMetadata, PageMetadataBatch
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
-def save_results_to_json(results: List[PageMetadata], filename: str) -> None:
+logger = logging.getLogger(__name__)
+
+# fsync JSON Lines output after this many records by default
+DEFAULT_FSYNC_EVERY = 1000
+
+
+def _output_path(filename: str) -> Path:
+    """Resolve ``filename`` inside the data directory, creating it if needed."""
+    output_dir = Path(__file__).parent.parent / "data"
+    output_dir.mkdir(exist_ok=True)
+    return output_dir / filename
+
+
+def _write_array_item(f: IO[str], result: PageMetadata, first: bool) -> None:
+    """Append one result to an open JSON array, matching ``indent=2`` layout."""
+    item = json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+    f.write("\n  " if first else ",\n  ")
+    f.write(item.replace("\n", "\n  "))
+
+
+def _close_array(f: IO[str], count: int) -> None:
+    f.write("\n]" if count else "]")
+
+
+def save_results_to_json(results: Iterable[PageMetadata], filename: str) -> None:
     """
     Save scraping results to a JSON file.
     
+    Results are written one at a time as they are consumed, so ``results``
+    may be a generator and is never held in memory as a whole.
+    
     Args:
-        results: List of PageMetadata objects
+        results: Iterable of PageMetadata objects
         filename: Output filename
     """
-    output_dir = Path(__file__).parent.parent / "data"
-    output_dir.mkdir(exist_ok=True)
+    output_path = _output_path(filename)
+    
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write("[")
+        for result in results:
+            _write_array_item(f, result, first=count == 0)
+            count += 1
+        _close_array(f, count)
+    
+    print(f"✓ Results saved to {output_path}")
+
+
+async def save_results_to_json_async(
+    results: AsyncIterable[PageMetadata],
+    filename: str
+) -> int:
+    """
+    Save results from an async iterable to a JSON file as they arrive.
     
-    output_path = output_dir / filename
-    
-    # Convert PageMetadata objects to dictionaries
-    data = [
-        {
-            "url": r.url,
-            "title": r.title,
-            "description": r.description,
-            "status_code": r.status_code,
-            "fetch_time": round(r.fetch_time, 3),
-            "error": r.error
-        }
-        for r in results
-    ]
+    Args:
+        results: Async iterable of PageMetadata objects,
+            e.g. ``scrape_async_iter(urls)``
+        filename: Output filename
+    
+    Returns:
+        Number of results written
+    
+    Usage:
+        await save_results_to_json_async(scrape_async_iter(urls), "out.json")
+    """
+    output_path = _output_path(filename)
     
+    count = 0
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("[")
+        async for result in results:
+            _write_array_item(f, result, first=count == 0)
+            count += 1
+        _close_array(f, count)
     
     print(f"✓ Results saved to {output_path}")
+    return count
+
+
+def _open_binary(path: Path, mode: str, compresslevel: Optional[int] = None):
+    """
+    Open ``path`` for binary reading or writing, compressing by suffix.
+
+    ``.gz`` uses gzip and ``.zst`` uses zstandard (if installed); anything
+    else is a plain file. Appending to a compressed file adds a new
+    gzip member or zstd frame, which readers handle transparently.
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "b", compresslevel=compresslevel or 6)
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise ImportError("Writing or reading .zst files requires the zstandard package")
+        raw = open(path, mode + "b")
+        if mode == "r":
+            return io.BufferedReader(
+                zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+            )
+        return zstandard.ZstdCompressor(level=compresslevel or 3).stream_writer(raw, closefd=True)
+    return open(path, mode + "b")
+
+
+class JsonLinesWriter:
+    """
+    Append results to a JSON Lines file as they arrive.
+
+    Each PageMetadata becomes one line, so a crash loses at most the
+    records written since the last flush rather than the whole crawl, and
+    memory use does not grow with the number of results. Output is
+    gzip- or zstd-compressed when ``path`` ends in ``.gz`` or ``.zst``.
+
+    Usage:
+        with JsonLinesWriter("data/results.jsonl.gz") as writer:
+            async for result in scrape_async_iter(urls):
+                writer.write(result)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        append: bool = False,
+        fsync_every: Optional[int] = DEFAULT_FSYNC_EVERY,
+        compresslevel: Optional[int] = None
+    ):
+        """
+        Args:
+            path: Output file path
+            append: Add to an existing file instead of replacing it
+            fsync_every: Flush and fsync after this many records
+                (None to only sync on close)
+            compresslevel: gzip/zstd compression level
+        """
+        self.path = Path(path)
+        self.fsync_every = fsync_every
+        self.count = 0
+        self._file = _open_binary(self.path, "a" if append else "w", compresslevel)
+
+    def write(self, result: PageMetadata) -> None:
+        """Write one result, syncing every ``fsync_every`` records."""
+        line = json.dumps(result.to_dict(), ensure_ascii=False)
+        self._file.write(line.encode("utf-8") + b"\n")
+        self.count += 1
+        if self.fsync_every and self.count % self.fsync_every == 0:
+            self.sync()
+
+    def write_many(self, results: Iterable[PageMetadata]) -> int:
+        """Write every result from an iterable; returns how many were written."""
+        start = self.count
+        for result in results:
+            self.write(result)
+        return self.count - start
+
+    def sync(self) -> None:
+        """Flush buffered (and compressed) data and fsync it to disk."""
+        if isinstance(self._file, gzip.GzipFile):
+            self._file.flush(zlib.Z_SYNC_FLUSH)
+        elif zstandard is not None and self.path.suffix == ".zst":
+            self._file.flush(zstandard.FLUSH_BLOCK)
+        else:
+            self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Sync and close the file."""
+        if self._file.closed:
+            return
+        self.sync()
+        self._file.close()
+
+    def __enter__(self) -> "JsonLinesWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_results_jsonl(
+    path: Union[str, Path],
+    strict: bool = False,
+    skip_invalid: bool = False
+) -> Iterator[PageMetadata]:
+    """
+    Stream results back from a JSON Lines file written by JsonLinesWriter.
+
+    Args:
+        path: File path (``.gz``/``.zst`` are decompressed)
+        strict: Raise on a truncated final record instead of stopping,
+            e.g. for files left behind by a crash
+        skip_invalid: Log and skip complete lines that are not a valid
+            record instead of raising
+
+    Yields:
+        PageMetadata objects in file order
+
+    Raises:
+        ValueError: If ``strict`` and the file ends in a partial record
+    """
+    path = Path(path)
+    with _open_binary(path, "r") as f:
+        lines = iter(f)
+        while True:
+            try:
+                line = next(lines)
+            except StopIteration:
+                return
+            except (EOFError, zlib.error) as e:
+                # Compressed stream cut off mid-block
+                if strict:
+                    raise ValueError(f"Truncated record at end of {path}") from e
+                return
+            if not line.endswith(b"\n"):
+                if strict:
+                    raise ValueError(f"Truncated record at end of {path}")
+                return
+            if not line.strip():
+                continue
+            try:
+                result = PageMetadata(**json.loads(line))
+            except (ValueError, TypeError) as e:
+                if not skip_invalid:
+                    raise
+                logger.warning(f"Skipping invalid record in {path}: {e}")
+                continue
+            yield result
+
+
+def save_results_to_jsonl(
+    results: Iterable[PageMetadata],
+    filename: str,
+    fsync_every: Optional[int] = DEFAULT_FSYNC_EVERY
+) -> int:
+    """
+    Save scraping results to a JSON Lines file in the data directory.
+
+    Args:
+        results: Iterable of PageMetadata objects
+        filename: Output filename (``.jsonl``, ``.jsonl.gz`` or ``.jsonl.zst``)
+        fsync_every: Flush and fsync after this many records
+
+    Returns:
+        Number of results written
+    """
+    output_path = _output_path(filename)
+    with JsonLinesWriter(output_path, fsync_every=fsync_every) as writer:
+        count = writer.write_many(results)
+    print(f"✓ Results saved to {output_path}")
+    return count
+
+
+async def save_results_to_jsonl_async(
+    results: AsyncIterable[PageMetadata],
+    filename: str,
+    fsync_every: Optional[int] = DEFAULT_FSYNC_EVERY
+) -> int:
+    """
+    Save results from an async iterable to a JSON Lines file as they arrive.
+
+    Args:
+        results: Async iterable of PageMetadata objects,
+            e.g. ``scrape_async_iter(urls)``
+        filename: Output filename (``.jsonl``, ``.jsonl.gz`` or ``.jsonl.zst``)
+        fsync_every: Flush and fsync after this many records
+
+    Returns:
+        Number of results written
+    """
+    output_path = _output_path(filename)
+    with JsonLinesWriter(output_path, fsync_every=fsync_every) as writer:
+        async for result in results:
+            writer.write(result)
+    print(f"✓ Results saved to {output_path}")
+    return writer.count
 
 
-def print_summary(results: List[PageMetadata], method: str, elapsed: float) -> None:
+def print_summary(
+    results: Union[Iterable[PageMetadata], PageMetadataBatch],
+    method: str,
+    elapsed: float
+) -> None:
     """
     Print a summary of scraping results.
     
     Args:
-        results: List of PageMetadata objects
+        results: PageMetadata objects, counted in one pass, or a
+            PageMetadataBatch, counted from its columns
         method: Scraping method name
         elapsed: Total elapsed time
     """
-    successful = sum(1 for r in results if r.status_code == 200)
-    failed = len(results) - successful
+    if isinstance(results, PageMetadataBatch):
+        total = len(results)
+        successful = results.success_count()
+    else:
+        # One pass that works for lists and generators alike
+        total = successful = 0
+        for result in results:
+            total += 1
+            if result.status_code in (200, 304):
+                successful += 1
+    failed = total - successful
     
     print(f"\n{'='*60}")
     print(f"{method.upper()} SCRAPING RESULTS")
     print(f"{'='*60}")
-    print(f"Total URLs: {len(results)}")
+    print(f"Total URLs: {total}")
     print(f"Successful: {successful}")
     print(f"Failed: {failed}")
     print(f"Total Time: {elapsed:.2f}s")
-    print(f"Average Time per URL: {elapsed/len(results):.2f}s")
+    print(f"Average Time per URL: {elapsed/total:.2f}s")
     print(f"{'='*60}\n")
@@ -0,0 +1,148 @@
+"""
+Micro-benchmark for the HTML metadata parser backends.
+
+Runs every available backend over a corpus of saved HTML files, checks
+each one against the BeautifulSoup reference output and reports the
+time per document, so the fastest correct backend can be chosen per
+deployment (see ``parsers.set_parser_backend``).
+
+Usage:
+    python -m src.parser_benchmark [FIXTURE_DIR] [--repeat N]
+"""
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+from .parsers import available_backends, extract_metadata_from_html
+
+DEFAULT_FIXTURE_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "html"
+REFERENCE_BACKEND = 'bs4'
+
+
+@dataclass
+class BackendResult:
+    """Timing and correctness of one parser backend over a corpus."""
+    backend: str
+    seconds_per_doc: float
+    mismatches: list[str] = field(default_factory=list)
+
+    @property
+    def correct(self) -> bool:
+        return not self.mismatches
+
+
+def load_fixtures(directory: Path = DEFAULT_FIXTURE_DIR) -> dict[str, str]:
+    """
+    Load every ``*.html`` file in a directory.
+
+    Args:
+        directory: Directory containing saved HTML documents
+
+    Returns:
+        Mapping of file name to document text
+    """
+    return {
+        path.name: path.read_text(encoding='utf-8', errors='replace')
+        for path in sorted(Path(directory).glob("*.html"))
+    }
+
+
+def benchmark_backends(
+    documents: dict[str, str],
+    repeat: int = 20,
+    backends: Optional[Iterable[str]] = None
+) -> list[BackendResult]:
+    """
+    Time each backend over the corpus and compare it with the reference.
+
+    Args:
+        documents: Mapping of document name to HTML text
+        repeat: Number of passes over the corpus per backend
+        backends: Backend names to run (defaults to all available)
+
+    Returns:
+        BackendResult objects sorted fastest first
+    """
+    reference = {
+        name: extract_metadata_from_html(html, name, REFERENCE_BACKEND)
+        for name, html in documents.items()
+    }
+
+    results = []
+    for backend in backends or available_backends():
+        mismatches = []
+        for name, html in documents.items():
+            got = extract_metadata_from_html(html, name, backend)
+            expected = reference[name]
+            if (got.title, got.description) != (expected.title, expected.description):
+                mismatches.append(name)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for name, html in documents.items():
+                extract_metadata_from_html(html, name, backend)
+        elapsed = time.perf_counter() - start
+
+        results.append(BackendResult(
+            backend=backend,
+            seconds_per_doc=elapsed / (repeat * max(len(documents), 1)),
+            mismatches=mismatches
+        ))
+
+    return sorted(results, key=lambda r: r.seconds_per_doc)
+
+
+def print_benchmark_results(results: list[BackendResult]) -> None:
+    """
+    Print a comparison table and the recommended backend.
+
+    Args:
+        results: Output of ``benchmark_backends``
+    """
+    baseline = next(
+        (r.seconds_per_doc for r in results if r.backend == REFERENCE_BACKEND),
+        None
+    )
+
+    print("\n" + "="*60)
+    print("PARSER BACKEND BENCHMARK")
+    print("="*60)
+    for r in results:
+        speedup = f"{baseline / r.seconds_per_doc:6.1f}x" if baseline else ""
+        status = "ok" if r.correct else f"MISMATCH: {', '.join(r.mismatches)}"
+        print(f"{r.backend:<8} {r.seconds_per_doc * 1e6:10.1f} us/doc {speedup}  {status}")
+    print("="*60)
+
+    fastest = next((r for r in results if r.correct), None)
+    if fastest:
+        print(f"\n🏆 Fastest correct backend: {fastest.backend}")
+        print(f"   Select it with SCRAPER_PARSER_BACKEND={fastest.backend}")
+    print()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "fixtures", nargs="?", type=Path, default=DEFAULT_FIXTURE_DIR,
+        help="directory of saved HTML documents"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the corpus")
+    parser.add_argument(
+        "--backend", action="append", dest="backends",
+        choices=available_backends(), help="backend to run (repeatable)"
+    )
+    args = parser.parse_args(argv)
+
+    documents = load_fixtures(args.fixtures)
+    if not documents:
+        parser.error(f"no .html files found in {args.fixtures}")
+
+    print(f"Benchmarking {len(documents)} documents x {args.repeat} passes")
+    print_benchmark_results(benchmark_backends(documents, args.repeat, args.backends))
+
+
+if __name__ == "__main__":
+    main()
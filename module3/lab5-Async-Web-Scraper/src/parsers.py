@@ -1,19 +1,41 @@
+import codecs
+import html as html_lib
+import os
 import re
+from html.parser import HTMLParser
+from typing import Callable, Optional
 from bs4 import BeautifulSoup
 from .models import PageMetadata
 
+try:
+    import lxml.html as lxml_html
+except ImportError:  # lxml is an optional speed-up
+    lxml_html = None
 
-def extract_metadata_from_html(html: str, url: str) -> PageMetadata:
-    """
-    Extract metadata from HTML content using BeautifulSoup and regex.
-    
-    Args:
-        html: HTML content as string
-        url: URL of the page
-    
-    Returns:
-        PageMetadata object with extracted information
-    """
+# Stop reading a response once this many bytes have been seen without </head>
+DEFAULT_MAX_HEAD_BYTES = 256 * 1024
+# Chunk size used when streaming response bodies
+HEAD_CHUNK_SIZE = 16 * 1024
+# Slice size used when feeding a complete document to the event parser
+_EVENT_FEED_SIZE = 8 * 1024
+
+_HEAD_END_RE = re.compile(r'</head\s*>|<body[\s>]', re.IGNORECASE)
+_HEAD_END_BYTES_RE = re.compile(rb'</head\s*>|<body[\s>]', re.IGNORECASE)
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+_META_RE = re.compile(r'<meta\s[^>]*>', re.IGNORECASE)
+_ATTR_RE = re.compile(
+    r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))'
+)
+
+
+def _head_section(html: str) -> str:
+    """Return the document up to the end of its head (or all of it)."""
+    match = _HEAD_END_RE.search(html)
+    return html[:match.start()] if match else html
+
+
+def _extract_with_bs4(html: str, url: str) -> PageMetadata:
+    """Reference backend: full BeautifulSoup tree plus an Open Graph regex."""
     soup = BeautifulSoup(html, 'html.parser')
     
     # Extract title
@@ -39,3 +61,327 @@ def extract_metadata_from_html(html: str, url: str) -> PageMetadata:
             description = og_desc_match.group(1)
     
     return PageMetadata(url=url, title=title, description=description)
+
+
+def _extract_with_events(html: str, url: str) -> PageMetadata:
+    """Event-based backend: ``html.parser`` callbacks, no tree, stops at the head end."""
+    parser = HeadMetadataParser()
+    for start in range(0, len(html), _EVENT_FEED_SIZE):
+        parser.feed(html[start:start + _EVENT_FEED_SIZE])
+        if parser.done:
+            break
+    parser.close()
+    return PageMetadata(
+        url=url,
+        title=parser.title,
+        description=parser.description or parser.og_description
+    )
+
+
+def _extract_with_regex(html: str, url: str) -> PageMetadata:
+    """Regex backend: scans only the head section for title and meta tags."""
+    head = _head_section(html)
+    
+    title = None
+    title_match = _TITLE_RE.search(head)
+    if title_match:
+        title = html_lib.unescape(title_match.group(1)).strip()
+    
+    description = None
+    og_description = None
+    for meta in _META_RE.finditer(head):
+        attrs = {
+            name.lower(): html_lib.unescape(dq or sq or bare)
+            for name, dq, sq, bare in _ATTR_RE.findall(meta.group(0))
+        }
+        content = attrs.get('content')
+        if not content:
+            continue
+        if description is None and attrs.get('name', '').lower() == 'description':
+            description = content
+            break
+        if og_description is None and attrs.get('property', '').lower() == 'og:description':
+            og_description = content
+    
+    return PageMetadata(url=url, title=title, description=description or og_description)
+
+
+def _extract_with_lxml(html: str, url: str) -> PageMetadata:
+    """lxml backend: C parser over the head section only."""
+    head = _head_section(html)
+    if not head.strip():
+        return PageMetadata(url=url)
+    doc = lxml_html.document_fromstring(head)
+    
+    title = None
+    title_el = doc.find('.//title')
+    if title_el is not None:
+        title = title_el.text_content().strip()
+    
+    description = None
+    for xpath in (
+        '//meta[@name="description"]/@content',
+        '//meta[@property="og:description"]/@content'
+    ):
+        values = [v for v in doc.xpath(xpath) if v]
+        if values:
+            description = values[0]
+            break
+    
+    return PageMetadata(url=url, title=title, description=description)
+
+
+PARSER_BACKENDS: dict[str, Callable[[str, str], PageMetadata]] = {
+    'bs4': _extract_with_bs4,
+    'events': _extract_with_events,
+    'regex': _extract_with_regex,
+}
+if lxml_html is not None:
+    PARSER_BACKENDS['lxml'] = _extract_with_lxml
+
+DEFAULT_PARSER_BACKEND = 'bs4'
+# Backend picked with set_parser_backend() or the environment; None keeps the defaults
+_active_backend: Optional[str] = os.environ.get('SCRAPER_PARSER_BACKEND')
+
+
+def available_backends() -> list[str]:
+    """Return the names of the parser backends usable in this environment."""
+    return list(PARSER_BACKENDS)
+
+
+def get_parser_backend() -> str:
+    """Return the name of the backend used by ``extract_metadata_from_html``."""
+    return _active_backend or DEFAULT_PARSER_BACKEND
+
+
+def streams_head() -> bool:
+    """
+    Whether head-only fetches parse chunks as they arrive.
+    
+    The streaming path is the ``events`` backend fed straight from the
+    response. It is used unless another backend has been selected; then
+    the head is collected and parsed with that backend instead.
+    """
+    return _active_backend in (None, 'events')
+
+
+def set_parser_backend(name: str) -> None:
+    """
+    Select the backend used by ``extract_metadata_from_html`` and by the
+    scrapers, including head-only fetches (see ``streams_head``).
+    
+    The initial choice can also be set with the ``SCRAPER_PARSER_BACKEND``
+    environment variable.
+    
+    Args:
+        name: One of ``available_backends()``
+    
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global _active_backend
+    if name not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend {name!r}; available: {', '.join(PARSER_BACKENDS)}"
+        )
+    _active_backend = name
+
+
+def extract_metadata_from_html(
+    html: str,
+    url: str,
+    backend: Optional[str] = None
+) -> PageMetadata:
+    """
+    Extract metadata from HTML content.
+    
+    Args:
+        html: HTML content as string
+        url: URL of the page
+        backend: Parser backend name (defaults to the one chosen with
+            ``set_parser_backend``)
+    
+    Returns:
+        PageMetadata object with extracted information
+    
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    name = backend or get_parser_backend()
+    try:
+        extract = PARSER_BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown parser backend {name!r}; available: {', '.join(PARSER_BACKENDS)}"
+        ) from None
+    return extract(html, url)
+
+
+class HeadMetadataParser(HTMLParser):
+    """
+    Event-based parser that collects head metadata without building a tree.
+    
+    Sets ``done`` as soon as ``</head>`` or ``<body>`` is seen, after which
+    the rest of the document does not need to be fed.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title: Optional[str] = None
+        self.description: Optional[str] = None
+        self.og_description: Optional[str] = None
+        self.done = False
+        self._title_parts: Optional[list[str]] = None
+    
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag == 'title':
+            if self.title is None and self._title_parts is None:
+                self._title_parts = []
+        elif tag == 'meta':
+            self._handle_meta(dict(attrs))
+        elif tag == 'body':
+            self.done = True
+    
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        self.handle_starttag(tag, attrs)
+    
+    def handle_endtag(self, tag: str) -> None:
+        if tag == 'title':
+            self._finish_title()
+        elif tag == 'head':
+            self.done = True
+    
+    def handle_data(self, data: str) -> None:
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+    
+    def close(self) -> None:
+        super().close()
+        self._finish_title()
+    
+    def _handle_meta(self, attrs: dict) -> None:
+        content = attrs.get('content')
+        if not content:
+            return
+        if self.description is None and (attrs.get('name') or '').lower() == 'description':
+            self.description = content
+        elif self.og_description is None and (attrs.get('property') or '').lower() == 'og:description':
+            self.og_description = content
+    
+    def _finish_title(self) -> None:
+        if self._title_parts is not None:
+            self.title = ''.join(self._title_parts).strip()
+            self._title_parts = None
+
+
+class StreamingHeadExtractor:
+    """
+    Incrementally extract page metadata from raw response chunks.
+    
+    Bytes are decoded and parsed as they arrive; ``feed()`` returns ``True``
+    once ``</head>`` (or ``<body>``) has been seen or ``max_bytes`` have been
+    read, so the caller can stop reading and close the connection.
+    
+    Usage:
+        extractor = StreamingHeadExtractor(encoding="utf-8")
+        for chunk in response.iter_content(HEAD_CHUNK_SIZE):
+            if extractor.feed(chunk):
+                break
+        metadata = extractor.result(url)
+    """
+    
+    def __init__(
+        self,
+        encoding: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_HEAD_BYTES
+    ):
+        try:
+            decoder_cls = codecs.getincrementaldecoder(encoding or 'utf-8')
+        except LookupError:
+            decoder_cls = codecs.getincrementaldecoder('utf-8')
+        self._decoder = decoder_cls(errors='replace')
+        self._parser = HeadMetadataParser()
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+    
+    @property
+    def done(self) -> bool:
+        """Whether enough of the document has been read."""
+        return self._parser.done or self.bytes_read >= self.max_bytes
+    
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Feed the next chunk of the response body.
+        
+        Args:
+            chunk: Raw (already content-decoded) body bytes
+        
+        Returns:
+            True if no further chunks are needed
+        """
+        self.bytes_read += len(chunk)
+        self._parser.feed(self._decoder.decode(chunk))
+        return self.done
+    
+    def result(self, url: str) -> PageMetadata:
+        """
+        Finish parsing and return the extracted metadata.
+        
+        Args:
+            url: URL of the page
+        
+        Returns:
+            PageMetadata object with extracted information
+        """
+        parser = self._parser
+        parser.feed(self._decoder.decode(b'', final=True))
+        parser.close()
+        return PageMetadata(
+            url=url,
+            title=parser.title,
+            description=parser.description or parser.og_description
+        )
+
+
+class HeadCollector:
+    """
+    Buffer raw response chunks until the end of the document head.
+    
+    Used when parsing happens elsewhere (e.g. in a process pool): the
+    collected head is decoded once and handed to a parser backend.
+    ``feed()`` returns ``True`` once ``</head>`` (or ``<body>``) has been
+    seen or ``max_bytes`` have been read.
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_HEAD_BYTES):
+        self.max_bytes = max_bytes
+        self._buffer = bytearray()
+        self.done = False
+    
+    @property
+    def bytes_read(self) -> int:
+        return len(self._buffer)
+    
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Append the next chunk of the response body.
+        
+        Returns:
+            True if no further chunks are needed
+        """
+        # Re-scan a few bytes before the chunk in case the tag was split
+        search_from = max(0, len(self._buffer) - 16)
+        self._buffer += chunk
+        if (
+            _HEAD_END_BYTES_RE.search(self._buffer, search_from)
+            or len(self._buffer) >= self.max_bytes
+        ):
+            self.done = True
+        return self.done
+    
+    def text(self, encoding: Optional[str] = None) -> str:
+        """Decode the collected bytes, replacing undecodable sequences."""
+        try:
+            return self._buffer.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return self._buffer.decode('utf-8', errors='replace')
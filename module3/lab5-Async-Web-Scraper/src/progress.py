@@ -0,0 +1,234 @@
+"""Live crawl progress: periodic log lines and a Prometheus /metrics endpoint."""
+
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from .metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROGRESS_INTERVAL = 5.0
+METRICS_PREFIX = "scraper"
+
+
+class CrawlProgress:
+    """
+    Track a running crawl: queued, in-flight, completed and failed URLs.
+
+    The scrapers call ``enqueue``/``start_request``/``finish_request`` (and
+    ``requeue`` when a URL waits for a retry); each is a lock and an integer
+    update. ``start()`` launches a background thread that logs a progress
+    line every ``interval`` seconds with throughput, error rate, queue
+    depth and ETA, and ``serve_metrics()`` exposes the same numbers, plus
+    any attached ``MetricsCollector``, over HTTP in Prometheus text format.
+    The tracker is safe to share between threads and the event loop.
+
+    Usage:
+        with CrawlProgress(total=len(urls), interval=5, metrics=metrics) as progress:
+            progress.serve_metrics(9100)
+            results = scrape_threaded(urls, metrics=metrics, progress=progress)
+    """
+
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        interval: float = DEFAULT_PROGRESS_INTERVAL,
+        metrics: Optional[MetricsCollector] = None
+    ):
+        """
+        Args:
+            total: Expected number of URLs, for the ETA; if unknown, the
+                number enqueued so far is used
+            interval: Seconds between progress log lines
+            metrics: Request metrics to include on the /metrics endpoint
+        """
+        self.total = total
+        self.interval = interval
+        self.metrics = metrics
+        self.enqueued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.errors = 0
+        self.started_at = time.perf_counter()
+        self._lock = threading.Lock()
+        # (time, completed) at the previous log line, for the recent rate
+        self._last_sample = (self.started_at, 0)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def add_total(self, n: int) -> None:
+        """Add ``n`` URLs to the expected total, for crawls that enqueue lazily."""
+        with self._lock:
+            self.total = (self.total or 0) + n
+
+    def enqueue(self, n: int = 1) -> None:
+        """Record ``n`` URLs waiting to be fetched."""
+        with self._lock:
+            self.enqueued += n
+
+    def start_request(self) -> None:
+        """Record that a queued URL is being fetched."""
+        with self._lock:
+            self.in_flight += 1
+
+    def requeue(self) -> None:
+        """Record that an in-flight URL went back to the queue to be retried."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def finish_request(self, error: bool = False) -> None:
+        """Record that an in-flight URL has its final result."""
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+            if error:
+                self.errors += 1
+
+    def snapshot(self) -> dict:
+        """Return the current progress as a plain dictionary."""
+        with self._lock:
+            elapsed = time.perf_counter() - self.started_at
+            rate = self.completed / elapsed if elapsed else 0.0
+            total = self.total if self.total is not None else self.enqueued
+            remaining = max(total - self.completed, 0)
+            return {
+                "completed": self.completed,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "queued": max(self.enqueued - self.completed - self.in_flight, 0),
+                "total": total,
+                "elapsed": elapsed,
+                "urls_per_second": rate,
+                "error_rate": self.errors / self.completed if self.completed else 0.0,
+                "eta": remaining / rate if rate else None,
+            }
+
+    def report(self) -> str:
+        """Format the current progress as a one-line summary."""
+        s = self.snapshot()
+        now = time.perf_counter()
+        last_time, last_completed = self._last_sample
+        self._last_sample = (now, s["completed"])
+        recent = (s["completed"] - last_completed) / (now - last_time) if now > last_time else 0.0
+        eta = f"{s['eta']:.0f}s" if s["eta"] is not None else "?"
+        return (
+            f"{s['completed']}/{s['total']} URLs ({recent:.1f}/s now, "
+            f"{s['urls_per_second']:.1f}/s avg) | {s['in_flight']} in flight, "
+            f"{s['queued']} queued | errors {s['error_rate']:.1%} | ETA {eta}"
+        )
+
+    def prometheus_text(self) -> str:
+        """Render progress and request metrics in Prometheus text exposition format."""
+        s = self.snapshot()
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str, value) -> None:
+            full_name = f"{METRICS_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            lines.append(f"{full_name} {value}")
+
+        metric("urls_completed_total", "counter", "URLs with a final result.", s["completed"])
+        metric("url_errors_total", "counter", "URLs whose final result is an error.", s["errors"])
+        metric("urls_in_flight", "gauge", "URLs being fetched.", s["in_flight"])
+        metric("queue_depth", "gauge", "URLs waiting to be fetched.", s["queued"])
+        metric("urls_total", "gauge", "URLs expected in this crawl.", s["total"])
+        metric("urls_per_second", "gauge", "Average completed URLs per second.",
+               f"{s['urls_per_second']:.3f}")
+        if s["eta"] is not None:
+            metric("eta_seconds", "gauge", "Estimated seconds until the crawl finishes.",
+                   f"{s['eta']:.1f}")
+
+        if self.metrics is not None:
+            m = self.metrics.snapshot()
+            metric("requests_total", "counter", "HTTP request attempts.", m["requests"])
+            metric("request_errors_total", "counter", "Failed HTTP request attempts.", m["errors"])
+            metric("response_bytes_total", "counter", "Response body bytes read.", m["bytes_read"])
+            name = f"{METRICS_PREFIX}_responses_total"
+            lines.append(f"# HELP {name} HTTP responses by status code.")
+            lines.append(f"# TYPE {name} counter")
+            for code, count in sorted(m["status_codes"].items()):
+                lines.append(f'{name}{{status="{code}"}} {count}')
+            name = f"{METRICS_PREFIX}_request_latency_seconds"
+            lines.append(f"# HELP {name} HTTP request latency.")
+            lines.append(f"# TYPE {name} summary")
+            for quantile in ("0.5", "0.95", "0.99"):
+                key = f"latency_p{round(float(quantile) * 100)}"
+                lines.append(f'{name}{{quantile="{quantile}"}} {m[key]:.6f}')
+            lines.append(f"{name}_sum {self.metrics.latency.total:.6f}")
+            lines.append(f"{name}_count {self.metrics.latency.count}")
+        return "\n".join(lines) + "\n"
+
+    def start(self) -> "CrawlProgress":
+        """Start logging a progress line every ``interval`` seconds."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="crawl-progress", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            logger.info(self.report())
+
+    def serve_metrics(self, port: int = 0, host: str = "127.0.0.1") -> int:
+        """
+        Serve ``prometheus_text()`` at ``http://host:port/metrics`` from a background thread.
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+            host: Interface to bind; local-only by default
+
+        Returns:
+            The port the endpoint is listening on
+        """
+        if self._server is not None:
+            return self._server.server_address[1]
+        progress = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = progress.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="crawl-metrics", daemon=True
+        ).start()
+        port = self._server.server_address[1]
+        logger.info(f"Serving crawl metrics at http://{host}:{port}/metrics")
+        return port
+
+    def close(self) -> None:
+        """Stop the progress thread and the metrics endpoint, logging a final line."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            logger.info(self.report())
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "CrawlProgress":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
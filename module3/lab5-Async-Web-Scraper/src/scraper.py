@@ -10,7 +10,11 @@ from .parsers import extract_metadata_from_html
 from .scrapers import (
     scrape_sequential,
     scrape_threaded,
+    scrape_threaded_iter,
     scrape_async,
+    scrape_async_iter,
+    AsyncScraper,
+    scrape_multiprocess,
     fetch_url_sync,
     fetch_url_async
 )
@@ -20,7 +24,11 @@ __all__ = [
     'extract_metadata_from_html',
     'scrape_sequential',
     'scrape_threaded',
+    'scrape_threaded_iter',
     'scrape_async',
+    'scrape_async_iter',
+    'AsyncScraper',
+    'scrape_multiprocess',
     'fetch_url_sync',
     'fetch_url_async'
 ]
@@ -0,0 +1,28 @@
+"""Scraper implementations: sequential, threaded and async."""
+
+from .sequential import fetch_url_sync, scrape_sequential
+from .threaded import scrape_threaded, scrape_threaded_iter
+from .async_scraper import AsyncScraper, fetch_url_async, run_async, scrape_async, scrape_async_iter
+from .parse_pool import ParsePool
+from .multiprocess import scrape_multiprocess
+from .frontier import UrlFrontier, normalize_url
+from .ratelimit import HostRateLimiter
+from .dns import DnsCache
+
+__all__ = [
+    'fetch_url_sync',
+    'scrape_sequential',
+    'scrape_threaded',
+    'scrape_threaded_iter',
+    'fetch_url_async',
+    'scrape_async',
+    'scrape_async_iter',
+    'AsyncScraper',
+    'run_async',
+    'ParsePool',
+    'scrape_multiprocess',
+    'UrlFrontier',
+    'normalize_url',
+    'HostRateLimiter',
+    'DnsCache',
+]
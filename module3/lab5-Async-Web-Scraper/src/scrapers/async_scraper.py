@@ -0,0 +1,731 @@
+import asyncio
+import time
+import logging
+from typing import Any, AsyncIterator, Coroutine, Iterable, Optional, TypeVar
+import aiohttp
+from ..cache import ResponseCache
+from ..checkpoint import CrawlCheckpoint
+from ..dedup import BodyTextHasher
+from ..encoding import DEFAULT_MAX_DECODED_BYTES, DecodedBody, request_headers
+from ..exceptions import ResponseTooLargeError, RetryableHTTPError
+from ..metrics import MetricsCollector
+from ..models import PageMetadata
+from ..parsers import (
+    DEFAULT_MAX_HEAD_BYTES,
+    HEAD_CHUNK_SIZE,
+    HeadCollector,
+    StreamingHeadExtractor,
+    extract_metadata_from_html,
+    streams_head
+)
+from ..progress import CrawlProgress
+from .dns import DNS_CACHE_TTL, CachingResolver, DnsCache
+from .parse_pool import ParsePool
+from .ratelimit import HostRateLimiter
+from ..utils import RetryBudget, RetryPolicy, log_execution, parse_retry_after
+from .scheduler import HostScheduler
+
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional, faster event loop
+    uvloop = None
+
+DEFAULT_PER_HOST_LIMIT = 4
+DEFAULT_QUEUE_SIZE = 1000
+KEEPALIVE_TIMEOUT = 30
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Marks the end of a worker's output on the result queue
+_WORKER_DONE = object()
+
+
+@log_execution
+async def fetch_url_async(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: int = 10,
+    head_only: bool = True,
+    max_head_bytes: int = DEFAULT_MAX_HEAD_BYTES,
+    parse_pool: Optional[ParsePool] = None,
+    cache: Optional[ResponseCache] = None,
+    metrics: Optional[MetricsCollector] = None,
+    max_decoded_bytes: int = DEFAULT_MAX_DECODED_BYTES,
+    fingerprint_body: bool = False
+) -> PageMetadata:
+    """
+    Asynchronously fetch a URL and extract metadata.
+    
+    By default only the document head is read: the body is streamed in
+    chunks and the connection is closed as soon as ``</head>`` or
+    ``max_head_bytes`` is reached. Responses may be gzip- or
+    Brotli-compressed; they are decompressed as they stream in, and a
+    body that decodes to more than ``max_decoded_bytes`` is abandoned.
+    
+    Args:
+        session: aiohttp ClientSession
+        url: URL to fetch
+        timeout: Request timeout in seconds
+        head_only: Stop reading after the document head
+        max_head_bytes: Maximum bytes to read when ``head_only`` is set
+        parse_pool: Parse in this executor pool instead of on the event loop
+        cache: Conditional-request cache; a 304 reuses the cached metadata
+        metrics: Collector to record latency, bytes and status into
+        max_decoded_bytes: Maximum decompressed body size
+        fingerprint_body: Read the whole body and SimHash its text as it
+            streams in, into ``body_simhash`` (see ``src.dedup``)
+    
+    Returns:
+        PageMetadata object
+    """
+    start_time = time.perf_counter()
+    try:
+        return await _fetch_page(
+            session, url, timeout, head_only, max_head_bytes, parse_pool, cache, metrics,
+            max_decoded_bytes=max_decoded_bytes, fingerprint_body=fingerprint_body
+        )
+    except Exception as e:
+        _record_failure(metrics, e, start_time)
+        return _error_metadata(url, e, start_time)
+
+
+def _record_failure(
+    metrics: Optional[MetricsCollector],
+    error: Exception,
+    start_time: float
+) -> None:
+    if metrics is not None:
+        metrics.record(
+            time.perf_counter() - start_time,
+            getattr(error, "status", None),
+            error=True
+        )
+
+
+def _error_metadata(url: str, error: Exception, start_time: float) -> PageMetadata:
+    """Build the result for a fetch that failed with ``error``."""
+    metadata = PageMetadata(url=url, fetch_time=time.perf_counter() - start_time)
+    if isinstance(error, asyncio.TimeoutError):
+        metadata.error = "Timeout"
+        logger.error(f"Timeout fetching {url}")
+    elif isinstance(error, RetryableHTTPError):
+        metadata.status_code = error.status
+        metadata.error = str(error)
+    else:
+        metadata.error = str(error)
+        logger.error(f"Error fetching {url}: {error}")
+    return metadata
+
+
+async def _fetch_page(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: int = 10,
+    head_only: bool = True,
+    max_head_bytes: int = DEFAULT_MAX_HEAD_BYTES,
+    parse_pool: Optional[ParsePool] = None,
+    cache: Optional[ResponseCache] = None,
+    metrics: Optional[MetricsCollector] = None,
+    retry_statuses: frozenset[int] = frozenset(),
+    max_decoded_bytes: int = DEFAULT_MAX_DECODED_BYTES,
+    fingerprint_body: bool = False
+) -> PageMetadata:
+    """
+    Fetch one page, raising instead of recording transient failures.
+    
+    Network errors propagate, and statuses in ``retry_statuses`` raise
+    RetryableHTTPError, so the caller can decide whether to retry.
+    """
+    start_time = time.perf_counter()
+    metadata = PageMetadata(url=url)
+    cached = cache.get(url) if cache is not None else None
+    max_head_bytes = min(max_head_bytes, max_decoded_bytes)
+    # The body fingerprint needs the whole body
+    head_only = head_only and not fingerprint_body
+    nbytes = 0
+    
+    async with session.get(
+        url,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers=request_headers(ResponseCache.conditional_headers(cached))
+    ) as response:
+        metadata.status_code = response.status
+        metadata.fetch_time = time.perf_counter() - start_time
+        
+        if response.status == 304 and cache is not None and cached is not None:
+            cache.revalidated(url, cached, metadata)
+        elif response.status == 200:
+            if head_only and parse_pool is None and streams_head():
+                extracted, nbytes = await _extract_head_async(response, url, max_head_bytes)
+            else:
+                if head_only:
+                    html, nbytes = await _collect_head_async(response, max_head_bytes)
+                else:
+                    hasher = BodyTextHasher(response.charset) if fingerprint_body else None
+                    body = await _read_body_async(response, max_decoded_bytes, hasher)
+                    nbytes = len(body)
+                    if hasher is not None:
+                        metadata.body_simhash = hasher.digest()
+                    # get_encoding() needs the body read by aiohttp itself
+                    html = body.decode(response.charset or 'utf-8', errors='replace')
+                if parse_pool is not None:
+                    extracted = await parse_pool.parse(html, url)
+                else:
+                    extracted = extract_metadata_from_html(html, url)
+            metadata.title = extracted.title
+            metadata.description = extracted.description
+            if cache is not None:
+                cache.store(url, response.headers, metadata)
+        elif response.status in retry_statuses:
+            raise RetryableHTTPError(
+                response.status,
+                parse_retry_after(response.headers.get("Retry-After"))
+            )
+        else:
+            metadata.error = f"HTTP {response.status}"
+    
+    if metrics is not None:
+        metrics.record(
+            time.perf_counter() - start_time,
+            metadata.status_code,
+            nbytes,
+            error=metadata.error is not None
+        )
+    return metadata
+
+
+async def _extract_head_async(
+    response: aiohttp.ClientResponse,
+    url: str,
+    max_head_bytes: int
+) -> tuple[PageMetadata, int]:
+    """Stream the response body until the head is parsed, then close it."""
+    extractor = StreamingHeadExtractor(response.charset, max_head_bytes)
+    async for chunk in response.content.iter_chunked(HEAD_CHUNK_SIZE):
+        if extractor.feed(chunk):
+            # Drop the rest of the body instead of downloading it
+            response.close()
+            break
+    return extractor.result(url), extractor.bytes_read
+
+
+async def _collect_head_async(
+    response: aiohttp.ClientResponse,
+    max_head_bytes: int
+) -> tuple[str, int]:
+    """Read the response body up to the end of the head, then close it."""
+    collector = HeadCollector(max_head_bytes)
+    async for chunk in response.content.iter_chunked(HEAD_CHUNK_SIZE):
+        if collector.feed(chunk):
+            response.close()
+            break
+    return collector.text(response.charset), collector.bytes_read
+
+
+async def _read_body_async(
+    response: aiohttp.ClientResponse,
+    max_bytes: int,
+    hasher: Optional[BodyTextHasher] = None
+) -> bytes:
+    """Read the whole decoded body, closing the connection if it passes ``max_bytes``."""
+    body = DecodedBody(max_bytes)
+    try:
+        async for chunk in response.content.iter_chunked(HEAD_CHUNK_SIZE):
+            body.feed(chunk)
+            if hasher is not None:
+                hasher.feed_bytes(chunk)
+    except ResponseTooLargeError:
+        response.close()
+        raise
+    return body.getvalue()
+
+
+def make_connector(
+    max_concurrent: int,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    dns_cache: Optional[DnsCache] = None
+) -> aiohttp.TCPConnector:
+    """
+    Create a TCPConnector tuned for crawling many hosts.
+    
+    Connections are kept alive between requests to the same host and DNS
+    answers are cached, while the pool size matches the scheduler limits.
+    
+    Args:
+        max_concurrent: Global connection limit
+        per_host_limit: Connection limit per host
+        dns_cache: Shared DNS cache to resolve hosts from, replacing the
+            connector's own cache
+    
+    Returns:
+        Configured aiohttp TCPConnector
+    """
+    if dns_cache is not None:
+        return aiohttp.TCPConnector(
+            limit=max_concurrent,
+            limit_per_host=per_host_limit,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            resolver=CachingResolver(dns_cache),
+            use_dns_cache=False
+        )
+    return aiohttp.TCPConnector(
+        limit=max_concurrent,
+        limit_per_host=per_host_limit,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL
+    )
+
+
+def default_retry_policy() -> RetryPolicy:
+    """
+    Create the retry policy used by the async scraper when none is given.
+    
+    Timeouts, dropped connections and retryable statuses (429/5xx) are
+    retried; DNS and TLS certificate failures are fatal. A budget limits
+    retries to about 20% of requests per crawl.
+    """
+    fatal_on: tuple[type[BaseException], ...] = (aiohttp.ClientConnectorCertificateError,)
+    dns_error = getattr(aiohttp, "ClientConnectorDNSError", None)
+    if dns_error is not None:
+        fatal_on += (dns_error,)
+    return RetryPolicy(
+        max_attempts=3,
+        base_delay=0.5,
+        max_delay=30.0,
+        retry_on=(
+            asyncio.TimeoutError,
+            aiohttp.ClientConnectionError,
+            aiohttp.ClientPayloadError,
+            RetryableHTTPError,
+        ),
+        fatal_on=fatal_on,
+        budget=RetryBudget(ratio=0.2, min_retries=10)
+    )
+
+
+def _fetch_options(**options) -> dict:
+    """Drop unset options so ``fetch_url_async`` defaults apply."""
+    return {name: value for name, value in options.items() if value is not None}
+
+
+async def _scrape_indexed(
+    urls: Iterable[str],
+    max_concurrent: int,
+    per_host_limit: int,
+    queue_size: int | None,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    progress: Optional[CrawlProgress] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    **fetch_options
+) -> AsyncIterator[tuple[int, PageMetadata]]:
+    """
+    Run a bounded worker pool over ``urls``, yielding ``(index, result)`` pairs.
+    
+    A producer feeds URLs into a bounded ``HostScheduler`` and
+    ``max_concurrent`` workers drain it, so at most ``queue_size`` URLs are
+    buffered at any time regardless of how many URLs are supplied. The
+    scheduler rotates between hosts and caps in-flight requests per host,
+    so one slow host cannot take every worker. ``fetch_options`` are passed
+    through to ``fetch_url_async``.
+    
+    Failed attempts that ``retry_policy`` allows to retry are re-queued on
+    the scheduler after their backoff delay rather than sleeping in the
+    worker, so waiting retries never hold a worker or host slot. Likewise
+    ``rate_limiter`` parks rate-limited hosts inside the scheduler.
+    ``progress`` is updated as URLs are queued, fetched and retried.
+    
+    Requests go through ``session`` if given (its connector's limits
+    apply); otherwise a session is created for this crawl and closed after.
+    """
+    if session is None:
+        connector = make_connector(max_concurrent, per_host_limit, dns_cache)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async for item in _scrape_indexed(
+                urls, max_concurrent, per_host_limit, queue_size, retry_policy,
+                rate_limiter, dns_cache, progress, session, **fetch_options
+            ):
+                yield item
+        return
+    
+    retry_policy = retry_policy or default_retry_policy()
+    retry_statuses = retry_policy.retry_statuses
+    metrics = fetch_options.get("metrics")
+    # Attempts made so far for URLs that are waiting to be retried
+    attempts: dict[int, int] = {}
+    scheduler = HostScheduler(
+        per_host_limit=per_host_limit,
+        max_pending=queue_size or max(DEFAULT_QUEUE_SIZE, max_concurrent * 2),
+        rate_limiter=rate_limiter
+    )
+    result_queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
+    
+    async def producer() -> None:
+        try:
+            for item in enumerate(urls):
+                await scheduler.put(item)
+                if progress is not None:
+                    progress.enqueue()
+        finally:
+            scheduler.close()
+    
+    async def worker(session: aiohttp.ClientSession) -> None:
+        while (item := await scheduler.get()) is not None:
+            index, url = item
+            start_time = time.perf_counter()
+            retry_policy.record_request()
+            if progress is not None:
+                progress.start_request()
+            result = None
+            try:
+                result = await _fetch_page(
+                    session, url, retry_statuses=retry_statuses, **fetch_options
+                )
+            except Exception as e:
+                _record_failure(metrics, e, start_time)
+                attempt = attempts.pop(index, 0) + 1
+                delay = retry_policy.next_delay(attempt, e)
+                if delay is None:
+                    result = _error_metadata(url, e, start_time)
+                else:
+                    attempts[index] = attempt
+                    logger.warning(
+                        f"Attempt {attempt}/{retry_policy.max_attempts} failed for {url}: "
+                        f"{e or type(e).__name__}. Retrying in {delay:.2f}s..."
+                    )
+                    scheduler.defer(item, delay)
+                    if progress is not None:
+                        progress.requeue()
+            finally:
+                scheduler.done(item)
+            if result is not None:
+                attempts.pop(index, None)
+                if progress is not None:
+                    progress.finish_request(error=result.error is not None)
+                await result_queue.put((index, result))
+        await result_queue.put(_WORKER_DONE)
+    
+    tasks = [asyncio.create_task(producer())]
+    tasks.extend(
+        asyncio.create_task(worker(session))
+        for _ in range(max_concurrent)
+    )
+    
+    try:
+        running = max_concurrent
+        while running:
+            item = await result_queue.get()
+            if item is _WORKER_DONE:
+                running -= 1
+            else:
+                yield item
+        # Surface producer errors (e.g. a failing URL iterator)
+        await tasks[0]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def scrape_async_iter(
+    urls: Iterable[str],
+    max_concurrent: int = 10,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    queue_size: int | None = None,
+    parse_pool: Optional[ParsePool] = None,
+    cache: Optional[ResponseCache] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    metrics: Optional[MetricsCollector] = None,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    max_decoded_bytes: Optional[int] = None,
+    progress: Optional[CrawlProgress] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    fingerprint_body: bool = False
+) -> AsyncIterator[PageMetadata]:
+    """
+    Scrape URLs asynchronously, yielding results as they complete.
+    
+    Unlike ``scrape_async`` this never materialises a task per URL or the
+    full result list, so memory stays flat for arbitrarily long URL lists.
+    
+    Args:
+        urls: Iterable of URLs to scrape (may be a lazy generator)
+        max_concurrent: Number of worker coroutines (global request cap)
+        per_host_limit: Maximum concurrent requests to any single host
+        queue_size: Maximum number of buffered URLs (defaults to
+            ``DEFAULT_QUEUE_SIZE`` or ``2 * max_concurrent``, whichever
+            is larger)
+        parse_pool: Parse pages in this executor pool instead of on the
+            event loop
+        cache: Conditional-request cache shared across crawls
+        retry_policy: Retry policy (defaults to ``default_retry_policy()``)
+        metrics: Collector to record per-request metrics into
+        checkpoint: Skip URLs it has completed and record each new result;
+            only newly fetched results are yielded
+        rate_limiter: Per-host requests-per-second limits
+        dns_cache: Shared DNS cache; hosts are resolved on first use
+        max_decoded_bytes: Maximum decompressed size of a response body
+        progress: Live progress tracker to update as URLs are fetched
+        session: Existing session to send requests through; by default a
+            session is opened for this crawl and closed at the end
+        fingerprint_body: Read each whole body and SimHash its text into
+            ``body_simhash``, so ``src.dedup`` can flag near-duplicate pages
+    
+    Yields:
+        PageMetadata objects in completion order
+    
+    Usage:
+        async for result in scrape_async_iter(urls, max_concurrent=50):
+            process(result)
+    """
+    if checkpoint is not None:
+        urls = (url for url in urls if url not in checkpoint)
+    async for _, result in _scrape_indexed(
+        urls, max_concurrent, per_host_limit, queue_size, retry_policy, rate_limiter, dns_cache,
+        progress, session,
+        **_fetch_options(
+            parse_pool=parse_pool, cache=cache, metrics=metrics,
+            max_decoded_bytes=max_decoded_bytes, fingerprint_body=fingerprint_body
+        )
+    ):
+        if checkpoint is not None:
+            checkpoint.record(result)
+        yield result
+
+
+async def scrape_async(
+    urls: list[str],
+    max_concurrent: int = 10,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    parse_pool: Optional[ParsePool] = None,
+    cache: Optional[ResponseCache] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    metrics: Optional[MetricsCollector] = None,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    max_decoded_bytes: Optional[int] = None,
+    progress: Optional[CrawlProgress] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    fingerprint_body: bool = False
+) -> list[PageMetadata]:
+    """
+    Scrape URLs asynchronously using asyncio and aiohttp.
+    
+    Args:
+        urls: List of URLs to scrape
+        max_concurrent: Maximum number of concurrent requests
+        per_host_limit: Maximum concurrent requests to any single host
+        parse_pool: Parse pages in this executor pool instead of on the
+            event loop
+        cache: Conditional-request cache shared across crawls
+        retry_policy: Retry policy (defaults to ``default_retry_policy()``)
+        metrics: Collector to record per-request metrics into
+        checkpoint: Skip URLs it has completed and record each new result
+            as soon as it finishes
+        rate_limiter: Per-host requests-per-second limits
+        dns_cache: Shared DNS cache; every host is resolved concurrently
+            before the crawl starts
+        max_decoded_bytes: Maximum decompressed size of a response body
+        progress: Live progress tracker to update as URLs are fetched
+        session: Existing session to send requests through; by default a
+            session is opened for this crawl and closed at the end
+        fingerprint_body: Read each whole body and SimHash its text into
+            ``body_simhash``, so ``src.dedup`` can flag near-duplicate pages
+    
+    Returns:
+        List of PageMetadata objects, in the same order as ``urls``
+    """
+    logger.info(f"Starting async scraping of {len(urls)} URLs with max {max_concurrent} concurrent")
+    start_time = time.perf_counter()
+    
+    final_results: list[PageMetadata | None] = [None] * len(urls)
+    pending = list(enumerate(urls))
+    if checkpoint is not None:
+        final_results, pending = checkpoint.split(urls)
+        logger.info(f"Resuming: {len(urls) - len(pending)} URLs already completed")
+    if dns_cache is not None:
+        await dns_cache.pre_resolve(url for _, url in pending)
+    if progress is not None:
+        progress.add_total(len(pending))
+    
+    async for local_index, result in _scrape_indexed(
+        (url for _, url in pending), max_concurrent, per_host_limit, None,
+        retry_policy, rate_limiter, dns_cache, progress, session,
+        **_fetch_options(
+            parse_pool=parse_pool, cache=cache, metrics=metrics,
+            max_decoded_bytes=max_decoded_bytes, fingerprint_body=fingerprint_body
+        )
+    ):
+        final_results[pending[local_index][0]] = result
+        if checkpoint is not None:
+            checkpoint.record(result)
+    
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Async scraping completed in {elapsed:.2f}s")
+    
+    # Every URL has a result by now; the None placeholders are all filled
+    return [result for result in final_results if result is not None]
+
+
+class AsyncScraper:
+    """
+    Reusable async scraper for long-running services.
+    
+    Owns one ``aiohttp.ClientSession`` and its connector (connection pool,
+    keep-alive connections and DNS cache) plus the limits, retry policy
+    and caches, and reuses them for every ``scrape()`` call. Repeated small
+    crawls skip session and connector setup and keep their warm
+    connections. Calls may overlap; they share the connector's limits.
+    
+    Usage:
+        async with AsyncScraper(max_concurrent=50) as scraper:
+            results = await scraper.scrape(urls)
+            async for result in scraper.scrape_iter(more_urls):
+                ...
+    """
+    
+    def __init__(
+        self,
+        max_concurrent: int = 10,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        parse_pool: Optional[ParsePool] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[MetricsCollector] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        dns_cache: Optional[DnsCache] = None,
+        max_decoded_bytes: Optional[int] = None,
+        fingerprint_body: bool = False
+    ):
+        """
+        Args:
+            max_concurrent: Workers per crawl and the connector's global
+                connection limit
+            per_host_limit: Maximum concurrent requests to any single host
+            parse_pool: Parse pages in this executor pool instead of on the
+                event loop
+            cache: Conditional-request cache shared across crawls
+            retry_policy: Retry policy (defaults to ``default_retry_policy()``);
+                its retry budget spans all crawls
+            metrics: Collector to record per-request metrics into
+            rate_limiter: Per-host requests-per-second limits, kept across crawls
+            dns_cache: Shared DNS cache; each crawl pre-resolves its hosts
+            max_decoded_bytes: Maximum decompressed size of a response body
+            fingerprint_body: Read each whole body and SimHash its text into
+                ``body_simhash``, so ``src.dedup`` can flag near-duplicate pages
+        """
+        self.max_concurrent = max_concurrent
+        self.per_host_limit = per_host_limit
+        self.parse_pool = parse_pool
+        self.cache = cache
+        self.retry_policy = retry_policy or default_retry_policy()
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.dns_cache = dns_cache
+        self.max_decoded_bytes = max_decoded_bytes
+        self.fingerprint_body = fingerprint_body
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    @property
+    def started(self) -> bool:
+        return self._session is not None and not self._session.closed
+    
+    async def start(self) -> "AsyncScraper":
+        """Open the session and connector; must run inside the event loop that will use them."""
+        if not self.started:
+            connector = make_connector(self.max_concurrent, self.per_host_limit, self.dns_cache)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self
+    
+    async def aclose(self) -> None:
+        """Close the session and every pooled connection."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> "AsyncScraper":
+        return await self.start()
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    def _require_session(self) -> aiohttp.ClientSession:
+        session = self._session
+        if session is None or session.closed:
+            raise RuntimeError("AsyncScraper is not started; call start() or use 'async with'")
+        return session
+    
+    def _options(self) -> dict:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "per_host_limit": self.per_host_limit,
+            "parse_pool": self.parse_pool,
+            "cache": self.cache,
+            "retry_policy": self.retry_policy,
+            "metrics": self.metrics,
+            "rate_limiter": self.rate_limiter,
+            "dns_cache": self.dns_cache,
+            "max_decoded_bytes": self.max_decoded_bytes,
+            "fingerprint_body": self.fingerprint_body,
+        }
+    
+    async def scrape(
+        self,
+        urls: list[str],
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        progress: Optional[CrawlProgress] = None
+    ) -> list[PageMetadata]:
+        """
+        Scrape ``urls`` with the shared session; see ``scrape_async``.
+        
+        Raises:
+            RuntimeError: If the scraper has not been started
+        """
+        return await scrape_async(
+            urls, checkpoint=checkpoint, progress=progress,
+            session=self._require_session(), **self._options()
+        )
+    
+    def scrape_iter(
+        self,
+        urls: Iterable[str],
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        progress: Optional[CrawlProgress] = None,
+        queue_size: int | None = None
+    ) -> AsyncIterator[PageMetadata]:
+        """
+        Stream results for ``urls`` with the shared session; see ``scrape_async_iter``.
+        
+        Raises:
+            RuntimeError: If the scraper has not been started
+        """
+        return scrape_async_iter(
+            urls, queue_size=queue_size, checkpoint=checkpoint, progress=progress,
+            session=self._require_session(), **self._options()
+        )
+
+
+def run_async(main: Coroutine[Any, Any, T], use_uvloop: bool = True) -> T:
+    """
+    Run a coroutine in a new event loop, using uvloop when it is installed.
+    
+    Like ``asyncio.run``, for scripts that drive an ``AsyncScraper``;
+    services that already have a running loop just ``await`` it.
+    
+    Args:
+        main: Coroutine to run
+        use_uvloop: Use uvloop if available (falls back to the default loop)
+    
+    Returns:
+        The coroutine's result
+    """
+    loop_factory = uvloop.new_event_loop if use_uvloop and uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
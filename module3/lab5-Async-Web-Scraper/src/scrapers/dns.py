@@ -0,0 +1,262 @@
+"""DNS pre-resolution and a shared TTL cache for both HTTP clients."""
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from typing import Iterable, Optional
+from aiohttp.abc import AbstractResolver, ResolveResult
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from .scheduler import host_of
+
+logger = logging.getLogger(__name__)
+
+DNS_CACHE_TTL = 300
+PRE_RESOLVE_CONCURRENCY = 50
+
+# (address family, IP address) pairs for one host
+Addresses = list[tuple[int, str]]
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class DnsCache:
+    """
+    In-process host -> IP address cache with a TTL, shared across clients.
+
+    Fill it concurrently before a crawl with ``pre_resolve`` so no request
+    (and no worker thread) waits on a lookup, then hand it to
+    ``CachingResolver`` for aiohttp or ``CachedDnsAdapter`` for requests.
+    Hosts missing from the cache are resolved on first use. The cache is
+    safe to share between threads.
+
+    Usage:
+        dns_cache = DnsCache()
+        await dns_cache.pre_resolve(urls)
+        results = await scrape_async(urls, dns_cache=dns_cache)
+    """
+
+    def __init__(self, ttl: float = DNS_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, Addresses]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> Optional[Addresses]:
+        """Return the cached addresses for ``host``, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[host]
+                return None
+            return entry[1]
+
+    def put(self, host: str, addresses: Addresses) -> None:
+        """Cache addresses for ``host`` for ``ttl`` seconds."""
+        with self._lock:
+            self._entries[host] = (time.monotonic() + self.ttl, addresses)
+
+    def invalidate(self, host: str) -> None:
+        """Drop ``host`` so its next lookup goes to the resolver."""
+        with self._lock:
+            self._entries.pop(host, None)
+
+    @staticmethod
+    def _addresses(infos) -> Addresses:
+        addresses: dict[tuple[int, str], None] = {}
+        for family, _, _, _, sockaddr in infos:
+            addresses.setdefault((int(family), sockaddr[0]), None)
+        return list(addresses)
+
+    def resolve(self, host: str) -> Addresses:
+        """
+        Resolve ``host`` in the calling thread, using the cache if possible.
+
+        Raises:
+            socket.gaierror: If the host cannot be resolved
+        """
+        addresses = self.get(host)
+        if addresses is None:
+            addresses = self._addresses(socket.getaddrinfo(host, None, type=socket.SOCK_STREAM))
+            self.put(host, addresses)
+        return addresses
+
+    async def resolve_async(self, host: str) -> Addresses:
+        """Resolve ``host`` without blocking the event loop, using the cache if possible."""
+        addresses = self.get(host)
+        if addresses is None:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, None, type=socket.SOCK_STREAM
+            )
+            addresses = self._addresses(infos)
+            self.put(host, addresses)
+        return addresses
+
+    async def pre_resolve(
+        self,
+        urls: Iterable[str],
+        max_concurrent: int = PRE_RESOLVE_CONCURRENCY
+    ) -> int:
+        """
+        Resolve every unique host in ``urls`` concurrently.
+
+        Lookup failures are logged and left for the fetch to report.
+
+        Args:
+            urls: URLs about to be crawled
+            max_concurrent: Maximum lookups in flight
+
+        Returns:
+            Number of hosts resolved
+        """
+        hosts = [host for host in {host_of(url) for url in urls} if host and not _is_ip(host)]
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def resolve(host: str) -> bool:
+            async with semaphore:
+                try:
+                    await self.resolve_async(host)
+                    return True
+                except OSError as e:
+                    logger.debug(f"Pre-resolution failed for {host}: {e}")
+                    return False
+
+        start_time = time.perf_counter()
+        resolved = sum(await asyncio.gather(*(resolve(host) for host in hosts)))
+        logger.info(
+            f"Pre-resolved {resolved}/{len(hosts)} hosts in "
+            f"{time.perf_counter() - start_time:.2f}s"
+        )
+        return resolved
+
+    def pre_resolve_sync(
+        self,
+        urls: Iterable[str],
+        max_concurrent: int = PRE_RESOLVE_CONCURRENCY
+    ) -> int:
+        """Run ``pre_resolve`` from synchronous code (outside an event loop)."""
+        return asyncio.run(self.pre_resolve(urls, max_concurrent))
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled; resolved entries travel with the cache
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class CachingResolver(AbstractResolver):
+    """aiohttp resolver that answers from a ``DnsCache``."""
+
+    def __init__(self, cache: DnsCache):
+        self.cache = cache
+
+    async def resolve(
+        self,
+        host: str,
+        port: int = 0,
+        family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        addresses = await self.cache.resolve_async(host)
+        results: list[ResolveResult] = [
+            {
+                "hostname": host,
+                "host": address,
+                "port": port,
+                "family": address_family,
+                "proto": socket.IPPROTO_TCP,
+                "flags": socket.AI_NUMERICHOST,
+            }
+            for address_family, address in addresses
+            if family == socket.AF_UNSPEC or address_family == family
+        ]
+        if not results:
+            raise OSError(f"No addresses for {host} in family {family!r}")
+        return results
+
+    async def close(self) -> None:
+        pass
+
+
+class _CachedDnsConnectionMixin:
+    """
+    Connect to a cached address while keeping the hostname for Host and SNI.
+
+    Like urllib3's own lookup, each address is tried in turn until one
+    connects, so a host whose first record is unreachable (an IPv6
+    address on an IPv4-only network, say) still works.
+    """
+
+    dns_cache: DnsCache
+
+    def _new_conn(self):
+        host = self._dns_host
+        lookup = host.rstrip(".")
+        if _is_ip(lookup):
+            return super()._new_conn()
+        try:
+            addresses = self.dns_cache.resolve(lookup)
+        except OSError:
+            # Let urllib3 raise its usual NameResolutionError
+            return super()._new_conn()
+
+        try:
+            for _, address in addresses[:-1]:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (OSError, ConnectTimeoutError) as e:
+                    logger.debug(f"Connecting to {lookup} at {address} failed: {e}")
+            self._dns_host = addresses[-1][1]
+            return super()._new_conn()
+        except Exception:
+            # Every cached address failed and may be stale; look them up again next time
+            self.dns_cache.invalidate(lookup)
+            raise
+        finally:
+            self._dns_host = host
+
+
+class CachedDnsAdapter(HTTPAdapter):
+    """
+    requests transport adapter whose connections resolve hosts via a ``DnsCache``.
+
+    Usage:
+        session.mount("https://", CachedDnsAdapter(dns_cache, pool_maxsize=10))
+    """
+
+    def __init__(self, dns_cache: DnsCache, **kwargs):
+        self.dns_cache = dns_cache
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        attrs = {"dns_cache": self.dns_cache}
+        http_connection = type(
+            "CachedDnsHTTPConnection", (_CachedDnsConnectionMixin, HTTPConnection), attrs
+        )
+        https_connection = type(
+            "CachedDnsHTTPSConnection", (_CachedDnsConnectionMixin, HTTPSConnection), attrs
+        )
+        # A new dict: the default one is shared by every PoolManager
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("CachedDnsHTTPConnectionPool", (HTTPConnectionPool,),
+                         {"ConnectionCls": http_connection}),
+            "https": type("CachedDnsHTTPSConnectionPool", (HTTPSConnectionPool,),
+                          {"ConnectionCls": https_connection}),
+        }
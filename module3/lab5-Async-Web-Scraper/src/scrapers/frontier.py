@@ -0,0 +1,266 @@
+"""URL frontier: normalization, de-duplication and host-aware ordering."""
+
+import hashlib
+import math
+from collections import deque
+from typing import Iterable, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from .scheduler import host_of
+
+# Query parameters that only track the visitor and never change the page
+TRACKING_PARAMS = frozenset({
+    "gclid", "dclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "_ga", "_gl", "yclid", "ref_src",
+})
+TRACKING_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str, strip_trailing_slash: bool = True) -> str:
+    """
+    Reduce trivially different spellings of a URL to one canonical form.
+
+    Lower-cases the scheme and host, drops default ports, fragments and
+    tracking parameters (``utm_*``, ``gclid``, ...), sorts the remaining
+    query parameters and, optionally, removes a trailing slash from
+    non-root paths.
+
+    Args:
+        url: URL to normalize
+        strip_trailing_slash: Treat ``/page/`` and ``/page`` as the same URL
+
+    Returns:
+        Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host
+    if parts.username or parts.password:
+        credentials = parts.username or ""
+        if parts.password:
+            credentials += f":{parts.password}"
+        netloc = f"{credentials}@{netloc}"
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+
+    path = parts.path or "/"
+    if strip_trailing_slash and len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def _digest(url: str) -> bytes:
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic set for de-duplicating very large URL lists.
+
+    Memory is about ``1.44 * log2(1 / error_rate)`` bits per expected item
+    (~1.8 MB for a million URLs at 0.1%) no matter how long the URLs are.
+    Membership tests can return false positives at roughly
+    ``error_rate`` once ``capacity`` items are added, but never false
+    negatives, so a URL may occasionally be skipped but never fetched twice.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = _digest(item)
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+
+        Returns:
+            True if the item was not (probably) present before
+        """
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class HashSet:
+    """
+    Exact set that stores 64-bit URL digests instead of the strings.
+
+    Uses a fraction of the memory of a ``set[str]`` of URLs; a collision
+    needs billions of URLs to become likely.
+    """
+
+    def __init__(self):
+        self._hashes: set[int] = set()
+
+    def add(self, item: str) -> bool:
+        """Add an item; returns True if it was not present before."""
+        key = int.from_bytes(_digest(item)[:8], "little")
+        if key in self._hashes:
+            return False
+        self._hashes.add(key)
+        return True
+
+    def __contains__(self, item: str) -> bool:
+        return int.from_bytes(_digest(item)[:8], "little") in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+
+class UrlFrontier:
+    """
+    Queue of URLs to crawl that drops duplicates and spreads hosts out.
+
+    Each URL's ``normalize_url`` form is checked against a seen-set, so
+    each page is fetched at most once per frontier. The normalized form is
+    only the de-duplication key: the frontier hands out the first URL
+    added for each key exactly as it was given, since rewrites such as
+    dropping a trailing slash can change which resource a server returns
+    and results should carry the URL the caller submitted. Pending
+    URLs are kept per host and handed out round-robin, so a bounded work
+    queue always holds a mix of hosts and per-host limits do not stall
+    the crawl; ``by_host=True`` instead drains one host at a time, which
+    maximises connection reuse for the sequential scraper.
+
+    Usage:
+        frontier = UrlFrontier(raw_urls)
+        results = await scrape_async(frontier.drain())
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str] = (),
+        bloom_capacity: Optional[int] = None,
+        error_rate: float = 0.001,
+        normalize: bool = True
+    ):
+        """
+        Args:
+            urls: Initial URLs to add
+            bloom_capacity: Use a Bloom filter sized for this many URLs
+                instead of an exact set (for very large crawls)
+            error_rate: Bloom filter false-positive rate
+            normalize: De-duplicate URLs by their normalized form rather
+                than their exact spelling
+        """
+        self.normalize = normalize
+        self.seen = BloomFilter(bloom_capacity, error_rate) if bloom_capacity else HashSet()
+        self.duplicates = 0
+        self._queues: dict[str, deque[str]] = {}
+        self._hosts: deque[str] = deque()
+        self._pending = 0
+        self.extend(urls)
+
+    def add(self, url: str) -> bool:
+        """
+        Queue a URL unless it (or an equivalent spelling) was already added.
+
+        Returns:
+            True if the URL was queued
+        """
+        key = normalize_url(url) if self.normalize else url
+        if not self.seen.add(key):
+            self.duplicates += 1
+            return False
+
+        host = host_of(key)
+        queue = self._queues.get(host)
+        if queue is None:
+            queue = self._queues[host] = deque()
+            self._hosts.append(host)
+        queue.append(url)
+        self._pending += 1
+        return True
+
+    def extend(self, urls: Iterable[str]) -> int:
+        """Add several URLs; returns how many were queued."""
+        return sum(self.add(url) for url in urls)
+
+    def pop(self) -> Optional[str]:
+        """Return the next URL, rotating across hosts, or None if empty."""
+        if not self._hosts:
+            return None
+        host = self._hosts.popleft()
+        queue = self._queues[host]
+        url = queue.popleft()
+        self._pending -= 1
+        if queue:
+            self._hosts.append(host)
+        else:
+            del self._queues[host]
+        return url
+
+    def __iter__(self) -> Iterator[str]:
+        """Consume the frontier round-robin across hosts."""
+        while (url := self.pop()) is not None:
+            yield url
+
+    def drain(self, by_host: bool = False) -> list[str]:
+        """
+        Remove and return every pending URL.
+
+        Args:
+            by_host: Group each host's URLs together instead of
+                interleaving hosts
+
+        Returns:
+            List of URLs
+        """
+        if not by_host:
+            return list(self)
+        urls = [url for host in self._hosts for url in self._queues[host]]
+        self._queues.clear()
+        self._hosts.clear()
+        self._pending = 0
+        return urls
+
+    def __len__(self) -> int:
+        """Number of URLs still pending."""
+        return self._pending
+
+    def __contains__(self, url: str) -> bool:
+        """Whether a URL (or an equivalent spelling) was ever added."""
+        return (normalize_url(url) if self.normalize else url) in self.seen
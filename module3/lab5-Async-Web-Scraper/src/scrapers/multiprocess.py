@@ -0,0 +1,225 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import time
+import zlib
+from typing import Iterator, Optional
+from ..checkpoint import CrawlCheckpoint
+from ..models import PageMetadata
+from ..utils import RetryPolicy
+from .async_scraper import DEFAULT_PER_HOST_LIMIT, _scrape_indexed
+from .dns import DnsCache
+from .ratelimit import HostRateLimiter
+from .scheduler import host_of
+
+logger = logging.getLogger(__name__)
+
+# Results are sent back to the parent in batches to amortise pickling
+RESULT_BATCH_SIZE = 50
+# How often the parent checks for crashed workers while waiting
+_POLL_INTERVAL = 1.0
+
+
+def shard_urls(urls: list[str], shards: int) -> list[list[tuple[int, str]]]:
+    """
+    Split URLs into shards, keeping every URL of a host in the same shard.
+
+    Keeping hosts together lets each process reuse its warm connections
+    and enforce its per-host limit for the whole crawl.
+
+    Args:
+        urls: List of URLs
+        shards: Number of shards
+
+    Returns:
+        One list of ``(index, url)`` pairs per shard
+    """
+    result: list[list[tuple[int, str]]] = [[] for _ in range(shards)]
+    for index, url in enumerate(urls):
+        shard = zlib.crc32(host_of(url).encode()) % shards
+        result[shard].append((index, url))
+    return result
+
+
+def _worker_main(
+    shard_id: int,
+    shard: list[tuple[int, str]],
+    result_queue,
+    max_concurrent: int,
+    per_host_limit: int,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    fingerprint_body: bool = False
+) -> None:
+    """Scrape one shard in its own event loop, streaming results to the parent."""
+    indices = [index for index, _ in shard]
+
+    async def run() -> None:
+        batch = []
+        async for local_index, result in _scrape_indexed(
+            (url for _, url in shard), max_concurrent, per_host_limit, None,
+            retry_policy=retry_policy, rate_limiter=rate_limiter, dns_cache=dns_cache,
+            fingerprint_body=fingerprint_body
+        ):
+            batch.append((indices[local_index], result))
+            if len(batch) >= RESULT_BATCH_SIZE:
+                result_queue.put(("results", batch))
+                batch = []
+        if batch:
+            result_queue.put(("results", batch))
+
+    error = None
+    try:
+        asyncio.run(run())
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        result_queue.put(("done", shard_id, error))
+
+
+def iter_multiprocess(
+    urls: list[str],
+    processes: Optional[int] = None,
+    max_concurrent: int = 10,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    fingerprint_body: bool = False
+) -> Iterator[tuple[int, PageMetadata]]:
+    """
+    Run one async scraper per process and yield results as they arrive.
+
+    Args:
+        urls: List of URLs to scrape
+        processes: Number of worker processes (defaults to the CPU count)
+        max_concurrent: Concurrent requests per process
+        per_host_limit: Maximum concurrent requests to any single host
+        rate_limiter: Per-host requests-per-second limits; each process
+            gets a copy, which is exact because a host's URLs all go to
+            the same process
+        dns_cache: DNS cache copied into each process with its entries
+        retry_policy: Retry policy for every process (defaults to
+            ``default_retry_policy()``)
+        fingerprint_body: Read each whole body and SimHash its text into
+            ``body_simhash``, so ``src.dedup`` can flag near-duplicate pages
+
+    Yields:
+        ``(index, PageMetadata)`` pairs in completion order, where ``index``
+        is the URL's position in ``urls``
+
+    Raises:
+        RuntimeError: If a worker process fails or dies
+    """
+    processes = max(1, min(processes or os.cpu_count() or 1, len(urls) or 1))
+    shards = shard_urls(urls, processes)
+    result_queue: "multiprocessing.Queue[tuple]" = multiprocessing.Queue()
+
+    workers = {}
+    for shard_id, shard in enumerate(shards):
+        if not shard:
+            continue
+        process = multiprocessing.Process(
+            target=_worker_main,
+            args=(
+                shard_id, shard, result_queue, max_concurrent, per_host_limit,
+                rate_limiter, dns_cache, retry_policy, fingerprint_body
+            ),
+            daemon=True
+        )
+        process.start()
+        workers[shard_id] = process
+
+    try:
+        while workers:
+            try:
+                message = result_queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                for shard_id, process in workers.items():
+                    if not process.is_alive() and result_queue.empty():
+                        raise RuntimeError(
+                            f"Scraper process for shard {shard_id} exited "
+                            f"with code {process.exitcode}"
+                        )
+                continue
+
+            if message[0] == "results":
+                yield from message[1]
+            else:
+                _, shard_id, error = message
+                workers.pop(shard_id).join()
+                if error:
+                    raise RuntimeError(f"Scraper process for shard {shard_id} failed: {error}")
+    finally:
+        for process in workers.values():
+            process.terminate()
+            process.join()
+
+
+def scrape_multiprocess(
+    urls: list[str],
+    processes: Optional[int] = None,
+    max_concurrent: int = 10,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    fingerprint_body: bool = False
+) -> list[PageMetadata]:
+    """
+    Scrape URLs with several processes, each running its own event loop.
+
+    URLs are sharded by host across ``processes`` workers; each worker runs
+    the async scraper so parsing and event-loop overhead are spread over
+    multiple cores.
+
+    Args:
+        urls: List of URLs to scrape
+        processes: Number of worker processes (defaults to the CPU count)
+        max_concurrent: Concurrent requests per process
+        per_host_limit: Maximum concurrent requests to any single host
+        checkpoint: Skip URLs it has completed and record each new result
+            as it arrives in the parent process
+        rate_limiter: Per-host requests-per-second limits
+        dns_cache: DNS cache; every host is resolved once in the parent
+            before the workers start, and the answers are shared with them
+        retry_policy: Retry policy for every process (defaults to
+            ``default_retry_policy()``)
+        fingerprint_body: Read each whole body and SimHash its text into
+            ``body_simhash``, so ``src.dedup`` can flag near-duplicate pages
+
+    Returns:
+        List of PageMetadata objects, in the same order as ``urls``
+    """
+    logger.info(
+        f"Starting multi-process scraping of {len(urls)} URLs with "
+        f"{processes or os.cpu_count()} processes x {max_concurrent} concurrent"
+    )
+    start_time = time.perf_counter()
+
+    results: list[PageMetadata | None] = [None] * len(urls)
+    pending = list(enumerate(urls))
+    if checkpoint is not None:
+        results, pending = checkpoint.split(urls)
+        logger.info(f"Resuming: {len(urls) - len(pending)} URLs already completed")
+    
+    remaining = [url for _, url in pending]
+    if dns_cache is not None:
+        dns_cache.pre_resolve_sync(remaining)
+    for local_index, result in iter_multiprocess(
+        remaining, processes, max_concurrent, per_host_limit, rate_limiter, dns_cache,
+        retry_policy, fingerprint_body
+    ):
+        results[pending[local_index][0]] = result
+        if checkpoint is not None:
+            checkpoint.record(result)
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Multi-process scraping completed in {elapsed:.2f}s")
+
+    # Every URL has a result by now; the None placeholders are all filled
+    return [result for result in results if result is not None]
@@ -0,0 +1,91 @@
+"""Off-loop HTML parsing for the async scraper."""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+from ..models import PageMetadata
+from ..parsers import extract_metadata_from_html, get_parser_backend
+
+
+def gil_disabled() -> bool:
+    """Return True when running on a free-threaded build with the GIL off."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def make_parse_executor(max_workers: Optional[int] = None) -> Executor:
+    """
+    Create the executor best suited to CPU-bound parsing on this interpreter.
+    
+    Threads run in parallel on free-threaded builds and avoid pickling,
+    otherwise a process pool is needed to use more than one core.
+    
+    Args:
+        max_workers: Number of workers (defaults to the CPU count)
+    
+    Returns:
+        ThreadPoolExecutor on free-threaded builds, else ProcessPoolExecutor
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if gil_disabled():
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parse")
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+class ParsePool:
+    """
+    Run ``extract_metadata_from_html`` in an executor instead of on the event loop.
+    
+    At most ``max_in_flight`` parse jobs are submitted at once; callers
+    beyond that wait, which applies backpressure to the fetch workers
+    instead of queueing unbounded HTML in the executor.
+    
+    Usage:
+        with ParsePool(max_workers=4) as pool:
+            results = await scrape_async(urls, parse_pool=pool)
+    """
+    
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        backend: Optional[str] = None
+    ):
+        self._owns_executor = executor is None
+        self._executor = executor or make_parse_executor(max_workers)
+        workers = max_workers or getattr(self._executor, "_max_workers", None) or 1
+        self.max_in_flight = max_in_flight or workers * 2
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        # Resolved now: worker processes do not see set_parser_backend()
+        self.backend = backend or get_parser_backend()
+    
+    async def parse(self, html: str, url: str) -> PageMetadata:
+        """
+        Parse a document in the executor.
+        
+        Args:
+            html: HTML content as string
+            url: URL of the page
+        
+        Returns:
+            PageMetadata object with extracted information
+        """
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            return await loop.run_in_executor(
+                self._executor, extract_metadata_from_html, html, url, self.backend
+            )
+    
+    def close(self) -> None:
+        """Shut down the executor if this pool created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+    
+    def __enter__(self) -> "ParsePool":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,213 @@
+"""Per-host politeness rate limiting with token buckets."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+import aiohttp
+import requests
+from .scheduler import host_of
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 2
+ROBOTS_TIMEOUT = 10
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate`` tokens per second.
+
+    Holds at most ``burst`` tokens, so a host idle for a while can take
+    ``burst`` requests back to back before being held to ``rate``.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def try_acquire(self, now: Optional[float] = None) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds until one will be
+        """
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class HostRateLimiter:
+    """
+    Cap requests per second separately for every host.
+
+    Each host gets its own token bucket, created on first use; hosts never
+    wait on each other. ``try_acquire`` is a dictionary lookup and a few
+    float operations under a short lock, so one limiter can be shared by
+    every thread of ``scrape_threaded`` and by the async scheduler, which
+    parks a rate-limited host instead of holding a worker on it.
+
+    Usage:
+        limiter = HostRateLimiter(rate=2, burst=4)
+        limiter.load_robots(urls)  # optional: honour robots.txt Crawl-delay
+        results = scrape_threaded(urls, rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        host_rates: Optional[dict[str, tuple[float, int]]] = None,
+        user_agent: str = "*"
+    ):
+        """
+        Args:
+            rate: Default requests per second per host
+            burst: Default number of requests a host may receive back to back
+            host_rates: Per-host ``(rate, burst)`` overrides
+            user_agent: User agent whose robots.txt rules apply
+        """
+        # Validate the defaults once rather than on every new host
+        TokenBucket(rate, burst)
+        self.rate = rate
+        self.burst = burst
+        self.user_agent = user_agent
+        self._host_rates: dict[str, tuple[float, int]] = dict(host_rates or {})
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def set_host_rate(self, host: str, rate: float, burst: int = 1) -> None:
+        """Override the rate and burst for one host."""
+        bucket = TokenBucket(rate, burst)
+        with self._lock:
+            self._host_rates[host] = (rate, burst)
+            self._buckets[host] = bucket
+
+    def rate_for(self, host: str) -> tuple[float, int]:
+        """Return the ``(rate, burst)`` that applies to ``host``."""
+        return self._host_rates.get(host, (self.rate, self.burst))
+
+    def try_acquire(self, host: str) -> float:
+        """
+        Take a request slot for ``host`` if one is free.
+
+        Returns:
+            0.0 if the request may go ahead, otherwise the seconds to wait
+            before trying again
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(*self.rate_for(host))
+            return bucket.try_acquire()
+
+    def wait(self, url: str) -> None:
+        """Block the calling thread until ``url``'s host may be requested."""
+        host = host_of(url)
+        while (delay := self.try_acquire(host)) > 0:
+            time.sleep(delay)
+
+    def apply_robots(self, host: str, robots_txt: str) -> Optional[float]:
+        """
+        Slow a host down to its robots.txt ``Crawl-delay``/``Request-rate``.
+
+        The limit is only ever tightened, never loosened.
+
+        Args:
+            host: Host the robots.txt belongs to
+            robots_txt: robots.txt contents
+
+        Returns:
+            The crawl delay in seconds that was applied, or None
+        """
+        parser = RobotFileParser()
+        parser.parse(robots_txt.splitlines())
+        crawl_delay = parser.crawl_delay(self.user_agent)
+        delay = float(crawl_delay) if crawl_delay is not None else 0.0
+        request_rate = parser.request_rate(self.user_agent)
+        if request_rate is not None and request_rate.requests:
+            delay = max(delay, request_rate.seconds / request_rate.requests)
+        if not delay:
+            return None
+
+        if 1 / delay < self.rate_for(host)[0]:
+            self.set_host_rate(host, 1 / delay, burst=1)
+        return delay
+
+    def load_robots(self, urls: Iterable[str], max_workers: int = 16) -> None:
+        """
+        Fetch robots.txt for every host in ``urls`` and apply its crawl delay.
+
+        Hosts are fetched concurrently; unreachable or missing robots.txt
+        files leave the default rate in place.
+        """
+        def fetch(origin: tuple[str, str]) -> None:
+            scheme, netloc = origin
+            try:
+                response = requests.get(f"{scheme}://{netloc}/robots.txt", timeout=ROBOTS_TIMEOUT)
+                if response.status_code == 200:
+                    self.apply_robots(host_of(f"{scheme}://{netloc}"), response.text)
+            except Exception as e:
+                logger.debug(f"Could not load robots.txt for {netloc}: {e}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(fetch, _origins(urls)))
+
+    async def load_robots_async(self, urls: Iterable[str], max_concurrent: int = 16) -> None:
+        """Async version of ``load_robots``."""
+        semaphore = asyncio.Semaphore(max_concurrent)
+        timeout = aiohttp.ClientTimeout(total=ROBOTS_TIMEOUT)
+
+        async def fetch(session: aiohttp.ClientSession, scheme: str, netloc: str) -> None:
+            async with semaphore:
+                try:
+                    async with session.get(f"{scheme}://{netloc}/robots.txt", timeout=timeout) as response:
+                        if response.status == 200:
+                            text = await response.text(errors="replace")
+                            self.apply_robots(host_of(f"{scheme}://{netloc}"), text)
+                except Exception as e:
+                    logger.debug(f"Could not load robots.txt for {netloc}: {e}")
+
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*(
+                fetch(session, scheme, netloc) for scheme, netloc in _origins(urls)
+            ))
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled; buckets start full in the new process
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_buckets"] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _origins(urls: Iterable[str]) -> list[tuple[str, str]]:
+    """Unique ``(scheme, netloc)`` pairs in ``urls``, in first-seen order."""
+    seen: dict[tuple[str, str], None] = {}
+    for url in urls:
+        parts = urlsplit(url)
+        if parts.netloc:
+            seen.setdefault((parts.scheme or "http", parts.netloc.lower()), None)
+    return list(seen)
@@ -0,0 +1,229 @@
+"""Host-aware work scheduling for the async scraper."""
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any, Hashable, Optional
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from .ratelimit import HostRateLimiter
+
+
+def host_of(url: str) -> str:
+    """Return the lower-cased host of ``url`` (empty string if it has none)."""
+    return urlsplit(url).hostname or ""
+
+
+class HostScheduler:
+    """
+    Async work queue that hands out items round-robin across hosts.
+
+    Each host has its own FIFO and an in-flight limit, so a slow or very
+    common host can never occupy every worker: once a host reaches
+    ``per_host_limit`` in-flight items, ``get()`` serves other hosts until
+    one of its items is marked ``done()``. The total number of queued
+    items is bounded by ``max_pending`` to keep memory flat.
+
+    With a ``rate_limiter``, a host that has used up its request rate is
+    parked until its next token is due; other hosts keep being served
+    and no worker sleeps on its behalf.
+    
+    Items are ``(key, url)`` tuples; ``key`` is opaque to the scheduler.
+
+    Usage:
+        scheduler = HostScheduler(per_host_limit=4, max_pending=1000)
+        await scheduler.put((0, "https://example.com"))
+        scheduler.close()
+        while (item := await scheduler.get()) is not None:
+            ...
+            scheduler.done(item)
+    """
+
+    def __init__(
+        self,
+        per_host_limit: int = 4,
+        max_pending: int = 1000,
+        rate_limiter: Optional["HostRateLimiter"] = None
+    ):
+        if per_host_limit < 1:
+            raise ValueError("per_host_limit must be at least 1")
+        self.per_host_limit = per_host_limit
+        self.max_pending = max_pending
+        self.rate_limiter = rate_limiter
+        self._queues: dict[str, deque] = {}
+        self._in_flight: dict[str, int] = {}
+        # Hosts that have queued items and a free slot, in service order
+        self._ready: deque[str] = deque()
+        self._ready_set: set[str] = set()
+        # Hosts waiting for their rate limit to allow another request
+        self._parked: set[str] = set()
+        self._pending = 0
+        self._active = 0
+        self._deferred = 0
+        self._closed = False
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
+
+    @property
+    def pending(self) -> int:
+        """Number of queued items not yet handed out."""
+        return self._pending
+
+    @property
+    def active(self) -> int:
+        """Number of items handed out and not yet marked done."""
+        return self._active
+
+    @property
+    def deferred(self) -> int:
+        """Number of items waiting to be re-queued by ``defer()``."""
+        return self._deferred
+
+    def close(self) -> None:
+        """Signal that no more items will be added."""
+        self._closed = True
+        if self._finished():
+            self._wake_all(self._getters)
+
+    async def put(self, item: tuple[Hashable, str]) -> None:
+        """Queue an item, waiting while ``max_pending`` items are queued."""
+        if self._closed:
+            raise RuntimeError("put() called on a closed scheduler")
+        while self._pending >= self.max_pending:
+            await self._wait(self._putters)
+        self._enqueue(item)
+
+    async def get(self) -> Any:
+        """
+        Return the next item from a host with a free slot.
+
+        Returns:
+            The next item, or ``None`` once the scheduler is closed and
+            every item has been handed out and marked done
+        """
+        while True:
+            while not self._ready:
+                if self._finished():
+                    return None
+                await self._wait(self._getters)
+            host = self._ready.popleft()
+            if self.rate_limiter is None:
+                break
+            delay = self.rate_limiter.try_acquire(host)
+            if delay <= 0:
+                break
+            self._park(host, delay)
+
+        queue = self._queues[host]
+        item = queue.popleft()
+        self._pending -= 1
+        self._active += 1
+        in_flight = self._in_flight.get(host, 0) + 1
+        self._in_flight[host] = in_flight
+
+        if not queue:
+            del self._queues[host]
+            self._ready_set.discard(host)
+        elif in_flight < self.per_host_limit:
+            # Rotate to the back so other hosts get a turn first
+            self._ready.append(host)
+        else:
+            self._ready_set.discard(host)
+
+        self._wake_one(self._putters)
+        if self._ready:
+            self._wake_one(self._getters)
+        return item
+
+    def done(self, item: tuple[Hashable, str]) -> None:
+        """Mark an item returned by ``get()`` as finished, freeing its host slot."""
+        host = host_of(item[1])
+        in_flight = self._in_flight[host] - 1
+        if in_flight:
+            self._in_flight[host] = in_flight
+        else:
+            del self._in_flight[host]
+        self._active -= 1
+
+        self._mark_ready(host)
+        if self._finished():
+            self._wake_all(self._getters)
+
+    def defer(self, item: tuple[Hashable, str], delay: float) -> None:
+        """
+        Re-queue an item after ``delay`` seconds, e.g. to retry it.
+
+        The item does not hold a worker or a host slot while it waits;
+        call ``done()`` for the current attempt as usual. Deferred items
+        bypass ``max_pending`` and keep ``get()`` from finishing.
+        """
+        self._deferred += 1
+        asyncio.get_running_loop().call_later(delay, self._requeue, item)
+
+    def _requeue(self, item: tuple[Hashable, str]) -> None:
+        self._deferred -= 1
+        self._enqueue(item)
+
+    def _enqueue(self, item: tuple[Hashable, str]) -> None:
+        host = host_of(item[1])
+        queue = self._queues.get(host)
+        if queue is None:
+            queue = self._queues[host] = deque()
+        queue.append(item)
+        self._pending += 1
+        self._mark_ready(host)
+
+    def _park(self, host: str, delay: float) -> None:
+        self._ready_set.discard(host)
+        self._parked.add(host)
+        asyncio.get_running_loop().call_later(delay, self._unpark, host)
+
+    def _unpark(self, host: str) -> None:
+        self._parked.discard(host)
+        self._mark_ready(host)
+
+    def _mark_ready(self, host: str) -> None:
+        if (
+            host not in self._ready_set
+            and host not in self._parked
+            and host in self._queues
+            and self._in_flight.get(host, 0) < self.per_host_limit
+        ):
+            self._ready.append(host)
+            self._ready_set.add(host)
+            self._wake_one(self._getters)
+
+    def _finished(self) -> bool:
+        return (
+            self._closed
+            and self._pending == 0
+            and self._active == 0
+            and self._deferred == 0
+        )
+
+    @staticmethod
+    async def _wait(waiters: deque) -> None:
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # We were woken but will not act on it; pass the wake-up on
+                HostScheduler._wake_one(waiters)
+            raise
+
+    @staticmethod
+    def _wake_one(waiters: deque) -> None:
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+
+    @staticmethod
+    def _wake_all(waiters: deque) -> None:
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
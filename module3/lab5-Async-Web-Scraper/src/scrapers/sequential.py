@@ -0,0 +1,240 @@
+import time
+import logging
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from ..cache import ResponseCache
+from ..checkpoint import CrawlCheckpoint
+from ..dedup import BodyTextHasher
+from ..encoding import DEFAULT_MAX_DECODED_BYTES, DecodedBody, request_headers
+from ..metrics import MetricsCollector
+from ..models import PageMetadata
+from ..progress import CrawlProgress
+from ..parsers import (
+    DEFAULT_MAX_HEAD_BYTES,
+    HEAD_CHUNK_SIZE,
+    HeadCollector,
+    StreamingHeadExtractor,
+    extract_metadata_from_html,
+    streams_head
+)
+from .dns import CachedDnsAdapter, DnsCache
+from .ratelimit import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+
+
+def make_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    dns_cache: Optional[DnsCache] = None
+) -> requests.Session:
+    """
+    Create a ``requests.Session`` whose connection pools fit the crawl.
+    
+    A session keeps connections alive between requests, so repeat visits
+    to a host skip the TCP and TLS handshakes.
+    
+    Args:
+        pool_size: Number of hosts to keep pools for, and maximum
+            connections kept per host
+        dns_cache: Resolve hosts from this shared cache instead of a
+            blocking lookup per new connection
+    
+    Returns:
+        Configured Session
+    """
+    session = requests.Session()
+    adapter: HTTPAdapter
+    if dns_cache is not None:
+        adapter = CachedDnsAdapter(dns_cache, pool_connections=pool_size, pool_maxsize=pool_size)
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _explicit_charset(response) -> Optional[str]:
+    """Return the charset only if the server declared one in Content-Type."""
+    content_type = response.headers.get('Content-Type', '')
+    if 'charset' in content_type.lower():
+        return response.encoding
+    return None
+
+
+def fetch_url_sync(
+    url: str,
+    timeout: int = 10,
+    head_only: bool = True,
+    max_head_bytes: int = DEFAULT_MAX_HEAD_BYTES,
+    cache: Optional[ResponseCache] = None,
+    metrics: Optional[MetricsCollector] = None,
+    session: Optional[requests.Session] = None,
+    max_decoded_bytes: int = DEFAULT_MAX_DECODED_BYTES,
+    fingerprint_body: bool = False
+) -> PageMetadata:
+    """
+    Synchronously fetch a URL and extract metadata.
+    
+    By default only the document head is read: the body is streamed in
+    chunks and the connection is closed as soon as ``</head>`` or
+    ``max_head_bytes`` is reached. Responses may be gzip- or
+    Brotli-compressed; they are decompressed as they stream in, and a
+    body that decodes to more than ``max_decoded_bytes`` is abandoned.
+    
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+        head_only: Stop reading after the document head
+        max_head_bytes: Maximum bytes to read when ``head_only`` is set
+        cache: Conditional-request cache; a 304 reuses the cached metadata
+        metrics: Collector to record latency, bytes and status into
+        session: Session to send the request with, reusing its
+            keep-alive connections (a one-off connection if omitted)
+        max_decoded_bytes: Maximum decompressed body size
+        fingerprint_body: Read the whole body and SimHash its text as it
+            streams in, into ``body_simhash`` (see ``src.dedup``)
+    
+    Returns:
+        PageMetadata object
+    """
+    start_time = time.perf_counter()
+    metadata = PageMetadata(url=url)
+    cached = cache.get(url) if cache is not None else None
+    max_head_bytes = min(max_head_bytes, max_decoded_bytes)
+    # The body fingerprint needs the whole body
+    head_only = head_only and not fingerprint_body
+    nbytes = 0
+    
+    try:
+        response = (session or requests).get(
+            url,
+            timeout=timeout,
+            stream=True,
+            headers=request_headers(ResponseCache.conditional_headers(cached))
+        )
+        try:
+            metadata.status_code = response.status_code
+            metadata.fetch_time = time.perf_counter() - start_time
+            
+            if response.status_code == 304 and cache is not None and cached is not None:
+                cache.revalidated(url, cached, metadata)
+            elif response.status_code == 200:
+                if head_only and streams_head():
+                    extractor = StreamingHeadExtractor(
+                        _explicit_charset(response), max_head_bytes
+                    )
+                    for chunk in response.iter_content(HEAD_CHUNK_SIZE):
+                        if extractor.feed(chunk):
+                            break
+                    extracted = extractor.result(url)
+                    nbytes = extractor.bytes_read
+                elif head_only:
+                    collector = HeadCollector(max_head_bytes)
+                    for chunk in response.iter_content(HEAD_CHUNK_SIZE):
+                        if collector.feed(chunk):
+                            break
+                    nbytes = collector.bytes_read
+                    extracted = extract_metadata_from_html(
+                        collector.text(_explicit_charset(response)), url
+                    )
+                else:
+                    body = DecodedBody(max_decoded_bytes)
+                    hasher = BodyTextHasher(response.encoding) if fingerprint_body else None
+                    for chunk in response.iter_content(HEAD_CHUNK_SIZE):
+                        body.feed(chunk)
+                        if hasher is not None:
+                            hasher.feed_bytes(chunk)
+                    nbytes = body.size
+                    if hasher is not None:
+                        metadata.body_simhash = hasher.digest()
+                    html = body.getvalue().decode(response.encoding or 'utf-8', errors='replace')
+                    extracted = extract_metadata_from_html(html, url)
+                metadata.title = extracted.title
+                metadata.description = extracted.description
+                if cache is not None:
+                    cache.store(url, response.headers, metadata)
+            else:
+                metadata.error = f"HTTP {response.status_code}"
+        finally:
+            # Releases the connection without reading the rest of the body
+            response.close()
+    except Exception as e:
+        metadata.fetch_time = time.perf_counter() - start_time
+        metadata.error = str(e)
+        logger.error(f"Error fetching {url}: {e}")
+    
+    if metrics is not None:
+        metrics.record(
+            time.perf_counter() - start_time,
+            metadata.status_code,
+            nbytes,
+            error=metadata.error is not None
+        )
+    return metadata
+
+
+def scrape_sequential(
+    urls: list[str],
+    cache: Optional[ResponseCache] = None,
+    metrics: Optional[MetricsCollector] = None,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    max_decoded_bytes: int = DEFAULT_MAX_DECODED_BYTES,
+    progress: Optional[CrawlProgress] = None,
+    fingerprint_body: bool = False
+) -> list[PageMetadata]:
+    """
+    Scrape URLs sequentially (one at a time).
+    
+    Args:
+        urls: List of URLs to scrape
+        cache: Conditional-request cache shared across crawls
+        metrics: Collector to record per-request metrics into
+        checkpoint: Skip URLs it has completed and record new results
+        rate_limiter: Per-host requests-per-second limits
+        dns_cache: Shared DNS cache; every host is resolved concurrently
+            before the crawl starts
+        max_decoded_bytes: Maximum decompressed size of a response body
+        progress: Live progress tracker to update as URLs are fetched
+        fingerprint_body: Read each whole body and SimHash its text into
+            ``body_simhash``, so ``src.dedup`` can flag near-duplicate pages
+    
+    Returns:
+        List of PageMetadata objects
+    """
+    logger.info(f"Starting sequential scraping of {len(urls)} URLs")
+    start_time = time.perf_counter()
+    
+    if dns_cache is not None:
+        dns_cache.pre_resolve_sync(urls)
+    
+    if progress is not None:
+        progress.enqueue(sum(1 for url in urls if checkpoint is None or url not in checkpoint))
+    
+    results = []
+    with make_session(dns_cache=dns_cache) as session:
+        for url in urls:
+            result = checkpoint.get(url) if checkpoint is not None else None
+            if result is None:
+                if rate_limiter is not None:
+                    rate_limiter.wait(url)
+                if progress is not None:
+                    progress.start_request()
+                result = fetch_url_sync(
+                    url, cache=cache, metrics=metrics, session=session,
+                    max_decoded_bytes=max_decoded_bytes, fingerprint_body=fingerprint_body
+                )
+                if progress is not None:
+                    progress.finish_request(error=result.error is not None)
+                if checkpoint is not None:
+                    checkpoint.record(result)
+            results.append(result)
+    
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Sequential scraping completed in {elapsed:.2f}s")
+    
+    return results
@@ -0,0 +1,290 @@
+import heapq
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional
+import requests
+from ..cache import ResponseCache
+from ..checkpoint import CrawlCheckpoint
+from ..encoding import DEFAULT_MAX_DECODED_BYTES
+from ..metrics import MetricsCollector
+from ..models import PageMetadata
+from ..progress import CrawlProgress
+from .dns import DnsCache
+from .ratelimit import HostRateLimiter
+from .scheduler import host_of
+from .sequential import fetch_url_sync, make_session
+
+logger = logging.getLogger(__name__)
+
+# URLs held back for rate-limited hosts before reading stops
+DEFAULT_MAX_PARKED = 1000
+
+
+class ThreadSessions:
+    """
+    One ``requests.Session`` per worker thread, created on first use.
+
+    Sessions are not guaranteed to be thread-safe, so each thread gets its
+    own from thread-local storage and keeps its connections warm across
+    every URL it fetches. All sessions are closed together at the end.
+
+    Usage:
+        with ThreadSessions(pool_size=10) as sessions:
+            fetch_url_sync(url, session=sessions.get())
+    """
+
+    def __init__(self, pool_size: int, dns_cache: Optional[DnsCache] = None):
+        self.pool_size = pool_size
+        self.dns_cache = dns_cache
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> requests.Session:
+        """Return the calling thread's session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = make_session(self.pool_size, self.dns_cache)
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close every session created so far."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+    def __enter__(self) -> "ThreadSessions":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _run_pool(
+    executor: ThreadPoolExecutor,
+    fetch: Callable[[str], PageMetadata],
+    items: Iterable[tuple[Any, str]],
+    max_in_flight: int,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    max_parked: int = DEFAULT_MAX_PARKED
+) -> Iterator[tuple[Any, PageMetadata]]:
+    """
+    Submit ``(key, url)`` items to ``executor`` and yield ``(key, result)`` as they complete.
+
+    At most ``max_in_flight`` URLs are submitted at a time. With a
+    ``rate_limiter``, each host is checked before its URL is submitted; a
+    host over its rate is parked here, its URLs queued in order, until
+    its next token is due. Worker threads never sleep on a rate limit,
+    so URLs for other hosts keep flowing. Up to ``max_parked`` URLs are
+    held back before reading from ``items`` pauses.
+    """
+    items = iter(items)
+    in_flight: dict[Future, Any] = {}
+    parked: dict[str, deque[tuple[Any, str]]] = {}
+    # (time the host's next token is due, host)
+    due: list[tuple[float, str]] = []
+    parked_count = 0
+    exhausted = False
+
+    def submit(key: Any, url: str) -> None:
+        in_flight[executor.submit(fetch, url)] = key
+
+    while True:
+        now = time.monotonic()
+        while due and due[0][0] <= now and len(in_flight) < max_in_flight:
+            _, host = heapq.heappop(due)
+            delay = rate_limiter.try_acquire(host) if rate_limiter is not None else 0.0
+            if delay:
+                heapq.heappush(due, (now + delay, host))
+                continue
+            waiting = parked[host]
+            submit(*waiting.popleft())
+            parked_count -= 1
+            if waiting:
+                heapq.heappush(due, (now, host))
+            else:
+                del parked[host]
+
+        while not exhausted and len(in_flight) < max_in_flight and parked_count < max_parked:
+            item = next(items, None)
+            if item is None:
+                exhausted = True
+                break
+            if rate_limiter is None:
+                submit(*item)
+                continue
+            host = host_of(item[1])
+            queue = parked.get(host)
+            if queue is not None:
+                queue.append(item)
+                parked_count += 1
+            elif delay := rate_limiter.try_acquire(host):
+                parked[host] = deque([item])
+                parked_count += 1
+                heapq.heappush(due, (now + delay, host))
+            else:
+                submit(*item)
+
+        # Wake up for the next parked host only if there is room to submit it
+        timeout = None
+        if due and len(in_flight) < max_in_flight:
+            timeout = max(0.0, due[0][0] - time.monotonic())
+        if not in_flight:
+            if timeout is None:
+                return
+            time.sleep(timeout)
+            continue
+        done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield in_flight.pop(future), future.result()
+
+
+def scrape_threaded_iter(
+    urls: Iterable[str],
+    max_workers: int = 5,
+    cache: Optional[ResponseCache] = None,
+    metrics: Optional[MetricsCollector] = None,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    max_decoded_bytes: int = DEFAULT_MAX_DECODED_BYTES,
+    progress: Optional[CrawlProgress] = None,
+    fingerprint_body: bool = False
+) -> Iterator[PageMetadata]:
+    """
+    Scrape URLs with a thread pool, yielding results as they complete.
+
+    At most ``2 * max_workers`` URLs are submitted at a time, so a slow
+    URL never holds back results that finished after it and memory stays
+    flat for arbitrarily long URL lists.
+
+    Args:
+        urls: Iterable of URLs to scrape (may be a lazy generator)
+        max_workers: Maximum number of concurrent threads
+        cache: Conditional-request cache shared across crawls
+        metrics: Collector to record per-request metrics into
+        checkpoint: Skip URLs it has completed and record each new result;
+            only newly fetched results are yielded
+        rate_limiter: Per-host requests-per-second limits; URLs for a host
+            over its rate are held back without taking a worker
+        dns_cache: Shared DNS cache; hosts are resolved on first use
+        max_decoded_bytes: Maximum decompressed size of a response body
+        progress: Live progress tracker to update as URLs are fetched
+        fingerprint_body: Read each whole body and SimHash its text into
+            ``body_simhash``, so ``src.dedup`` can flag near-duplicate pages
+
+    Yields:
+        PageMetadata objects in completion order
+    """
+    if checkpoint is not None:
+        urls = (url for url in urls if url not in checkpoint)
+
+    with ThreadSessions(max_workers, dns_cache) as sessions, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def fetch(url: str) -> PageMetadata:
+            if progress is not None:
+                progress.start_request()
+            result = fetch_url_sync(
+                url, cache=cache, metrics=metrics, session=sessions.get(),
+                max_decoded_bytes=max_decoded_bytes, fingerprint_body=fingerprint_body
+            )
+            if progress is not None:
+                progress.finish_request(error=result.error is not None)
+            return result
+
+        def items() -> Iterator[tuple[None, str]]:
+            for url in urls:
+                if progress is not None:
+                    progress.enqueue()
+                yield None, url
+
+        for _, result in _run_pool(executor, fetch, items(), 2 * max_workers, rate_limiter):
+            if checkpoint is not None:
+                checkpoint.record(result)
+            yield result
+
+
+def scrape_threaded(
+    urls: list[str],
+    max_workers: int = 5,
+    cache: Optional[ResponseCache] = None,
+    metrics: Optional[MetricsCollector] = None,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    dns_cache: Optional[DnsCache] = None,
+    max_decoded_bytes: int = DEFAULT_MAX_DECODED_BYTES,
+    progress: Optional[CrawlProgress] = None,
+    fingerprint_body: bool = False
+) -> list[PageMetadata]:
+    """
+    Scrape URLs using threading for concurrency.
+
+    Each worker thread reuses its own keep-alive ``requests.Session``
+    (see ``ThreadSessions``) instead of opening a connection per URL.
+
+    Args:
+        urls: List of URLs to scrape
+        max_workers: Maximum number of concurrent threads
+        cache: Conditional-request cache shared across crawls
+        metrics: Collector to record per-request metrics into
+        checkpoint: Skip URLs it has completed and record each new result
+            as soon as it finishes
+        rate_limiter: Per-host requests-per-second limits; URLs for a host
+            over its rate are held back without taking a worker
+        dns_cache: Shared DNS cache; every host is resolved concurrently
+            before the crawl starts, so no worker thread blocks on a lookup
+        max_decoded_bytes: Maximum decompressed size of a response body
+        progress: Live progress tracker to update as URLs are fetched
+        fingerprint_body: Read each whole body and SimHash its text into
+            ``body_simhash``, so ``src.dedup`` can flag near-duplicate pages
+
+    Returns:
+        List of PageMetadata objects
+    """
+    logger.info(f"Starting threaded scraping of {len(urls)} URLs with {max_workers} workers")
+    start_time = time.perf_counter()
+
+    results: list[PageMetadata | None] = [None] * len(urls)
+    pending = list(enumerate(urls))
+    if checkpoint is not None:
+        results, pending = checkpoint.split(urls)
+        logger.info(f"Resuming: {len(urls) - len(pending)} URLs already completed")
+    if dns_cache is not None:
+        dns_cache.pre_resolve_sync(url for _, url in pending)
+    if progress is not None:
+        progress.enqueue(len(pending))
+
+    with ThreadSessions(max_workers, dns_cache) as sessions, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def fetch(url: str) -> PageMetadata:
+            if progress is not None:
+                progress.start_request()
+            result = fetch_url_sync(
+                url, cache=cache, metrics=metrics, session=sessions.get(),
+                max_decoded_bytes=max_decoded_bytes, fingerprint_body=fingerprint_body
+            )
+            if progress is not None:
+                progress.finish_request(error=result.error is not None)
+            if checkpoint is not None:
+                checkpoint.record(result)
+            return result
+
+        # Keep every worker busy; parked URLs wait here, not in the pool
+        for index, result in _run_pool(
+            executor, fetch, pending, 2 * max_workers, rate_limiter, max_parked=len(pending)
+        ):
+            results[index] = result
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Threaded scraping completed in {elapsed:.2f}s")
+
+    # Every URL has a result by now; the None placeholders are all filled
+    return [result for result in results if result is not None]
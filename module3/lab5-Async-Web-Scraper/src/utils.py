@@ -1,89 +1,515 @@
 import asyncio
+import os
+import random
 import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from collections import deque
 from functools import wraps
-from typing import AsyncGenerator, Callable, Any
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+)
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Fraction of calls logged by @log_execution when no sample_rate is given
+DEFAULT_LOG_SAMPLE_RATE = float(os.environ.get("SCRAPER_LOG_SAMPLE_RATE", "0"))
+
+
+# Statuses that usually indicate a transient, server-side condition
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header into a delay in seconds.
+    
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+    
+    Returns:
+        Delay in seconds (never negative), or None if absent or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
-def retry(max_attempts: int = 3, delay: float = 1.0):
+class RetryBudget:
+    """
+    Cap retries at a fraction of all requests.
+    
+    Allows ``min_retries`` plus ``ratio`` retries per recorded request, so
+    a host that fails everything cannot multiply the load of the crawl.
+    """
+    
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+    
+    def record_request(self) -> None:
+        self.requests += 1
+    
+    def try_spend(self) -> bool:
+        """Consume one retry if the budget allows it."""
+        if self.retries < self.min_retries + self.ratio * self.requests:
+            self.retries += 1
+            return True
+        return False
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff with jitter, error classification and a retry budget.
+    
+    The n-th retry waits ``base_delay * 2 ** (n - 1)`` seconds (capped at
+    ``max_delay``), randomly reduced by up to ``jitter`` of its length so
+    that failing clients do not retry in lockstep. A ``retry_after`` hint
+    on the error (from a ``Retry-After`` header) is used when it is longer.
+    
+    Args:
+        max_attempts: Total attempts including the first one
+        base_delay: Delay before the first retry in seconds
+        max_delay: Upper bound for any single delay
+        jitter: Fraction of each delay that is randomised (0 to 1)
+        retry_on: Exception types considered retryable
+        fatal_on: Exception types never retried, even if in ``retry_on``
+        retry_statuses: HTTP statuses the scraper turns into retryable errors
+        budget: Optional shared RetryBudget
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    jitter: float = 0.5
+    retry_on: tuple[type[BaseException], ...] = (Exception,)
+    fatal_on: tuple[type[BaseException], ...] = ()
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+    budget: Optional[RetryBudget] = field(default=None, repr=False)
+    
+    def is_retryable(self, error: BaseException) -> bool:
+        return isinstance(error, self.retry_on) and not isinstance(error, self.fatal_on)
+    
+    def backoff(self, attempt: int) -> float:
+        """Delay after ``attempt`` failed attempts."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+    
+    def record_request(self) -> None:
+        """Count one attempt towards the retry budget."""
+        if self.budget is not None:
+            self.budget.record_request()
+    
+    def next_delay(self, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+        
+        Args:
+            attempt: Number of attempts made so far (1 after the first)
+            error: Exception raised by the last attempt
+        
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        delay = self.backoff(attempt)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+def retry(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    policy: Optional[RetryPolicy] = None
+):
     """
     Decorator to retry async functions on failure.
     
+    Waits with exponential backoff and jitter between attempts. For
+    fetches inside the scraper prefer passing a ``RetryPolicy`` to the
+    scrape functions, which re-queue retries instead of sleeping.
+    
     Args:
         max_attempts: Maximum number of retry attempts
-        delay: Delay in seconds between retries
+        delay: Base delay in seconds before the first retry
+        policy: RetryPolicy to use instead of ``max_attempts``/``delay``
     
     Usage:
         @retry(max_attempts=3, delay=2.0)
         async def fetch_url(url):
             ...
     """
+    policy = policy or RetryPolicy(max_attempts=max_attempts, base_delay=delay)
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
-            for attempt in range(1, max_attempts + 1):
+            attempt = 0
+            while True:
+                attempt += 1
+                policy.record_request()
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-                    if attempt < max_attempts:
-                        logger.warning(
-                            f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}. "
-                            f"Retrying in {delay}s..."
-                        )
-                        await asyncio.sleep(delay)
-                    else:
+                    wait = policy.next_delay(attempt, e)
+                    if wait is None:
                         logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}: {e}"
+                            f"Giving up on {func.__name__} after {attempt} attempt(s): {e}"
                         )
-            raise last_exception
+                        raise
+                    logger.warning(
+                        f"Attempt {attempt}/{policy.max_attempts} failed for {func.__name__}: {e}. "
+                        f"Retrying in {wait:.2f}s..."
+                    )
+                    await asyncio.sleep(wait)
         return wrapper
     return decorator
 
 
-def log_execution(func: Callable) -> Callable:
+def log_execution(
+    func: Optional[Callable] = None,
+    *,
+    sample_rate: Optional[float] = None,
+    level: int = logging.DEBUG
+) -> Callable:
     """
-    Decorator to log execution time of async functions.
+    Decorator to log execution time of a sample of async function calls.
+    
+    Logging is opt-in: only ``sample_rate`` of calls are timed and logged
+    (``SCRAPER_LOG_SAMPLE_RATE``, default 0). With a rate of 0 the function
+    is returned undecorated, so hot paths pay nothing. Use
+    ``MetricsCollector`` for per-request latency statistics.
+    
+    Args:
+        func: Function to decorate (when used without arguments)
+        sample_rate: Fraction of calls to log, from 0 to 1
+        level: Log level for the timing messages
     
     Usage:
         @log_execution
         async def process_data():
             ...
+        
+        @log_execution(sample_rate=0.01, level=logging.INFO)
+        async def fetch(url):
+            ...
     """
-    @wraps(func)
-    async def wrapper(*args, **kwargs) -> Any:
-        start_time = time.perf_counter()
-        logger.info(f"Starting execution of {func.__name__}")
+    rate = DEFAULT_LOG_SAMPLE_RATE if sample_rate is None else sample_rate
+    
+    def decorator(func: Callable) -> Callable:
+        if rate <= 0:
+            return func
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            if rate < 1 and random.random() >= rate:
+                return await func(*args, **kwargs)
+            
+            start_time = time.perf_counter()
+            logger.log(level, f"Starting execution of {func.__name__}")
+            
+            try:
+                result = await func(*args, **kwargs)
+                elapsed = time.perf_counter() - start_time
+                logger.log(level, f"Completed {func.__name__} in {elapsed:.2f}s")
+                return result
+            except Exception as e:
+                elapsed = time.perf_counter() - start_time
+                logger.error(f"Failed {func.__name__} after {elapsed:.2f}s: {e}")
+                raise
         
+        return wrapper
+    
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+# Marks the end of a stream on internal pipeline queues
+_END = object()
+
+
+def _aiter(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    """Return an async iterator over a sync or async iterable."""
+    if isinstance(items, AsyncIterable):
+        return aiter(items)
+
+    async def from_sync(sync_items: Iterable[T]) -> AsyncIterator[T]:
+        for item in sync_items:
+            yield item
+
+    return from_sync(items)
+
+
+async def amap(
+    func: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    concurrency: int = 10,
+    ordered: bool = False
+) -> AsyncIterator[R]:
+    """
+    Apply an async function to every item with bounded concurrency.
+    
+    Items are pulled from ``items`` only as slots free up, so at most
+    ``concurrency`` calls are in flight and a slow consumer of the results
+    slows down the source instead of letting work pile up in memory.
+    
+    Args:
+        func: Coroutine function to apply
+        items: Sync or async iterable of inputs (may be unbounded)
+        concurrency: Maximum concurrent calls
+        ordered: Yield results in input order instead of completion order
+    
+    Yields:
+        ``func(item)`` results
+    
+    Usage:
+        async for page in amap(fetch, urls, concurrency=50):
+            ...
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    source = _aiter(items)
+    in_flight: deque[asyncio.Future] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < concurrency:
+                try:
+                    item = await anext(source)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                in_flight.append(asyncio.ensure_future(func(item)))
+            if not in_flight:
+                return
+            
+            if ordered:
+                yield await in_flight.popleft()
+            else:
+                done, pending = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                in_flight = deque(pending)
+                for future in done:
+                    yield future.result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def abatch(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    size: int,
+    timeout: Optional[float] = None
+) -> AsyncIterator[list[T]]:
+    """
+    Group a stream into lists of up to ``size`` items.
+    
+    With ``timeout``, a partial batch is also flushed once its first item
+    has waited that many seconds, so a slow source still delivers
+    batches promptly.
+    
+    Args:
+        items: Sync or async iterable
+        size: Maximum batch size
+        timeout: Maximum seconds to hold a partial batch
+    
+    Yields:
+        Non-empty lists of items
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    source = _aiter(items)
+    batch: list[T] = []
+    
+    if timeout is None:
+        async for item in source:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+    
+    loop = asyncio.get_running_loop()
+    deadline: Optional[float] = None
+    next_item: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if next_item is None:
+                next_item = asyncio.ensure_future(anext(source))
+            wait = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({next_item}, timeout=wait)
+            if not done:
+                yield batch
+                batch, deadline = [], None
+                continue
+            
+            future, next_item = next_item, None
+            try:
+                batch.append(future.result())
+            except StopAsyncIteration:
+                break
+            if deadline is None:
+                deadline = loop.time() + timeout
+            if len(batch) >= size:
+                yield batch
+                batch, deadline = [], None
+        if batch:
+            yield batch
+    finally:
+        if next_item is not None:
+            next_item.cancel()
+
+
+async def fan_in(
+    *sources: Union[Iterable[T], AsyncIterable[T]],
+    buffer: int = 0
+) -> AsyncIterator[T]:
+    """
+    Merge several streams into one, yielding items as they arrive.
+    
+    Each source is drained by its own task into a shared queue of
+    ``buffer`` items (defaults to one per source); when the consumer falls
+    behind, the sources are paused rather than buffered without limit.
+    An error in any source is re-raised here.
+    
+    Usage:
+        async for result in fan_in(scrape_async_iter(part1), scrape_async_iter(part2)):
+            ...
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer or len(sources) or 1)
+    
+    async def pump(source) -> None:
         try:
-            result = await func(*args, **kwargs)
-            elapsed = time.perf_counter() - start_time
-            logger.info(f"Completed {func.__name__} in {elapsed:.2f}s")
-            return result
+            async for item in _aiter(source):
+                await queue.put((item, None))
         except Exception as e:
-            elapsed = time.perf_counter() - start_time
-            logger.error(f"Failed {func.__name__} after {elapsed:.2f}s: {e}")
-            raise
+            await queue.put((_END, e))
+        else:
+            await queue.put((_END, None))
+    
+    tasks = [asyncio.create_task(pump(source)) for source in sources]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is _END:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def fan_out(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    *consumers: Callable[[AsyncIterator[T]], Awaitable[Any]],
+    buffer: int = 100
+) -> list[Any]:
+    """
+    Feed every item to several consumers running concurrently.
     
-    return wrapper
+    Each consumer is a coroutine function that receives its own async
+    iterator over the items. Each has a queue of ``buffer`` items and the
+    source waits for the slowest consumer once a queue is full. A consumer
+    may stop early; the others keep receiving items. If a consumer or
+    the source fails, the rest are cancelled and that error is raised
+    as is; if several fail together, their ``ExceptionGroup`` is raised.
+    
+    Args:
+        items: Sync or async iterable to broadcast
+        consumers: Coroutine functions taking an async iterator
+        buffer: Per-consumer queue size
+    
+    Returns:
+        Each consumer's return value, in order
+    
+    Usage:
+        await fan_out(scrape_async_iter(urls), write_jsonl, update_index)
+    """
+    queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=buffer) for _ in consumers]
+    closed = [False] * len(consumers)
+    
+    async def feed() -> None:
+        try:
+            async for item in _aiter(items):
+                for i, queue in enumerate(queues):
+                    if not closed[i]:
+                        await queue.put(item)
+        finally:
+            for i, queue in enumerate(queues):
+                if not closed[i]:
+                    await queue.put(_END)
+    
+    async def stream(queue: asyncio.Queue) -> AsyncIterator[T]:
+        while (item := await queue.get()) is not _END:
+            yield item
+    
+    async def consume(i: int, consumer) -> Any:
+        try:
+            return await consumer(stream(queues[i]))
+        finally:
+            # Stop feeding this consumer and unblock a feeder waiting on it
+            closed[i] = True
+            while not queues[i].empty():
+                queues[i].get_nowait()
+    
+    try:
+        async with asyncio.TaskGroup() as group:
+            group.create_task(feed())
+            tasks = [group.create_task(consume(i, c)) for i, c in enumerate(consumers)]
+    except BaseExceptionGroup as errors:
+        # Callers can catch a lone failure by its own type
+        if len(errors.exceptions) == 1:
+            raise errors.exceptions[0]
+        raise
+    return [task.result() for task in tasks]
 
 
 async def async_response_generator(
-    responses: list[dict]
+    responses: Union[Iterable[dict], AsyncIterable[dict]]
 ) -> AsyncGenerator[dict, None]:
     """
     Async generator that yields responses one at a time.
     
     Args:
-        responses: List of response dictionaries
+        responses: Sync or async iterable of response dictionaries
     
     Yields:
         Individual response dictionaries
@@ -92,22 +518,25 @@ async def async_response_generator(
         async for response in async_response_generator(responses):
             process(response)
     """
-    for response in responses:
-        # Simulate async processing
-        await asyncio.sleep(0)
+    async for response in _aiter(responses):
         yield response
 
 
 async def async_batch_processor(
-    items: list[Any],
-    batch_size: int = 5
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    batch_size: int = 5,
+    timeout: Optional[float] = None
 ) -> AsyncGenerator[list[Any], None]:
     """
     Async generator that yields items in batches.
     
+    Thin wrapper over ``abatch``: works on lists and on async streams
+    such as ``scrape_async_iter(urls)``.
+    
     Args:
-        items: List of items to process
+        items: Sync or async iterable of items to process
         batch_size: Number of items per batch
+        timeout: Flush a partial batch after this many seconds
     
     Yields:
         Batches of items
@@ -116,7 +545,5 @@ async def async_batch_processor(
         async for batch in async_batch_processor(urls, batch_size=10):
             await process_batch(batch)
     """
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i + batch_size]
-        await asyncio.sleep(0)  # Yield control to event loop
+    async for batch in abatch(items, batch_size, timeout):
         yield batch
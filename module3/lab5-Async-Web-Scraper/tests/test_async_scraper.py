@@ -0,0 +1,57 @@
+"""Tests for the reusable AsyncScraper."""
+
+import asyncio
+import pytest
+from src.bench import SiteConfig, SyntheticServer
+from src.metrics import MetricsCollector
+from src.scrapers import AsyncScraper, run_async
+
+
+@pytest.fixture(scope="module")
+def server():
+    with SyntheticServer(SiteConfig(latency=0, page_size=500)) as synthetic:
+        yield synthetic
+
+
+@pytest.mark.asyncio
+async def test_scraper_reuses_session_across_crawls(server):
+    """Test that repeated crawls share one session and keep results in order."""
+    urls = server.urls(8)
+    metrics = MetricsCollector()
+    
+    async with AsyncScraper(max_concurrent=4, metrics=metrics) as scraper:
+        session = scraper._session
+        first = await scraper.scrape(urls[:4])
+        second = [r async for r in scraper.scrape_iter(urls[4:])]
+        concurrent = await asyncio.gather(scraper.scrape(urls[:2]), scraper.scrape(urls[2:4]))
+        assert scraper._session is session and not session.closed
+    
+    assert session.closed and not scraper.started
+    assert [r.url for r in first] == urls[:4]
+    assert sorted(r.url for r in second) == sorted(urls[4:])
+    assert [r.title for r in concurrent[1]] == [r.title for r in first[2:]]
+    assert metrics.requests == 12 and metrics.errors == 0
+
+
+@pytest.mark.asyncio
+async def test_scraper_requires_start():
+    """Test that crawling before start() or after aclose() is an error."""
+    scraper = AsyncScraper()
+    with pytest.raises(RuntimeError):
+        await scraper.scrape(["http://127.0.0.1/"])
+    
+    await scraper.start()
+    await scraper.aclose()
+    with pytest.raises(RuntimeError):
+        scraper.scrape_iter(["http://127.0.0.1/"])
+
+
+def test_run_async_falls_back_without_uvloop(server):
+    """Test run_async runs a crawl whether or not uvloop is installed."""
+    async def crawl():
+        async with AsyncScraper() as scraper:
+            return await scraper.scrape(server.urls(2))
+    
+    results = run_async(crawl())
+    
+    assert [r.status_code for r in results] == [200, 200]
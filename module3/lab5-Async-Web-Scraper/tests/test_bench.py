@@ -0,0 +1,64 @@
+"""Tests for the offline benchmark harness."""
+
+import csv
+import json
+from src.bench import SiteConfig, SyntheticServer, run_suite, write_report
+from src.scraper import fetch_url_sync
+
+
+def test_synthetic_server_serves_pages():
+    """Test that synthetic pages carry per-page metadata."""
+    with SyntheticServer(SiteConfig(latency=0, page_size=2000, head_offset=5000)) as server:
+        result = fetch_url_sync(server.urls(4)[3])
+
+    assert result.status_code == 200
+    assert result.title == "Page 3"
+    assert result.description == "Synthetic page 3"
+
+
+def test_error_pages_are_deterministic():
+    """Test that the same seed always fails the same pages."""
+    config = SiteConfig(error_rate=0.3, seed=1)
+    failing = [page for page in range(100) if config.is_error(page)]
+
+    assert failing == [page for page in range(100) if SiteConfig(error_rate=0.3, seed=1).is_error(page)]
+    assert 10 < len(failing) < 50
+
+
+def test_run_suite_and_reports(tmp_path):
+    """Test a small in-process suite and both report formats."""
+    config = SiteConfig(latency=0, page_size=1000)
+    results = run_suite(["sequential", "threaded", "async"], [5], [2, 4], config, isolate=False)
+
+    # sequential runs once; the others once per concurrency level
+    assert [(r.engine, r.concurrency) for r in results] == [
+        ("sequential", 1), ("threaded", 2), ("threaded", 4), ("async", 2), ("async", 4)
+    ]
+    assert all(r.successes == 5 and r.errors == 0 for r in results)
+
+    report = json.loads(write_report(results, tmp_path / "bench.json", config).read_text())
+    assert report["site"]["page_size"] == 1000
+    assert len(report["results"]) == 5
+
+    with open(write_report(results, tmp_path / "bench.csv"), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["engine"] == "sequential"
+
+
+def test_engines_do_the_same_work_with_error_pages(monkeypatch):
+    """Test that no engine retries error pages, so every engine sends one request per URL."""
+    requests = []
+    handle_page = SyntheticServer._handle_page
+
+    async def counting_handle_page(self, request):
+        requests.append(request.path)
+        return await handle_page(self, request)
+
+    monkeypatch.setattr(SyntheticServer, "_handle_page", counting_handle_page)
+    config = SiteConfig(latency=0, page_size=1000, error_rate=0.3, seed=1)
+    failing = sum(config.is_error(page) for page in range(20))
+    results = run_suite(["sequential", "threaded", "async"], [20], [4], config, isolate=False)
+
+    assert failing > 0
+    assert [(r.successes, r.errors) for r in results] == [(20 - failing, failing)] * 3
+    assert len(requests) == 60
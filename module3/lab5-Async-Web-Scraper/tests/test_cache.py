@@ -0,0 +1,82 @@
+"""Tests for the HTTP conditional-request cache."""
+
+from unittest.mock import Mock, patch
+import pytest
+from src import cache as cache_module
+from src.cache import ResponseCache
+from src.encoding import ACCEPT_ENCODING
+from src.scraper import PageMetadata, fetch_url_sync
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ResponseCache(tmp_path / "cache.sqlite") as response_cache:
+        yield response_cache
+
+
+def test_store_and_get(cache):
+    """Test that validators and metadata round-trip through the cache."""
+    metadata = PageMetadata(url="http://example.com", title="Title", description="Desc")
+    cache.store("http://example.com", {"ETag": '"abc"'}, metadata)
+    
+    entry = cache.get("http://example.com")
+    
+    assert entry.title == "Title"
+    assert entry.description == "Desc"
+    assert ResponseCache.conditional_headers(entry) == {"If-None-Match": '"abc"'}
+
+
+def test_store_skips_responses_without_validators(cache):
+    """Test that responses that cannot be revalidated are not cached."""
+    cache.store("http://example.com", {}, PageMetadata(url="http://example.com"))
+    
+    assert cache.get("http://example.com") is None
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    """Test TTL expiry."""
+    with ResponseCache(tmp_path / "cache.sqlite", ttl=0) as short_cache:
+        short_cache.store(
+            "http://example.com", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            PageMetadata(url="http://example.com")
+        )
+        
+        assert short_cache.get("http://example.com") is None
+        assert len(short_cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    """Test that the size bound evicts the least recently used entries."""
+    monkeypatch.setattr(cache_module, "_EVICT_EVERY", 1)
+    with ResponseCache(tmp_path / "cache.sqlite", max_entries=2) as small_cache:
+        for name in ("a", "b"):
+            small_cache.store(f"http://{name}.com", {"ETag": name}, PageMetadata(url=name))
+        small_cache.get("http://a.com")
+        small_cache.store("http://c.com", {"ETag": "c"}, PageMetadata(url="c"))
+        
+        assert small_cache.get("http://b.com") is None
+        assert small_cache.get("http://a.com") is not None
+        assert small_cache.get("http://c.com") is not None
+
+
+@patch('requests.get')
+def test_fetch_url_sync_reuses_metadata_on_304(mock_get, cache):
+    """Test that a 304 response reuses cached metadata without parsing."""
+    cache.store(
+        "http://example.com", {"ETag": '"v1"'},
+        PageMetadata(url="http://example.com", title="Cached", description="From cache")
+    )
+    mock_response = Mock()
+    mock_response.status_code = 304
+    mock_get.return_value = mock_response
+    
+    result = fetch_url_sync("http://example.com", cache=cache)
+    
+    assert mock_get.call_args.kwargs["headers"] == {
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "If-None-Match": '"v1"',
+    }
+    assert result.status_code == 304
+    assert result.title == "Cached"
+    assert result.description == "From cache"
+    assert result.error is None
@@ -0,0 +1,94 @@
+"""Tests for resumable crawl checkpoints."""
+
+from unittest.mock import patch
+import pytest
+from src.checkpoint import CrawlCheckpoint
+from src.scraper import PageMetadata, scrape_async, scrape_threaded
+
+
+def test_checkpoint_survives_reopen(tmp_path):
+    """Test that successful results are loaded back and failures are retried."""
+    path = tmp_path / "crawl.jsonl"
+    with CrawlCheckpoint(path) as checkpoint:
+        checkpoint.record(PageMetadata(url="http://a.com", title="A", status_code=200))
+        checkpoint.record(PageMetadata(url="http://b.com", error="Timeout"))
+
+    with CrawlCheckpoint(path) as checkpoint:
+        results, pending = checkpoint.split(["http://a.com", "http://b.com"])
+
+    assert results[0].title == "A"
+    assert results[1] is None
+    assert pending == [(1, "http://b.com")]
+
+
+def test_checkpoint_drops_truncated_tail(tmp_path):
+    """Test that a partial record from a crash is removed before appending."""
+    path = tmp_path / "crawl.jsonl"
+    with CrawlCheckpoint(path) as checkpoint:
+        checkpoint.record(PageMetadata(url="http://a.com", status_code=200))
+    with open(path, "ab") as f:
+        f.write(b'{"url": "http://b.c')
+
+    with CrawlCheckpoint(path) as checkpoint:
+        checkpoint.record(PageMetadata(url="http://c.com", status_code=200))
+
+    with CrawlCheckpoint(path) as checkpoint:
+        assert "http://a.com" in checkpoint
+        assert "http://c.com" in checkpoint
+        assert len(checkpoint) == 2
+
+
+def test_checkpoint_skips_corrupt_line(tmp_path):
+    """Test that a corrupt line mid-log loses only itself, not the records after it."""
+    path = tmp_path / "crawl.jsonl"
+    with CrawlCheckpoint(path) as checkpoint:
+        checkpoint.record(PageMetadata(url="http://a.com", status_code=200))
+        checkpoint.record(PageMetadata(url="http://c.com", status_code=200))
+    first, second = path.read_bytes().splitlines(keepends=True)
+    path.write_bytes(first + b'{"url": "http://b.c\n' + second)
+
+    for _ in range(2):
+        with CrawlCheckpoint(path) as checkpoint:
+            assert "http://a.com" in checkpoint
+            assert "http://c.com" in checkpoint
+            assert len(checkpoint) == 2
+
+
+def test_scrape_threaded_resumes_from_checkpoint(tmp_path):
+    """Test that completed URLs are not fetched again."""
+    urls = [f"http://example.com/{i}" for i in range(5)]
+    with CrawlCheckpoint(tmp_path / "crawl.jsonl") as checkpoint:
+        checkpoint.record(PageMetadata(url=urls[1], title="cached", status_code=200))
+
+        with patch('src.scrapers.threaded.fetch_url_sync',
+                   side_effect=lambda url, **kwargs: PageMetadata(url=url, status_code=200)) as mock_fetch:
+            results = scrape_threaded(urls, max_workers=2, checkpoint=checkpoint)
+
+        assert mock_fetch.call_count == 4
+        assert [r.url for r in results] == urls
+        assert results[1].title == "cached"
+        assert len(checkpoint) == 5
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_resumes_from_checkpoint(tmp_path):
+    """Test that an interrupted async crawl only fetches the remaining URLs."""
+    urls = [f"http://example{i}.com" for i in range(6)]
+    fetched = []
+    
+    async def fake_fetch(session, url, **kwargs):
+        fetched.append(url)
+        return PageMetadata(url=url, status_code=200)
+    
+    path = tmp_path / "crawl.jsonl"
+    with CrawlCheckpoint(path) as checkpoint:
+        for url in urls[:4]:
+            checkpoint.record(PageMetadata(url=url, status_code=200))
+
+    with CrawlCheckpoint(path) as checkpoint, \
+            patch('src.scrapers.async_scraper.aiohttp.ClientSession'), \
+            patch('src.scrapers.async_scraper._fetch_page', side_effect=fake_fetch):
+        results = await scrape_async(urls, max_concurrent=2, checkpoint=checkpoint)
+
+    assert sorted(fetched) == urls[4:]
+    assert [r.url for r in results] == urls
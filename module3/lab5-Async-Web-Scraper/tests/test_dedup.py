@@ -0,0 +1,169 @@
+"""Tests for content fingerprints and near-duplicate detection."""
+
+from unittest.mock import Mock, patch
+import pytest
+from src.dedup import (
+    BodyTextHasher,
+    DuplicateIndex,
+    SimHash,
+    dedupe_results,
+    dedupe_results_async,
+    fingerprint_page,
+)
+from src.bench import SiteConfig, SyntheticServer
+from src.models import PageMetadata
+from src.scrapers import AsyncScraper, scrape_sequential, scrape_threaded
+from src.scrapers.sequential import fetch_url_sync
+
+ARTICLE = (
+    "The quick brown fox jumps over the lazy dog while the farmer watches from "
+    "the porch and the sun slowly sets behind the distant green hills of the valley "
+)
+
+
+def test_simhash_is_chunk_independent():
+    """Test that feeding text in pieces, even mid-word, gives the same hash."""
+    hasher = SimHash()
+    for i in range(0, len(ARTICLE), 7):
+        hasher.update(ARTICLE[i:i + 7])
+    
+    assert hasher.digest() == SimHash(ARTICLE).digest()
+
+
+def test_simhash_distance_tracks_similarity():
+    """Test that a small edit stays close while unrelated text does not."""
+    base = SimHash(ARTICLE * 3).digest()
+    edited = SimHash((ARTICLE * 3).replace("lazy", "sleepy", 1)).digest()
+    unrelated = SimHash("completely different words about databases and query planners").digest()
+    
+    assert (base ^ edited).bit_count() <= DuplicateIndex().max_distance
+    assert (base ^ unrelated).bit_count() > 10
+
+
+def test_body_text_hasher_skips_scripts():
+    """Test that script contents do not affect the body fingerprint."""
+    plain = BodyTextHasher()
+    plain.feed(f"<html><body><p>{ARTICLE}</p></body></html>")
+    scripted = BodyTextHasher()
+    scripted.feed(f"<html><body><script>var x = 1;</script><p>{ARTICLE}</p></body></html>")
+    
+    assert plain.digest() == scripted.digest()
+
+
+def test_fingerprint_skips_failed_and_empty_pages():
+    """Test that pages with nothing to compare never count as duplicates."""
+    assert fingerprint_page(PageMetadata(url="http://a.test/", error="Timeout")) is None
+    assert fingerprint_page(PageMetadata(url="http://a.test/", status_code=200)) is None
+
+
+def _body_simhash(html):
+    hasher = BodyTextHasher()
+    hasher.feed(html)
+    return hasher.digest()
+
+
+def test_dedupe_drops_exact_and_near_duplicates():
+    """Test that mirrors and near-identical bodies are dropped after the first."""
+    body = f"<body><p>{ARTICLE * 3}</p></body>"
+    results = [
+        PageMetadata(url="http://a.test/", title="Fox News", description="Daily news", status_code=200),
+        PageMetadata(url="http://mirror.test/", title="  fox   NEWS ", description="Daily  news", status_code=200),
+        PageMetadata(url="http://b.test/", title="Story", status_code=200, body_simhash=_body_simhash(body)),
+        PageMetadata(url="http://b.test/fr", title="Histoire", status_code=200,
+                     body_simhash=_body_simhash(body.replace("lazy", "sleepy", 1))),
+        PageMetadata(url="http://c.test/", title="Other", description="Unrelated page", status_code=200),
+        PageMetadata(url="http://d.test/", error="Timeout"),
+        PageMetadata(url="http://e.test/", error="Timeout"),
+    ]
+    index = DuplicateIndex()
+    
+    kept = [r.url for r in dedupe_results(results, index)]
+    
+    assert kept == ["http://a.test/", "http://b.test/", "http://c.test/", "http://d.test/", "http://e.test/"]
+    assert index.duplicates == {
+        "http://mirror.test/": "http://a.test/",
+        "http://b.test/fr": "http://b.test/",
+    }
+    assert len(index) == 3
+
+
+def test_head_only_pages_sharing_boilerplate_are_kept():
+    """Test that distinct head-only pages with a shared description are not near-duplicates."""
+    results = [
+        PageMetadata(
+            url=f"http://shop.test/shoe/{i}",
+            title=f"Shoe model {i} | ShoeStore",
+            description="Buy shoes online at ShoeStore. Free shipping on all orders.",
+            status_code=200
+        )
+        for i in range(500)
+    ]
+    index = DuplicateIndex()
+    
+    assert len(list(dedupe_results(results, index))) == 500
+    assert index.duplicates == {}
+
+
+@pytest.mark.asyncio
+async def test_dedupe_async_flag_only():
+    """Test that drop=False keeps every result and only records duplicates."""
+    async def results():
+        for url in ("http://a.test/", "http://b.test/"):
+            yield PageMetadata(url=url, title="Same", description="Same page", status_code=200)
+    
+    index = DuplicateIndex()
+    kept = [r.url async for r in dedupe_results_async(results(), index, drop=False)]
+    
+    assert kept == ["http://a.test/", "http://b.test/"]
+    assert index.duplicates == {"http://b.test/": "http://a.test/"}
+
+
+def test_body_fingerprints_ignore_shared_titles():
+    """Test that pages with the same generic title but different bodies are kept."""
+    index = DuplicateIndex()
+    home = PageMetadata(url="http://a.test/", title="Home", status_code=200)
+    other = PageMetadata(url="http://b.test/", title="Home", status_code=200)
+    mirror = PageMetadata(url="http://c.test/", title="Home", status_code=200)
+    
+    assert index.check_result(home, f"<body><p>{ARTICLE * 3}</p></body>") is None
+    assert index.check_result(other, "<body><p>Database query planners and indexes</p></body>") is None
+    assert index.check_result(mirror, f"<body><div>{ARTICLE * 3}</div></body>") == "http://a.test/"
+
+
+@patch('requests.get')
+def test_fetch_streams_body_into_fingerprint(mock_get):
+    """Test that fingerprint_body hashes the streamed body into body_simhash."""
+    html = f"<html><head><title>Fox</title></head><body><p>{ARTICLE}</p></body></html>".encode()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {"Content-Type": "text/html"}
+    mock_response.encoding = "utf-8"
+    mock_response.iter_content.return_value = [html[i:i + 10] for i in range(0, len(html), 10)]
+    mock_get.return_value = mock_response
+    
+    result = fetch_url_sync("http://a.test/", fingerprint_body=True)
+    
+    assert result.title == "Fox"
+    assert result.body_simhash == _body_simhash(html.decode())
+    assert fingerprint_page(result).has_body
+
+
+@pytest.mark.asyncio
+async def test_crawls_flag_near_duplicate_bodies():
+    """Test that crawls with fingerprint_body flag pages whose heads differ but bodies match."""
+    # Every synthetic page has its own title and description over one shared body
+    with SyntheticServer(SiteConfig(latency=0, page_size=2_000, charset=None)) as server:
+        urls = server.urls(4)
+        head_only = scrape_threaded(urls, max_workers=2)
+        crawls = [
+            scrape_sequential(urls, fingerprint_body=True),
+            scrape_threaded(urls, max_workers=2, fingerprint_body=True),
+        ]
+        async with AsyncScraper(max_concurrent=2, fingerprint_body=True) as scraper:
+            crawls.append(await scraper.scrape(urls))
+    
+    assert len(list(dedupe_results(head_only))) == 4
+    for results in crawls:
+        index = DuplicateIndex()
+        assert [r.url for r in dedupe_results(results, index)] == urls[:1]
+        assert index.duplicates == {url: urls[0] for url in urls[1:]}
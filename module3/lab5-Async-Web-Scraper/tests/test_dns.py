@@ -0,0 +1,88 @@
+"""Tests for DNS pre-resolution and caching."""
+
+import socket
+from unittest.mock import patch
+import pytest
+from src.bench import SiteConfig, SyntheticServer
+from src.scrapers import DnsCache, scrape_async, scrape_threaded
+from src.scrapers.dns import CachingResolver
+
+FAKE_HOST = "crawl-target.invalid"
+
+
+@pytest.fixture
+def server():
+    with SyntheticServer(SiteConfig(latency=0, page_size=500)) as synthetic:
+        yield synthetic
+
+
+@pytest.fixture
+def dns_cache():
+    cache = DnsCache(ttl=60)
+    # ".invalid" never resolves, so success proves the cache was used
+    cache.put(FAKE_HOST, [(socket.AF_INET, "127.0.0.1")])
+    return cache
+
+
+def test_cache_entries_expire():
+    """Test that entries are dropped once their TTL has passed."""
+    cache = DnsCache(ttl=-1)
+    cache.put("example.com", [(socket.AF_INET, "93.184.216.34")])
+    
+    assert cache.get("example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_pre_resolve_looks_up_each_host_once():
+    """Test that pre-resolution resolves unique hostnames only."""
+    cache = DnsCache()
+    urls = ["http://localhost/a", "http://localhost/b", "http://127.0.0.1/c"]
+    
+    with patch.object(DnsCache, "resolve_async", wraps=cache.resolve_async) as resolve:
+        assert await cache.pre_resolve(urls) == 1
+    
+    resolve.assert_called_once_with("localhost")
+    assert cache.get("localhost")
+
+
+@pytest.mark.asyncio
+async def test_caching_resolver_filters_family(dns_cache):
+    """Test that aiohttp gets addresses of the requested family only."""
+    resolver = CachingResolver(dns_cache)
+    
+    results = await resolver.resolve(FAKE_HOST, 80, socket.AF_UNSPEC)
+    assert [r["host"] for r in results] == ["127.0.0.1"]
+    with pytest.raises(OSError):
+        await resolver.resolve(FAKE_HOST, 80, socket.AF_INET6)
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_uses_dns_cache(server, dns_cache):
+    """Test that the aiohttp connector resolves hosts from the cache."""
+    urls = [f"http://{FAKE_HOST}:{server.port}/page/{i}" for i in range(3)]
+    
+    results = await scrape_async(urls, dns_cache=dns_cache)
+    
+    assert [r.title for r in results] == ["Page 0", "Page 1", "Page 2"]
+
+
+def test_scrape_threaded_uses_dns_cache(server, dns_cache):
+    """Test that the requests adapter resolves hosts from the cache."""
+    urls = [f"http://{FAKE_HOST}:{server.port}/page/{i}" for i in range(3)]
+    
+    results = scrape_threaded(urls, max_workers=2, dns_cache=dns_cache)
+    
+    assert [r.title for r in results] == ["Page 0", "Page 1", "Page 2"]
+
+
+def test_requests_fall_back_to_next_cached_address(server):
+    """Test that an unreachable first address does not fail the host."""
+    cache = DnsCache(ttl=60)
+    # Nothing listens on 127.0.0.2 for a single-host server
+    cache.put(FAKE_HOST, [(socket.AF_INET, "127.0.0.2"), (socket.AF_INET, "127.0.0.1")])
+    urls = [f"http://{FAKE_HOST}:{server.port}/page/{i}" for i in range(2)]
+    
+    results = scrape_threaded(urls, max_workers=1, dns_cache=cache)
+    
+    assert [r.title for r in results] == ["Page 0", "Page 1"]
+    assert cache.get(FAKE_HOST)
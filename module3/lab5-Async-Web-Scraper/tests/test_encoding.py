@@ -0,0 +1,77 @@
+"""Tests for compressed transfer and decoded-size limits."""
+
+import aiohttp
+import pytest
+import requests
+from src.bench import SiteConfig, SyntheticServer
+from src.encoding import ACCEPT_ENCODING, DecodedBody
+from src.exceptions import ResponseTooLargeError
+from src.scraper import fetch_url_async, fetch_url_sync
+
+
+@pytest.fixture(scope="module")
+def server():
+    # ~500 KB of repetitive text that compresses to a few KB
+    config = SiteConfig(latency=0, page_size=500_000, compress=True)
+    with SyntheticServer(config) as synthetic:
+        yield synthetic
+
+
+def test_decoded_body_limit():
+    """Test that the decoded-size cap is enforced as chunks arrive."""
+    body = DecodedBody(max_bytes=10)
+    body.feed(b"12345")
+    body.feed(b"67890")
+    
+    with pytest.raises(ResponseTooLargeError):
+        body.feed(b"1")
+    assert body.getvalue() == b"1234567890"
+
+
+def test_server_compresses_for_advertised_encoding(server):
+    """Test that pages really travel compressed when we ask for it."""
+    response = requests.get(server.urls(1)[0], headers={"Accept-Encoding": ACCEPT_ENCODING}, stream=True)
+    
+    assert response.headers["Content-Encoding"] in ACCEPT_ENCODING
+    response.close()
+
+
+def test_fetch_url_sync_decodes_and_caps(server):
+    """Test sync fetching of compressed pages and rejection of oversized ones."""
+    url = server.urls(1)[0]
+    
+    assert fetch_url_sync(url).title == "Page 0"
+    assert fetch_url_sync(url, head_only=False, max_decoded_bytes=1_000_000).title == "Page 0"
+    
+    result = fetch_url_sync(url, head_only=False, max_decoded_bytes=50_000)
+    assert result.error == "Response exceeds 50000 decoded bytes"
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_async_decodes_and_caps(server):
+    """Test async fetching of compressed pages and rejection of oversized ones."""
+    url = server.urls(1)[0]
+    
+    async with aiohttp.ClientSession() as session:
+        assert (await fetch_url_async(session, url)).title == "Page 0"
+        full = await fetch_url_async(session, url, head_only=False, max_decoded_bytes=1_000_000)
+        assert full.title == "Page 0"
+        
+        result = await fetch_url_async(session, url, head_only=False, max_decoded_bytes=50_000)
+        assert result.error == "Response exceeds 50000 decoded bytes"
+
+
+@pytest.mark.asyncio
+async def test_fetch_full_body_without_charset():
+    """Test full-body fetches of pages whose Content-Type declares no charset."""
+    with SyntheticServer(SiteConfig(latency=0, page_size=5_000, charset=None)) as plain:
+        url = plain.urls(1)[0]
+        assert "charset" not in requests.get(url).headers["Content-Type"]
+        assert fetch_url_sync(url, head_only=False).title == "Page 0"
+        
+        async with aiohttp.ClientSession() as session:
+            full = await fetch_url_async(session, url, head_only=False)
+            fingerprinted = await fetch_url_async(session, url, fingerprint_body=True)
+    
+    assert full.error is None and full.title == "Page 0"
+    assert fingerprinted.error is None and fingerprinted.body_simhash is not None
@@ -0,0 +1,78 @@
+"""Tests for the URL frontier."""
+
+import pytest
+from src.scrapers.frontier import BloomFilter, HashSet, UrlFrontier, normalize_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTP://Example.COM/", "http://example.com/"),
+    ("https://example.com", "https://example.com/"),
+    ("https://example.com:443/a/", "https://example.com/a"),
+    ("https://example.com:8443/a", "https://example.com:8443/a"),
+    ("https://example.com/a#section", "https://example.com/a"),
+    ("https://example.com/?utm_source=x&b=2&gclid=1&a=1", "https://example.com/?a=1&b=2"),
+    ("http://[::1]:8080/x", "http://[::1]:8080/x"),
+])
+def test_normalize_url(url, expected):
+    """Test that trivial URL variants normalize to one form."""
+    assert normalize_url(url) == expected
+
+
+def test_frontier_deduplicates_variants():
+    """Test that equivalent URLs are only queued once."""
+    frontier = UrlFrontier([
+        "https://example.com/a",
+        "https://EXAMPLE.com/a/",
+        "https://example.com/a#top",
+        "https://example.com/a?utm_campaign=spring",
+        "https://example.com/b",
+    ])
+    
+    assert len(frontier) == 2
+    assert frontier.duplicates == 3
+    assert "https://example.com/a/" in frontier
+
+
+def test_frontier_yields_urls_as_given():
+    """Test that the first spelling of each URL is fetched unchanged."""
+    frontier = UrlFrontier([
+        "https://Example.com/docs/",
+        "https://example.com/docs",
+        "https://other.com/search?flag&utm_source=x",
+        "https://other.com/search?flag=",
+    ])
+    
+    assert frontier.drain() == [
+        "https://Example.com/docs/",
+        "https://other.com/search?flag&utm_source=x",
+    ]
+
+
+def test_frontier_interleaves_hosts():
+    """Test round-robin ordering across hosts and grouped draining."""
+    urls = ["http://a.com/1", "http://a.com/2", "http://a.com/3", "http://b.com/1", "http://c.com/1"]
+    
+    assert UrlFrontier(urls).drain() == [
+        "http://a.com/1", "http://b.com/1", "http://c.com/1", "http://a.com/2", "http://a.com/3"
+    ]
+    assert UrlFrontier(urls).drain(by_host=True) == urls
+
+
+@pytest.mark.parametrize("seen", [HashSet(), BloomFilter(1000, 0.01)])
+def test_seen_sets(seen):
+    """Test that both seen-set implementations report membership."""
+    urls = [f"http://example.com/{i}" for i in range(500)]
+    
+    assert all(seen.add(url) for url in urls)
+    assert all(url in seen for url in urls)
+    assert len(seen) == 500
+
+
+def test_bloom_filter_false_positive_rate():
+    """Test that false positives stay near the configured rate at capacity."""
+    bloom = BloomFilter(5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"http://example.com/{i}")
+    
+    false_positives = sum(f"http://other.com/{i}" in bloom for i in range(5000))
+    assert false_positives / 5000 < 0.03
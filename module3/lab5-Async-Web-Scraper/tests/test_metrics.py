@@ -0,0 +1,43 @@
+"""Tests for metrics collection."""
+
+import pytest
+from src.metrics import LatencyHistogram, MetricsCollector
+
+
+def test_histogram_percentiles_within_bucket_error():
+    """Test that percentiles are within the 10% bucket resolution."""
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+    
+    assert histogram.count == 1000
+    assert histogram.percentile(0.50) == pytest.approx(0.5, rel=0.1)
+    assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.1)
+    assert histogram.percentile(1.0) == pytest.approx(1.0)
+    assert histogram.mean == pytest.approx(0.5005)
+
+
+def test_histogram_empty():
+    """Test that an empty histogram reports zeros."""
+    histogram = LatencyHistogram()
+    
+    assert histogram.percentile(0.5) == 0.0
+    assert histogram.mean == 0.0
+
+
+def test_metrics_collector_counts():
+    """Test counters, bytes and status codes."""
+    metrics = MetricsCollector()
+    metrics.record(0.1, 200, nbytes=1000)
+    metrics.record(0.2, 200, nbytes=500)
+    metrics.record(0.3, 404, error=True)
+    metrics.record(5.0, None, error=True)
+    
+    snapshot = metrics.snapshot()
+    
+    assert snapshot["requests"] == 4
+    assert snapshot["errors"] == 2
+    assert snapshot["bytes_read"] == 1500
+    assert snapshot["status_codes"] == {200: 2, 404: 1}
+    assert snapshot["latency_max"] == 5.0
+    assert "4 requests" in metrics.report()
@@ -0,0 +1,74 @@
+"""Tests for the result models."""
+
+import pickle
+from src.models import PageMetadata, PageMetadataBatch
+from src.output import print_summary
+
+
+def _results():
+    return [
+        PageMetadata(url="http://a.test/", title="A", status_code=200, fetch_time=0.5),
+        PageMetadata(url="http://b.test/", title="B", status_code=304, fetch_time=0.25),
+        PageMetadata(url="http://c.test/", status_code=404, fetch_time=0.25, error="HTTP 404"),
+        PageMetadata(url="http://d.test/", error="Timeout"),
+    ]
+
+
+def test_page_metadata_is_slotted_and_picklable():
+    """Test that results carry no per-instance __dict__ and survive pickling."""
+    result = PageMetadata(url="http://a.test/", title="A", status_code=200)
+    
+    assert not hasattr(result, "__dict__")
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_page_metadata_to_dict():
+    """Test the JSON output dictionary."""
+    result = PageMetadata(url="http://a.test/", title="A", status_code=200, fetch_time=0.12345)
+    
+    assert result.to_dict() == {
+        "url": "http://a.test/",
+        "title": "A",
+        "description": None,
+        "status_code": 200,
+        "fetch_time": 0.123,
+        "error": None
+    }
+
+
+def test_batch_round_trips_results():
+    """Test that a batch gives back the results it was built from."""
+    results = _results()
+    batch = PageMetadataBatch.from_results(results)
+    
+    assert len(batch) == 4
+    assert list(batch) == results
+    assert batch[3].status_code is None
+    assert batch.to_dicts() == [r.to_dict() for r in results]
+
+
+def test_batch_summary_stats():
+    """Test the column-level counts and fetch time stats."""
+    batch = PageMetadataBatch.from_results(_results())
+    
+    assert batch.success_count() == 2
+    assert batch.status_count(404) == 1
+    assert batch.error_count() == 2
+    assert batch.total_fetch_time() == 1.0
+    assert batch.mean_fetch_time() == 0.25
+    assert PageMetadataBatch().mean_fetch_time() == 0.0
+
+
+def test_print_summary_accepts_list_or_batch(capsys):
+    """Test that print_summary reports the same counts for a list, a generator and a batch."""
+    results = _results()
+    
+    print_summary(results, "Async", 2.0)
+    from_list = capsys.readouterr().out
+    print_summary((result for result in results), "Async", 2.0)
+    from_generator = capsys.readouterr().out
+    print_summary(PageMetadataBatch.from_results(results), "Async", 2.0)
+    
+    assert "Total URLs: 4\nSuccessful: 2\nFailed: 2" in from_list
+    assert from_generator == from_list
+    assert capsys.readouterr().out == from_list
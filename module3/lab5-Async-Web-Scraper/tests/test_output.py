@@ -0,0 +1,64 @@
+"""Tests for result output files."""
+
+import gzip
+import pytest
+from src.output import JsonLinesWriter, read_results_jsonl
+from src.scraper import PageMetadata
+
+
+def _results(n):
+    return [
+        PageMetadata(url=f"http://example.com/{i}", title=f"Título {i}", status_code=200, fetch_time=0.1)
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+def test_jsonl_round_trip(tmp_path, suffix):
+    """Test that results are streamed back unchanged, with or without gzip."""
+    path = tmp_path / f"results{suffix}"
+    with JsonLinesWriter(path, fsync_every=3) as writer:
+        assert writer.write_many(_results(10)) == 10
+
+    assert list(read_results_jsonl(path)) == _results(10)
+
+
+def test_jsonl_append_adds_records(tmp_path):
+    """Test that append mode keeps earlier records, including across gzip members."""
+    path = tmp_path / "results.jsonl.gz"
+    with JsonLinesWriter(path) as writer:
+        writer.write_many(_results(2))
+    with JsonLinesWriter(path, append=True) as writer:
+        writer.write(PageMetadata(url="http://example.com/extra"))
+
+    assert [r.url for r in read_results_jsonl(path)][-1] == "http://example.com/extra"
+    assert len(list(read_results_jsonl(path))) == 3
+
+
+def test_jsonl_reader_stops_at_truncated_record(tmp_path):
+    """Test that a partial last line left by a crash is skipped unless strict."""
+    path = tmp_path / "results.jsonl"
+    with JsonLinesWriter(path) as writer:
+        writer.write_many(_results(3))
+    with open(path, "ab") as f:
+        f.write(b'{"url": "http://exa')
+
+    assert len(list(read_results_jsonl(path))) == 3
+    with pytest.raises(ValueError):
+        list(read_results_jsonl(path, strict=True))
+
+
+def test_jsonl_gzip_synced_records_survive_crash(tmp_path):
+    """Test that records synced before an unclean exit can be read back."""
+    path = tmp_path / "results.jsonl.gz"
+    writer = JsonLinesWriter(path, fsync_every=5)
+    writer.write_many(_results(5))
+    # Simulate a crash: the gzip trailer is never written
+    data = path.read_bytes()
+    crashed = tmp_path / "crashed.jsonl.gz"
+    crashed.write_bytes(data)
+    writer.close()
+
+    with pytest.raises(EOFError):
+        gzip.decompress(data)
+    assert list(read_results_jsonl(crashed)) == _results(5)
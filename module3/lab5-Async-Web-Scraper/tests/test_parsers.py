@@ -0,0 +1,75 @@
+"""Tests for the pluggable HTML parser backends."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from src import parsers
+from src.parsers import (
+    HeadCollector,
+    available_backends,
+    extract_metadata_from_html,
+    get_parser_backend,
+    set_parser_backend
+)
+from src.parser_benchmark import benchmark_backends, load_fixtures
+from src.scrapers.parse_pool import ParsePool
+
+FIXTURES = load_fixtures()
+
+
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("fixture", sorted(FIXTURES))
+def test_backend_matches_reference(backend, fixture):
+    """Test that every backend extracts the same metadata as BeautifulSoup."""
+    html = FIXTURES[fixture]
+    
+    expected = extract_metadata_from_html(html, fixture, backend="bs4")
+    result = extract_metadata_from_html(html, fixture, backend=backend)
+    
+    assert (result.title, result.description) == (expected.title, expected.description)
+
+
+def test_set_parser_backend(monkeypatch):
+    """Test switching the default backend and rejecting unknown ones."""
+    monkeypatch.setattr(parsers, "_active_backend", "bs4")
+    
+    set_parser_backend("regex")
+    assert get_parser_backend() == "regex"
+    
+    with pytest.raises(ValueError):
+        set_parser_backend("does-not-exist")
+    with pytest.raises(ValueError):
+        extract_metadata_from_html("<html></html>", "http://example.com", backend="nope")
+
+
+def test_benchmark_backends_reports_every_backend():
+    """Test that the micro-benchmark covers all backends and flags none as wrong."""
+    results = benchmark_backends(FIXTURES, repeat=1)
+    
+    assert {r.backend for r in results} == set(available_backends())
+    assert all(r.correct for r in results)
+
+
+def test_head_collector_detects_split_head_end():
+    """Test that </head> is found even when split across chunks."""
+    collector = HeadCollector()
+    
+    assert not collector.feed(b"<html><head><title>Split</title></he")
+    assert collector.feed(b"ad><body>" + b"x" * 1000)
+    assert "<title>Split</title>" in collector.text()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_parse_pool_parses_off_loop(executor_cls):
+    """Test that ParsePool returns the same metadata as inline parsing."""
+    html = FIXTURES["basic.html"]
+    
+    with executor_cls(max_workers=1) as executor:
+        pool = ParsePool(executor=executor, max_in_flight=2, backend="events")
+        results = await asyncio.gather(
+            *(pool.parse(html, f"http://example.com/{i}") for i in range(4))
+        )
+    
+    assert [r.url for r in results] == [f"http://example.com/{i}" for i in range(4)]
+    assert all(r.title == "Basic Page" for r in results)
@@ -0,0 +1,80 @@
+"""Tests for live crawl progress reporting."""
+
+import urllib.error
+import urllib.request
+import pytest
+from src.bench import SiteConfig, SyntheticServer
+from src.metrics import MetricsCollector
+from src.progress import CrawlProgress
+from src.scrapers import scrape_async, scrape_sequential, scrape_threaded
+
+
+@pytest.fixture(scope="module")
+def server():
+    config = SiteConfig(latency=0, page_size=500, error_rate=0.25, error_status=404)
+    with SyntheticServer(config) as synthetic:
+        yield synthetic
+
+
+def test_progress_counts_queue_and_retries():
+    """Test queue depth, in-flight count, error rate and ETA bookkeeping."""
+    progress = CrawlProgress(total=10)
+    progress.enqueue(4)
+    progress.start_request()
+    progress.start_request()
+    progress.requeue()
+    progress.finish_request(error=True)
+    
+    s = progress.snapshot()
+    
+    assert (s["completed"], s["in_flight"], s["queued"]) == (1, 0, 3)
+    assert s["error_rate"] == 1.0
+    assert s["eta"] is not None and s["eta"] > 0
+    assert "1/10 URLs" in progress.report()
+
+
+def test_metrics_endpoint_serves_prometheus_text():
+    """Test the /metrics endpoint, including attached request metrics."""
+    metrics = MetricsCollector()
+    metrics.record(0.05, status=200, nbytes=100)
+    progress = CrawlProgress(total=3, metrics=metrics)
+    progress.enqueue(3)
+    progress.start_request()
+    progress.finish_request()
+    
+    port = progress.serve_metrics(0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            content_type = response.headers["Content-Type"]
+            text = response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/other")
+    finally:
+        progress.close()
+    
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "# TYPE scraper_urls_completed_total counter" in text
+    assert "scraper_urls_completed_total 1\n" in text
+    assert "scraper_queue_depth 2\n" in text
+    assert 'scraper_responses_total{status="200"} 1\n' in text
+    assert "scraper_request_latency_seconds_count 1\n" in text
+
+
+@pytest.mark.asyncio
+async def test_all_engines_report_progress(server):
+    """Test that each engine leaves the tracker complete and idle."""
+    urls = server.urls(12)
+    runs = {
+        "sequential": lambda p: scrape_sequential(urls, progress=p),
+        "threaded": lambda p: scrape_threaded(urls, max_workers=4, progress=p),
+    }
+    trackers = {name: CrawlProgress() for name in [*runs, "async"]}
+    for name, run in runs.items():
+        run(trackers[name])
+    results = await scrape_async(urls, max_concurrent=4, progress=trackers["async"])
+    
+    expected_errors = sum(1 for r in results if r.error)
+    for progress in trackers.values():
+        s = progress.snapshot()
+        assert (s["completed"], s["total"], s["in_flight"], s["queued"]) == (12, 12, 0, 0)
+        assert s["errors"] == expected_errors > 0
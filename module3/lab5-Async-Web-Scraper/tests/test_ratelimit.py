@@ -0,0 +1,95 @@
+"""Tests for per-host rate limiting."""
+
+import pickle
+import time
+from unittest.mock import patch
+import pytest
+from src.models import PageMetadata
+from src.scrapers.ratelimit import HostRateLimiter, TokenBucket
+from src.scrapers.scheduler import HostScheduler
+from src.scrapers.threaded import scrape_threaded
+
+
+def test_token_bucket_burst_then_rate():
+    """Test that a full bucket allows a burst and then refills at ``rate``."""
+    bucket = TokenBucket(rate=2.0, burst=2)
+    now = bucket.updated
+    
+    assert bucket.try_acquire(now) == 0.0
+    assert bucket.try_acquire(now) == 0.0
+    assert bucket.try_acquire(now) == pytest.approx(0.5)
+    assert bucket.try_acquire(now + 0.5) == 0.0
+
+
+def test_limiter_keeps_hosts_independent():
+    """Test that exhausting one host does not affect another."""
+    limiter = HostRateLimiter(rate=1.0, burst=1, host_rates={"fast.com": (100.0, 5)})
+    
+    assert limiter.try_acquire("a.com") == 0.0
+    assert limiter.try_acquire("a.com") > 0.5
+    assert limiter.try_acquire("b.com") == 0.0
+    assert all(limiter.try_acquire("fast.com") == 0.0 for _ in range(5))
+
+
+def test_apply_robots_crawl_delay():
+    """Test that robots.txt Crawl-delay only ever tightens a host's rate."""
+    limiter = HostRateLimiter(rate=5.0)
+    robots = "User-agent: *\nCrawl-delay: 2\nDisallow: /private\n"
+    
+    assert limiter.apply_robots("slow.com", robots) == 2.0
+    assert limiter.rate_for("slow.com") == (0.5, 1)
+    
+    limiter.apply_robots("fast.com", "User-agent: *\nCrawl-delay: 0.01\n")
+    assert limiter.rate_for("fast.com") == (5.0, limiter.burst)
+
+
+def test_limiter_pickles_without_state():
+    """Test that a limiter can be sent to worker processes."""
+    limiter = HostRateLimiter(rate=3.0, host_rates={"a.com": (1.0, 1)})
+    limiter.try_acquire("a.com")
+    
+    copy = pickle.loads(pickle.dumps(limiter))
+    
+    assert copy.rate_for("a.com") == (1.0, 1)
+    assert copy.try_acquire("a.com") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_parks_rate_limited_host():
+    """Test that a rate-limited host is spaced out while other hosts flow."""
+    limiter = HostRateLimiter(rate=1000.0, burst=10, host_rates={"slow.com": (20.0, 1)})
+    scheduler = HostScheduler(per_host_limit=10, rate_limiter=limiter)
+    for i in range(3):
+        await scheduler.put((f"s{i}", f"http://slow.com/{i}"))
+        await scheduler.put((f"f{i}", f"http://fast.com/{i}"))
+    scheduler.close()
+    
+    start = time.monotonic()
+    served = []
+    while (item := await scheduler.get()) is not None:
+        served.append((item[0], time.monotonic() - start))
+        scheduler.done(item)
+    
+    fast_times = [t for key, t in served if key.startswith("f")]
+    slow_times = [t for key, t in served if key.startswith("s")]
+    assert max(fast_times) < 0.02
+    assert slow_times[2] >= 0.09
+
+
+def test_threaded_rate_limit_does_not_take_workers():
+    """Test that URLs for a rate-limited host wait outside the pool while other hosts flow."""
+    limiter = HostRateLimiter(rate=1000.0, burst=10, host_rates={"slow.com": (10.0, 1)})
+    urls = [f"http://slow.com/{i}" for i in range(4)] + [f"http://fast.com/{i}" for i in range(4)]
+    start = time.monotonic()
+    finished = {}
+
+    def fetch(url, **kwargs):
+        finished[url] = time.monotonic() - start
+        return PageMetadata(url=url, status_code=200)
+
+    with patch('src.scrapers.threaded.fetch_url_sync', side_effect=fetch):
+        results = scrape_threaded(urls, max_workers=2, rate_limiter=limiter)
+
+    assert [r.url for r in results] == urls
+    assert max(finished[url] for url in urls[4:]) < 0.05
+    assert finished["http://slow.com/3"] >= 0.25
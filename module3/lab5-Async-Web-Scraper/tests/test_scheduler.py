@@ -0,0 +1,69 @@
+"""Tests for the host-aware scheduler."""
+
+import asyncio
+import pytest
+from src.scrapers.scheduler import HostScheduler, host_of
+
+
+def test_host_of():
+    """Test host extraction is case-insensitive and ignores ports."""
+    assert host_of("https://Example.COM:8443/path") == "example.com"
+    assert host_of("not a url") == ""
+
+
+@pytest.mark.asyncio
+async def test_scheduler_round_robins_hosts():
+    """Test that a host with many URLs does not monopolise the queue."""
+    scheduler = HostScheduler(per_host_limit=10, max_pending=100)
+    for i in range(3):
+        await scheduler.put((i, f"http://a.com/{i}"))
+    await scheduler.put((3, "http://b.com/"))
+    scheduler.close()
+    
+    first = await scheduler.get()
+    second = await scheduler.get()
+    
+    assert {host_of(first[1]), host_of(second[1])} == {"a.com", "b.com"}
+
+
+@pytest.mark.asyncio
+async def test_scheduler_enforces_per_host_limit():
+    """Test that in-flight requests per host never exceed the limit."""
+    scheduler = HostScheduler(per_host_limit=2, max_pending=100)
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    
+    async def producer():
+        for i in range(20):
+            await scheduler.put((i, f"http://host{i % 2}.com/{i}"))
+        scheduler.close()
+    
+    async def worker():
+        while (item := await scheduler.get()) is not None:
+            host = host_of(item[1])
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.001)
+            in_flight[host] -= 1
+            scheduler.done(item)
+    
+    await asyncio.gather(producer(), *(worker() for _ in range(8)))
+    
+    assert peak == {"host0.com": 2, "host1.com": 2}
+    assert scheduler.pending == 0 and scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_pending_items():
+    """Test that put() blocks once max_pending items are queued."""
+    scheduler = HostScheduler(per_host_limit=1, max_pending=2)
+    await scheduler.put((0, "http://a.com/0"))
+    await scheduler.put((1, "http://a.com/1"))
+    
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(scheduler.put((2, "http://a.com/2")), timeout=0.05)
+    
+    item = await scheduler.get()
+    await asyncio.wait_for(scheduler.put((2, "http://a.com/2")), timeout=0.05)
+    assert scheduler.pending == 2
+    scheduler.done(item)
@@ -1,13 +1,25 @@
 """Tests for scraper functionality."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
+from src import parsers
+from src.exceptions import RetryableHTTPError
+from src.parsers import StreamingHeadExtractor
+from src.scrapers.multiprocess import shard_urls
+from src.scrapers.threaded import ThreadSessions
+from src.utils import RetryPolicy
 from src.scraper import (
     PageMetadata,
     extract_metadata_from_html,
     fetch_url_sync,
     scrape_sequential,
-    scrape_async
+    scrape_threaded,
+    scrape_threaded_iter,
+    scrape_async,
+    scrape_async_iter
 )
 
 
@@ -50,6 +62,37 @@ def test_extract_metadata_with_og_description():
     assert metadata.description == "Open Graph description"
 
 
+def test_streaming_head_extractor_stops_at_head():
+    """Test that the streaming extractor stops once </head> is seen."""
+    html = (
+        '<html><head><title>Caf&eacute; Page</title>'
+        '<meta property="og:description" content="OG only">'
+        '</head><body>' + 'x' * 100000 + '</body></html>'
+    ).encode('utf-8')
+    chunks = [html[i:i + 7] for i in range(0, len(html), 7)]
+    
+    extractor = StreamingHeadExtractor()
+    consumed = 0
+    for chunk in chunks:
+        consumed += 1
+        if extractor.feed(chunk):
+            break
+    metadata = extractor.result("http://example.com")
+    
+    assert consumed < len(chunks) // 10
+    assert metadata.title == "Café Page"
+    assert metadata.description == "OG only"
+
+
+def test_streaming_head_extractor_respects_byte_limit():
+    """Test that the extractor gives up after max_bytes without a head end."""
+    extractor = StreamingHeadExtractor(max_bytes=1024)
+    
+    assert not extractor.feed(b"<html><head><title>Long</title>")
+    assert extractor.feed(b"<!-- " + b"x" * 2048)
+    assert extractor.result("http://example.com").title == "Long"
+
+
 def test_page_metadata_dataclass():
     """Test PageMetadata dataclass."""
     metadata = PageMetadata(
@@ -71,7 +114,10 @@ def test_fetch_url_sync_success(mock_get):
     """Test synchronous URL fetching with success."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.text = "<html><head><title>Test</title></head></html>"
+    mock_response.headers = {"Content-Type": "text/html"}
+    mock_response.iter_content.return_value = [
+        b"<html><head><ti", b"tle>Test</title></head></html>"
+    ]
     mock_get.return_value = mock_response
     
     result = fetch_url_sync("http://example.com")
@@ -80,6 +126,27 @@ def test_fetch_url_sync_success(mock_get):
     assert result.status_code == 200
     assert result.title == "Test"
     assert result.error is None
+    mock_response.close.assert_called_once()
+
+
+@patch('requests.get')
+def test_fetch_url_sync_head_uses_selected_backend(mock_get, monkeypatch):
+    """Test that a selected parser backend also parses head-only fetches."""
+    monkeypatch.setattr(parsers, "_active_backend", "regex")
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {"Content-Type": "text/html"}
+    mock_response.iter_content.return_value = [
+        b"<html><head><title>Test</title></head><body>" + b"x" * 1000
+    ]
+    mock_get.return_value = mock_response
+    
+    with patch.object(parsers, "_extract_with_regex", wraps=parsers._extract_with_regex) as extract:
+        monkeypatch.setitem(parsers.PARSER_BACKENDS, "regex", extract)
+        result = fetch_url_sync("http://example.com")
+    
+    extract.assert_called_once()
+    assert result.title == "Test"
 
 
 @patch('requests.get')
@@ -109,6 +176,62 @@ def test_scrape_sequential():
         assert mock_fetch.call_count == 2
 
 
+def test_fetch_url_sync_uses_session():
+    """Test that a given session is used instead of a one-off connection."""
+    session = Mock()
+    session.get.return_value.status_code = 404
+    
+    with patch('requests.get') as mock_get:
+        result = fetch_url_sync("http://example.com", session=session)
+    
+    session.get.assert_called_once()
+    mock_get.assert_not_called()
+    assert result.error == "HTTP 404"
+
+
+def test_thread_sessions_one_per_thread():
+    """Test that each worker thread reuses its own session."""
+    barrier = threading.Barrier(3)
+    
+    def session_ids(sessions):
+        first = sessions.get()
+        barrier.wait()
+        assert sessions.get() is first
+        return id(first)
+    
+    with ThreadSessions(pool_size=3) as sessions, ThreadPoolExecutor(3) as executor:
+        ids = list(executor.map(lambda _: session_ids(sessions), range(3)))
+    
+    assert len(set(ids)) == 3
+
+
+def test_scrape_threaded_passes_thread_sessions():
+    """Test that threaded scraping keeps results in order and passes sessions."""
+    urls = [f"http://example{i}.com" for i in range(6)]
+    
+    with patch('src.scrapers.threaded.fetch_url_sync',
+               side_effect=lambda url, **kwargs: PageMetadata(url=url, status_code=200)) as mock_fetch:
+        results = scrape_threaded(urls, max_workers=3)
+    
+    assert [r.url for r in results] == urls
+    assert all(call.kwargs["session"] is not None for call in mock_fetch.call_args_list)
+
+
+def test_scrape_threaded_iter_yields_in_completion_order():
+    """Test that a slow URL does not hold back later results."""
+    def fetch(url, **kwargs):
+        if url.endswith("slow.com"):
+            time.sleep(0.2)
+        return PageMetadata(url=url, status_code=200)
+    
+    urls = ["http://slow.com"] + [f"http://fast{i}.com" for i in range(5)]
+    with patch('src.scrapers.threaded.fetch_url_sync', side_effect=fetch):
+        results = list(scrape_threaded_iter(iter(urls), max_workers=3))
+    
+    assert {r.url for r in results} == set(urls)
+    assert results[-1].url == "http://slow.com"
+
+
 @pytest.mark.asyncio
 async def test_scrape_async():
     """Test async scraping."""
@@ -127,3 +250,73 @@ async def test_scrape_async():
         results = await scrape_async(urls, max_concurrent=2)
         
         assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_iter_streams_all_results():
+    """Test that the async iterator yields one result per URL from a lazy source."""
+    urls = (f"http://example{i}.com" for i in range(25))
+    
+    async def fake_fetch(session, url, **kwargs):
+        return PageMetadata(url=url, status_code=200)
+    
+    with patch('src.scrapers.async_scraper.aiohttp.ClientSession'), \
+            patch('src.scrapers.async_scraper._fetch_page', side_effect=fake_fetch):
+        results = [r async for r in scrape_async_iter(urls, max_concurrent=4, queue_size=2)]
+    
+    assert len(results) == 25
+    assert all(r.status_code == 200 for r in results)
+    assert {r.url for r in results} == {f"http://example{i}.com" for i in range(25)}
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_requeues_retryable_failures():
+    """Test that retryable failures go back on the scheduler and then succeed."""
+    calls = {}
+    
+    async def flaky_fetch(session, url, **kwargs):
+        calls[url] = calls.get(url, 0) + 1
+        if calls[url] == 1:
+            raise RetryableHTTPError(503, retry_after=0.0)
+        return PageMetadata(url=url, status_code=200)
+    
+    policy = RetryPolicy(max_attempts=2, base_delay=0.0, retry_on=(RetryableHTTPError,))
+    urls = ["http://a.com/1", "http://a.com/2", "http://b.com/1"]
+    
+    with patch('src.scrapers.async_scraper.aiohttp.ClientSession'), \
+            patch('src.scrapers.async_scraper._fetch_page', side_effect=flaky_fetch):
+        results = await scrape_async(urls, max_concurrent=2, retry_policy=policy)
+    
+    assert [r.status_code for r in results] == [200, 200, 200]
+    assert calls == {url: 2 for url in urls}
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_gives_up_on_fatal_errors():
+    """Test that non-retryable failures are reported without retrying."""
+    fetch = AsyncMock(side_effect=RetryableHTTPError(503))
+    policy = RetryPolicy(max_attempts=3, base_delay=0.0, retry_on=(ConnectionError,))
+    
+    with patch('src.scrapers.async_scraper.aiohttp.ClientSession'), \
+            patch('src.scrapers.async_scraper._fetch_page', fetch):
+        results = await scrape_async(["http://a.com/"], retry_policy=policy)
+    
+    assert fetch.call_count == 1
+    assert results[0].status_code == 503
+    assert results[0].error == "HTTP 503"
+
+
+def test_shard_urls_keeps_hosts_together():
+    """Test that multi-process sharding covers every URL once, grouped by host."""
+    urls = [f"http://host{i % 5}.com/page{i}" for i in range(40)]
+    
+    shards = shard_urls(urls, 3)
+    
+    assert sorted(index for shard in shards for index, _ in shard) == list(range(40))
+    for shard in shards:
+        for index, url in shard:
+            assert urls[index] == url
+    hosts_per_shard = [{url.split("/")[2] for _, url in shard} for shard in shards]
+    for i, hosts in enumerate(hosts_per_shard):
+        for other in hosts_per_shard[i + 1:]:
+            assert not hosts & other
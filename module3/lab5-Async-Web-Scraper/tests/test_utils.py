@@ -1,8 +1,22 @@
 """Tests for utility functions and decorators."""
 
 import asyncio
+import logging
 import pytest
-from src.utils import retry, log_execution, async_response_generator, async_batch_processor
+from src.exceptions import RetryableHTTPError
+from src.utils import (
+    RetryBudget,
+    RetryPolicy,
+    retry,
+    log_execution,
+    parse_retry_after,
+    abatch,
+    amap,
+    async_response_generator,
+    async_batch_processor,
+    fan_in,
+    fan_out
+)
 
 
 @pytest.mark.asyncio
@@ -56,6 +70,60 @@ async def test_retry_decorator_max_attempts():
     assert call_count == 3
 
 
+def test_retry_policy_exponential_backoff_is_capped():
+    """Test that backoff doubles per attempt and never exceeds max_delay."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.0)
+    
+    assert [policy.backoff(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_retry_policy_jitter_stays_in_range():
+    """Test that jitter only ever shortens the delay, by at most the jitter fraction."""
+    policy = RetryPolicy(base_delay=2.0, jitter=0.5)
+    
+    delays = [policy.backoff(1) for _ in range(100)]
+    
+    assert all(1.0 <= d <= 2.0 for d in delays)
+
+
+def test_retry_policy_classifies_errors():
+    """Test retryable vs fatal errors and the attempt limit."""
+    policy = RetryPolicy(
+        max_attempts=3,
+        retry_on=(ConnectionError, RetryableHTTPError),
+        fatal_on=(ConnectionRefusedError,)
+    )
+    
+    assert policy.next_delay(1, ConnectionResetError()) is not None
+    assert policy.next_delay(1, ConnectionRefusedError()) is None
+    assert policy.next_delay(1, ValueError()) is None
+    assert policy.next_delay(3, ConnectionResetError()) is None
+
+
+def test_retry_policy_honors_retry_after():
+    """Test that a Retry-After hint longer than the backoff is respected."""
+    policy = RetryPolicy(base_delay=0.1, max_delay=60.0)
+    
+    assert policy.next_delay(1, RetryableHTTPError(429, retry_after=12.0)) == 12.0
+
+
+def test_retry_budget_limits_retries():
+    """Test that the budget stops retries once exhausted."""
+    policy = RetryPolicy(budget=RetryBudget(ratio=0.0, min_retries=2))
+    
+    delays = [policy.next_delay(1, RuntimeError()) for _ in range(4)]
+    
+    assert [d is not None for d in delays] == [True, True, False, False]
+
+
+def test_parse_retry_after():
+    """Test parsing delta-seconds and HTTP-date Retry-After values."""
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
 @pytest.mark.asyncio
 async def test_log_execution_decorator():
     """Test that log_execution decorator works correctly."""
@@ -69,6 +137,21 @@ async def test_log_execution_decorator():
     assert result == "completed"
 
 
+@pytest.mark.asyncio
+async def test_log_execution_sampling(caplog):
+    """Test that log_execution only logs when sampled and is a no-op at rate 0."""
+    async def sample_function():
+        return "completed"
+    
+    assert log_execution(sample_rate=0)(sample_function) is sample_function
+    
+    logged = log_execution(sample_rate=1.0, level=logging.INFO)(sample_function)
+    with caplog.at_level(logging.INFO, logger="src.utils"):
+        assert await logged() == "completed"
+    
+    assert any("Completed sample_function" in r.message for r in caplog.records)
+
+
 @pytest.mark.asyncio
 async def test_async_response_generator():
     """Test async response generator."""
@@ -99,3 +182,108 @@ async def test_async_batch_processor():
     assert batches[1] == [3, 4, 5]
     assert batches[2] == [6, 7, 8]
     assert batches[3] == [9]
+
+
+@pytest.mark.asyncio
+async def test_amap_bounds_concurrency():
+    """Test that amap never runs more than `concurrency` calls at once."""
+    running = peak = 0
+    
+    async def work(n):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (n % 3))
+        running -= 1
+        return n * 2
+    
+    ordered = [r async for r in amap(work, range(20), concurrency=4, ordered=True)]
+    unordered = [r async for r in amap(work, range(20), concurrency=4)]
+    
+    assert ordered == [n * 2 for n in range(20)]
+    assert sorted(unordered) == ordered
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_amap_pulls_lazily_and_propagates_errors():
+    """Test that amap only pulls inputs as slots free up and re-raises failures."""
+    pulled = 0
+    
+    def source():
+        nonlocal pulled
+        for n in range(1000):
+            pulled += 1
+            yield n
+    
+    async def work(n):
+        if n == 5:
+            raise ValueError("bad item")
+        return n
+    
+    with pytest.raises(ValueError):
+        async for _ in amap(work, source(), concurrency=3, ordered=True):
+            pass
+    
+    assert pulled < 10
+
+
+@pytest.mark.asyncio
+async def test_abatch_flushes_on_timeout():
+    """Test that a partial batch is flushed when the source goes quiet."""
+    async def slow_source():
+        for n in range(3):
+            yield n
+        await asyncio.sleep(0.2)
+        yield 3
+    
+    batches = [b async for b in abatch(slow_source(), size=10, timeout=0.05)]
+    
+    assert batches == [[0, 1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_fan_in_merges_all_sources():
+    """Test that fan_in yields every item from every source."""
+    async def numbers(start):
+        for n in range(start, start + 5):
+            await asyncio.sleep(0)
+            yield n
+    
+    merged = [n async for n in fan_in(numbers(0), numbers(100), range(200, 203), buffer=2)]
+    
+    assert sorted(merged) == [*range(5), *range(100, 105), *range(200, 203)]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_broadcasts_with_early_exit():
+    """Test that every consumer sees the stream and one stopping early does not stall the rest."""
+    async def total(stream):
+        return sum([n async for n in stream])
+    
+    async def first_two(stream):
+        taken = []
+        async for n in stream:
+            taken.append(n)
+            if len(taken) == 2:
+                break
+        return taken
+    
+    results = await asyncio.wait_for(fan_out(range(100), total, first_two, buffer=1), timeout=5)
+    
+    assert results == [sum(range(100)), [0, 1]]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_raises_consumer_error():
+    """Test that a failing consumer's own exception reaches the caller, not an ExceptionGroup."""
+    async def drain(stream):
+        return [n async for n in stream]
+    
+    async def broken(stream):
+        async for n in stream:
+            if n == 3:
+                raise ValueError("bad item")
+    
+    with pytest.raises(ValueError, match="bad item"):
+        await asyncio.wait_for(fan_out(range(100), drain, broken, buffer=1), timeout=5)